@@ -13,19 +13,34 @@ Usage:
 
 import sys
 import argparse
+import asyncio
+import functools
 import logging
+import os
+import threading
 import requests # type: ignore
-import time
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import List, Optional
 
 from src.parser.text_extractor import Filing8KTextExtractor
+from src.llm import get_shared_client
 from src.parser.event_classifier import EventClassifier, PromptStrategy
+from src.scraper.edgar_scraper import create_session
+from src.scraper.rate_limit import SEC_RATE_LIMITER
 
 # SEC access configuration
 HEADERS = {"User-Agent": "about@plux.ai"}
 
+# Shared extractor, reused across calls (C lexbor parser, streaming lxml without selectolax)
+_EXTRACTOR = Filing8KTextExtractor(backend="lexbor")
+
+# Keep-alive session reused for every SEC request
+_SESSION = create_session(HEADERS)
+
+# Classifier created on first use and shared across calls
+_CLASSIFIER: Optional[EventClassifier] = None
+_CLASSIFIER_LOCK = threading.Lock()
+
 
 def setup_logging(verbose: bool = False):
     """Setup logging configuration."""
@@ -37,13 +52,48 @@ def setup_logging(verbose: bool = False):
     )
 
 
+def _get_classifier() -> EventClassifier:
+    """Return the shared EventClassifier, creating it on first use."""
+    global _CLASSIFIER
+    if _CLASSIFIER is None:
+        with _CLASSIFIER_LOCK:
+            if _CLASSIFIER is None:
+                llm_client = get_shared_client("config/llm_config.json")
+                # --max-context is the only cap on the text sent to the LLM
+                _CLASSIFIER = EventClassifier(
+                    llm_client=llm_client,
+                    result_cache=llm_client.create_result_cache(),
+                    max_input_chars=None,
+                )
+    return _CLASSIFIER
+
+
 def is_url(input_string: str) -> bool:
-    """Check if input string is a URL."""
-    try:
-        result = urlparse(input_string)
-        return all([result.scheme, result.netloc])
-    except Exception:
-        return False
+    """Check if input string is an HTTP(S) URL."""
+    return isinstance(input_string, str) and input_string[:8].lower().startswith(
+        ("http://", "https://")
+    )
+
+
+@functools.lru_cache(maxsize=128)
+def _extract_file_text(path: str, mtime_ns: int) -> str:
+    return _EXTRACTOR.extract_from_html(Path(path).read_bytes())
+
+
+def extract_file_text(path: str) -> str:
+    """
+    Read a local 8-K HTML file and extract its text.
+
+    Results are cached by path and modification time, so classifying the
+    same unchanged file again (e.g. with another strategy) skips the parse.
+
+    Args:
+        path: Path to the 8-K HTML file
+
+    Returns:
+        Clean extracted text
+    """
+    return _extract_file_text(os.path.abspath(path), os.stat(path).st_mtime_ns)
 
 
 def download_filing_content(url: str) -> str:
@@ -59,17 +109,41 @@ def download_filing_content(url: str) -> str:
     Raises:
         requests.RequestException: If download fails
     """
-    # Add a small delay to be respectful to SEC servers
-    time.sleep(1)
-
-    response = requests.get(url, headers=HEADERS, timeout=30)
+    SEC_RATE_LIMITER.acquire()
+    response = _SESSION.get(url, timeout=30)
     response.raise_for_status()
 
     return response.text
 
 
+def download_filing_text(url: str) -> str:
+    """
+    Stream an 8-K filing from URL and extract its text.
+
+    Response chunks are handed to the extractor as they arrive. Its lexbor
+    backend buffers them into one bytes object before parsing; only the lxml
+    fallback (without selectolax) parses them incrementally.
+
+    Args:
+        url: SEC EDGAR URL to download
+
+    Returns:
+        Clean extracted text
+
+    Raises:
+        requests.RequestException: If download fails
+    """
+    SEC_RATE_LIMITER.acquire()
+    with _SESSION.get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        return _EXTRACTOR.extract_from_stream(response.iter_content(chunk_size=65536))
+
+
 def classify_8k_filing(
-    input_source: str, strategy: PromptStrategy = PromptStrategy.DETAILED, verbose: bool = False
+    input_source: str,
+    strategy: PromptStrategy = PromptStrategy.DETAILED,
+    verbose: bool = False,
+    max_context: int = 4096,
 ) -> Optional[dict]:
     """
     Complete pipeline: extract text and classify 8-K filing.
@@ -78,6 +152,9 @@ def classify_8k_filing(
         input_source: Path to 8-K HTML file or URL to SEC filing
         strategy: Prompt strategy to use
         verbose: Enable verbose logging
+        max_context: Maximum characters of filing text sent to the LLM
+            (Item sections are kept first; 0 sends the full text, with no
+            further cap applied by the classifier)
 
     Returns:
         Dictionary with results or None if failed
@@ -86,102 +163,218 @@ def classify_8k_filing(
     logger = logging.getLogger(__name__)
 
     try:
-        # Step 1: Get HTML content (from file or URL)
+        # Steps 1-2: Get HTML content (from file or URL) and extract text
         if is_url(input_source):
             logger.info(f"Downloading content from: {input_source}")
-            html_content = download_filing_content(input_source)
             source_type = "URL"
+            logger.info(f"Extracting text from {source_type.lower()}")
+            extracted_text = download_filing_text(input_source)
         else:
             logger.info(f"Reading file: {input_source}")
-            with open(input_source, "r", encoding="utf-8") as f:
-                html_content = f.read()
             source_type = "File"
+            logger.info(f"Extracting text from {source_type.lower()}")
+            extracted_text = extract_file_text(input_source)
 
-        # Step 2: Extract text from HTML
-        logger.info(f"Extracting text from {source_type.lower()}")
-        extractor = Filing8KTextExtractor()
-        extracted_text = extractor.extract_from_html(html_content)
+        # Steps 3-4: Classify and prepare results
+        return _classify_text(
+            input_source, source_type, extracted_text, strategy, verbose, max_context
+        )
 
-        if not extracted_text:
-            logger.error("No text extracted from filing")
-            return None
+    except Exception as e:
+        _log_processing_error(e, input_source, verbose)
+        return None
 
-        logger.info(f"Extracted {len(extracted_text)} characters")
-        if verbose:
-            logger.debug(f"Sample text: {extracted_text[:200]}...")
-
-        # Step 3: Classify the event
-        logger.info(f"Classifying event using {strategy.value} strategy")
-        classifier = EventClassifier()
-
-        result = classifier.classify(extracted_text, strategy=strategy)
-
-        if not result:
-            logger.error("Classification failed")
-            return None
-
-        # Step 4: Prepare results
-        logger.info("Classification successful!")
-
-        return {
-            "input_source": input_source,
-            "source_type": source_type,
-            "strategy": strategy.value,
-            "text_length": len(extracted_text),
-            "extracted_text": extracted_text,
-            "classification": {
-                "event_type": result.event_type,
-                "relevant": result.relevant,
-                "confidence": result.confidence,
-                "reasoning": result.reasoning,
-                "raw_response": result.raw_response,
-            },
-        }
-
-    except FileNotFoundError:
-        logger.error(f"File not found: {input_source}")
+
+async def classify_8k_filing_async(
+    input_source: str,
+    strategy: PromptStrategy = PromptStrategy.DETAILED,
+    verbose: bool = False,
+    max_context: int = 4096,
+) -> Optional[dict]:
+    """
+    Async variant of ``classify_8k_filing`` for use inside an event loop.
+
+    File reads, downloads, extraction and classification run on the default
+    executor, so several filings can be processed concurrently without
+    blocking the loop. Logging is left to the caller to configure.
+
+    Args:
+        input_source: Path to 8-K HTML file or URL to SEC filing
+        strategy: Prompt strategy to use
+        verbose: Enable verbose logging
+        max_context: Maximum characters of filing text sent to the LLM
+            (0 sends the full text)
+
+    Returns:
+        Dictionary with results or None if failed
+    """
+    logger = logging.getLogger(__name__)
+    loop = asyncio.get_running_loop()
+
+    try:
+        if is_url(input_source):
+            logger.info(f"Downloading content from: {input_source}")
+            source_type = "URL"
+            extracted_text = await loop.run_in_executor(None, download_filing_text, input_source)
+        else:
+            logger.info(f"Reading file: {input_source}")
+            source_type = "File"
+            extracted_text = await loop.run_in_executor(None, extract_file_text, input_source)
+
+        return await loop.run_in_executor(
+            None,
+            _classify_text,
+            input_source,
+            source_type,
+            extracted_text,
+            strategy,
+            verbose,
+            max_context,
+        )
+
+    except Exception as e:
+        _log_processing_error(e, input_source, verbose)
         return None
-    except requests.RequestException as e:
-        logger.error(f"Error downloading from URL: {e}")
-        if "403" in str(e) or "Forbidden" in str(e):
+
+
+async def classify_8k_filings_batch(
+    input_sources: List[str],
+    strategy: PromptStrategy = PromptStrategy.DETAILED,
+    verbose: bool = False,
+    max_context: int = 4096,
+) -> List[Optional[dict]]:
+    """
+    Classify several 8-K filings concurrently.
+
+    Each source goes through ``classify_8k_filing_async``, so downloads, file
+    reads and extraction of different filings overlap; URL downloads still
+    share the process-wide SEC rate limiter.
+
+    Args:
+        input_sources: Paths to 8-K HTML files or URLs to SEC filings
+        strategy: Prompt strategy to use
+        verbose: Enable verbose logging
+        max_context: Maximum characters of filing text sent to the LLM
+            (0 sends the full text)
+
+    Returns:
+        Result dictionary for each source, in order; None where processing failed
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                classify_8k_filing_async(source, strategy, verbose, max_context)
+                for source in input_sources
+            )
+        )
+    )
+
+
+def _classify_text(
+    input_source: str,
+    source_type: str,
+    extracted_text: str,
+    strategy: PromptStrategy,
+    verbose: bool,
+    max_context: int,
+) -> Optional[dict]:
+    """Classify extracted filing text and build the result dictionary."""
+    logger = logging.getLogger(__name__)
+
+    if not extracted_text:
+        logger.error("No text extracted from filing")
+        return None
+
+    logger.info(f"Extracted {len(extracted_text)} characters")
+    if verbose:
+        logger.debug(f"Sample text: {extracted_text[:200]}...")
+
+    # Step 3: Classify the event
+    logger.info(f"Classifying event using {strategy.value} strategy")
+    classifier = _get_classifier()
+
+    classification_text = extracted_text
+    if max_context:
+        classification_text = _EXTRACTOR.summarize_for_classification(
+            extracted_text, max_chars=max_context
+        )
+        if len(classification_text) < len(extracted_text):
+            logger.info(f"Reduced text to {len(classification_text)} characters for classification")
+
+    result = classifier.classify(classification_text, strategy=strategy)
+
+    if not result:
+        logger.error("Classification failed")
+        return None
+
+    # Step 4: Prepare results
+    logger.info("Classification successful!")
+
+    return {
+        "input_source": input_source,
+        "source_type": source_type,
+        "strategy": strategy.value,
+        "text_length": len(extracted_text),
+        "extracted_text": extracted_text,
+        "classification": {
+            "event_type": result.event_type,
+            "relevant": result.relevant,
+            "confidence": result.confidence,
+            "reasoning": result.reasoning,
+            "raw_response": result.raw_response,
+        },
+    }
+
+
+def _log_processing_error(error: Exception, input_source: str, verbose: bool) -> None:
+    """Log a pipeline failure with hints for common causes."""
+    logger = logging.getLogger(__name__)
+
+    if isinstance(error, FileNotFoundError):
+        logger.error(f"File not found: {input_source}")
+    elif isinstance(error, requests.RequestException):
+        logger.error(f"Error downloading from URL: {error}")
+        if "403" in str(error) or "Forbidden" in str(error):
             logger.info("SEC.gov blocks automated access. Try:")
             logger.info("   1. Download the filing manually and use the local file")
             logger.info("   2. Use a different SEC EDGAR access method")
             logger.info("   3. Check SEC's data access guidelines")
-        return None
-    except Exception as e:
-        logger.error(f"Error during processing: {e}")
+    else:
+        logger.error(f"Error during processing: {error}")
         if verbose:
-            logger.exception("Full traceback:")
-        return None
+            logger.exception("Full traceback:", exc_info=error)
 
 
-def print_results(results: dict):
-    """Print classification results in a nice format."""
-    print("\n" + "=" * 60)
-    print("8-K FILING CLASSIFICATION RESULTS")
-    print("=" * 60)
-
-    print(f"Source: {results['input_source']}")
-    print(f"Strategy: {results['strategy']}")
-    print(f"Text Length: {results['text_length']:,} characters")
-    print()
-
+def _render_results(results: dict) -> str:
+    """Render classification results as the text printed by ``print_results``."""
     classification = results["classification"]
-
-    print("CLASSIFICATION:")
-    print(f"   Event Type: {classification['event_type']}")
-    print(f"   Relevant: {'Yes' if classification['relevant'] else 'No'}")
-    print(f"   Confidence: {classification['confidence']:.1%}")
+    lines = [
+        "\n" + "=" * 60,
+        "8-K FILING CLASSIFICATION RESULTS",
+        "=" * 60,
+        f"Source: {results['input_source']}",
+        f"Strategy: {results['strategy']}",
+        f"Text Length: {results['text_length']:,} characters",
+        "",
+        "CLASSIFICATION:",
+        f"   Event Type: {classification['event_type']}",
+        f"   Relevant: {'Yes' if classification['relevant'] else 'No'}",
+        f"   Confidence: {classification['confidence']:.1%}",
+    ]
 
     if classification["reasoning"]:
-        print("\nREASONING:")
-        print(f"   {classification['reasoning']}")
+        lines.append("\nREASONING:")
+        lines.append(f"   {classification['reasoning']}")
 
-    print("\nRAW LLM RESPONSE:")
-    print(f"   {classification['raw_response']}")
+    lines.append("\nRAW LLM RESPONSE:")
+    lines.append(f"   {classification['raw_response']}")
+    lines.append("\n" + "=" * 60)
+    return "\n".join(lines) + "\n"
 
-    print("\n" + "=" * 60)
+
+def print_results(results: dict):
+    """Print classification results in a nice format."""
+    sys.stdout.write(_render_results(results))
 
 
 def main():
@@ -215,6 +408,16 @@ Examples:
         help="Prompt strategy to use (default: detailed)",
     )
 
+    parser.add_argument(
+        "--max-context",
+        type=int,
+        default=4096,
+        help=(
+            "Maximum characters of filing text sent to the LLM, Item sections first; "
+            "0 sends the full text (default: 4096)"
+        ),
+    )
+
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
 
     parser.add_argument(
@@ -259,7 +462,7 @@ Examples:
     print(f"Strategy: {args.strategy}")
 
     # Run the classification
-    results = classify_8k_filing(args.input_source, strategy, args.verbose)
+    results = classify_8k_filing(args.input_source, strategy, args.verbose, args.max_context)
 
     if results:
         print_results(results)
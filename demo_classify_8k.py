@@ -25,8 +25,8 @@ def main():
 
     try:
         extractor = Filing8KTextExtractor()
-        with open(sample_file, "r", encoding="utf-8") as f:
-            html_content = f.read()
+        # Pass the undecoded bytes; the parser detects the encoding itself
+        html_content = sample_file.read_bytes()
 
         extracted_text = extractor.extract_from_html(html_content)
         print(f"Successfully extracted {len(extracted_text)} characters")
@@ -4,12 +4,14 @@ Scrape and categorize 8-K filings with event classification.
 """
 
 import argparse
+import asyncio
 import logging
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from src.scraper import EdgarScraper, FilingOrganizer
+from src.scraper import EdgarScraper, FilingOrganizer, TokenBucket
+from src.scraper.async_downloader import download_many
 from src.parser.event_classifier import PromptStrategy
 
 
@@ -87,6 +89,8 @@ Examples:
                        help="Skip event classification (download only)")
     parser.add_argument("--strategy", choices=["basic", "detailed", "cot", "few_shot"],
                        default="detailed", help="Classification prompt strategy")
+    parser.add_argument("--workers", type=int, default=4,
+                       help="Number of filings classified in parallel (default: 4)")
     
     # Configuration
     parser.add_argument("--llm-config", default="config/llm_config.json",
@@ -97,9 +101,19 @@ Examples:
     # Output options
     parser.add_argument("--data-dir", default="extracted_events",
                        help="Base directory to save filings and classifications (will create CIK subdirectory)")
+    parser.add_argument("--jsonl", action="store_true",
+                       help="Append classifications to classifications.jsonl instead of one file per filing")
+    parser.add_argument("--manifest", action="store_true",
+                       help="Append filing metadata to <cik>/manifest.jsonl instead of one metadata.json per filing")
+    parser.add_argument("--skip-existing", action="store_true",
+                       help="Skip filings already saved (and classified) by an earlier run")
     parser.add_argument("--user-agent", 
                        default="Python SEC Scraper 1.0",
                        help="User agent for SEC requests")
+    parser.add_argument("--rps", type=float, default=9,
+                       help="Maximum SEC requests per second (default: 9, SEC limit is 10)")
+    parser.add_argument("--cache-dir", default=".cache/sec",
+                       help="Directory for cached SEC submissions data (empty string disables it)")
     
     # Other options
     parser.add_argument("--verbose", "-v", action="store_true",
@@ -146,11 +160,13 @@ Examples:
     try:
         # Initialize scraper
         logger.info("Initializing SEC EDGAR scraper...")
-        scraper = EdgarScraper(user_agent=args.user_agent)
+        rate_limiter = TokenBucket(rate=args.rps, burst=1)
+        scraper = EdgarScraper(user_agent=args.user_agent, rate_limiter=rate_limiter,
+                               cache_dir=args.cache_dir)
         
         # Get filings
         logger.info(f"Fetching 8-K filings for CIK {cik}...")
-        filings = scraper.scrape_8k_filings(cik, start_date, end_date)
+        filings = scraper.scrape_8k_filings(cik, start_date, end_date, download=False)
         
         if not filings:
             logger.info("No 8-K filings found for the specified criteria")
@@ -184,12 +200,38 @@ Examples:
             llm_config_path=args.llm_config,
             event_config_path=args.event_config,
             classify_events=not args.no_classify,
-            prompt_strategy=strategy_map[args.strategy]
+            prompt_strategy=strategy_map[args.strategy],
+            classification_output="jsonl" if args.jsonl else "json",
+            metadata_output="jsonl" if args.manifest else "json",
+            skip_existing=args.skip_existing
         )
         
+        # Don't download filings an earlier run already saved
+        if args.skip_existing:
+            pending = organizer.unsaved_filings(filings)
+            if len(pending) < len(filings):
+                print(f"\nSkipping {len(filings) - len(pending)} filings already saved")
+            filings = pending
+            if not filings:
+                logger.info("All filings were already saved")
+                return 0
+        
+        # Download filing content concurrently
+        logger.info(f"Downloading {len(filings)} filings...")
+        contents = asyncio.run(download_many(
+            [filing.document_url for filing in filings],
+            headers={"User-Agent": args.user_agent},
+            rate_limiter=rate_limiter
+        ))
+        for filing, content in zip(filings, contents):
+            if isinstance(content, Exception):
+                logger.error(f"Error downloading {filing.accession_number}: {content}")
+            else:
+                filing._raw_content = content
+        
         # Process filings
         logger.info("Processing filings...")
-        saved_paths = organizer.save_filings_batch(filings)
+        saved_paths = organizer.save_filings_batch(filings, max_workers=args.workers)
         
         # Print summary
         print(f"\nProcessing completed!")
@@ -199,9 +241,15 @@ Examples:
         if not args.no_classify:
             print(f"Classification strategy: {args.strategy}")
             print("\nEach filing directory contains:")
-            print("  - metadata.json (filing metadata)")
+            if not args.manifest:
+                print("  - metadata.json (filing metadata)")
             print("  - [filename].txt (raw filing content)")
-            print("  - classification.json (event classification)")
+            if args.jsonl:
+                print(f"\nClassifications: {Path(cik_data_dir).absolute() / 'classifications.jsonl'}")
+            else:
+                print("  - classification.json (event classification)")
+            if args.manifest:
+                print(f"Filing metadata: {Path(cik_data_dir).absolute() / cik / 'manifest.jsonl'}")
         
         return 0
         
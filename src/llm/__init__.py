@@ -4,6 +4,6 @@ Provides a simple LLMClient interface that can work with different LLM providers
 based on configuration.
 """
 
-from .client import LLMClient
+from .client import LLMClient, get_shared_client
 
-__all__ = ["LLMClient"]
+__all__ = ["LLMClient", "get_shared_client"]
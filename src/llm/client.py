@@ -1,9 +1,14 @@
 """Main LLM client that provides a unified interface."""
 
-import json
+import asyncio
+import logging
 import os
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, List, Optional, Tuple, Union
+from .json_utils import load_json_file
+from .exact_cache import ExactMatchCache
 from .providers.ollama import OllamaProvider
+from .semantic_cache import SemanticCache
 
 
 class LLMClient:
@@ -20,13 +25,16 @@ class LLMClient:
         if config:
             self.config = config
         elif config_path and os.path.exists(config_path):
-            with open(config_path, "r") as f:
-                self.config = json.load(f)
+            self.config = load_json_file(config_path)
         else:
             # Default configuration
             self.config = {"provider": "ollama", "model": "llama3.2", "options": {}}
 
+        self.logger = logging.getLogger(__name__)
         self.provider = self._create_provider()
+        self.exact_cache = self._create_exact_cache()
+        self.semantic_cache = self._create_semantic_cache()
+        self._prompt_prefixes: Tuple[str, ...] = ()
 
     def _create_provider(self):
         """Create the appropriate LLM provider based on config."""
@@ -36,10 +44,104 @@ class LLMClient:
         options = self.config.get("options", {})
 
         if provider_name == "ollama":
-            return OllamaProvider(model=model, **options)
+            provider = OllamaProvider(model=model, **options)
         else:
             raise ValueError(f"Unsupported provider: {provider_name}")
 
+        # Load the model now so the first real request doesn't pay the cold start
+        if self.config.get("warmup", True):
+            try:
+                provider.warmup()
+            except Exception as e:
+                self.logger.debug(f"Model warmup skipped: {e}")
+
+        return provider
+
+    def _create_exact_cache(self) -> Optional[ExactMatchCache]:
+        """Create the exact-match response cache if enabled in config."""
+
+        cache_config = self.config.get("cache", {})
+        if not cache_config.get("exact", False):
+            return None
+
+        return ExactMatchCache(max_size=cache_config.get("exact_max_size", 1024))
+
+    def _exact_cache_key(self, prompt: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Build the exact-match cache key, or None if the call must not be cached."""
+
+        if self.exact_cache is None:
+            return None
+
+        options = {**self.config.get("options", {}), **kwargs}
+        if options.get("temperature", 0) != 0:
+            return None
+
+        return ExactMatchCache.make_key(
+            self.config.get("provider", "ollama"),
+            self.config.get("model", "llama3.2"),
+            options,
+            prompt,
+        )
+
+    def _create_semantic_cache(
+        self, enabled_key: str = "semantic", prefix: str = ""
+    ) -> Optional[SemanticCache]:
+        """Create a semantic cache if ``cache.<enabled_key>`` is enabled in config."""
+
+        cache_config = self.config.get("cache", {})
+        if not cache_config.get(enabled_key, False):
+            return None
+
+        try:
+            return SemanticCache(
+                model_name=prefix + self.config.get("model", "llama3.2"),
+                threshold=cache_config.get("threshold", 0.92),
+                max_size=cache_config.get("max_size", 10000),
+                cache_dir=cache_config.get("dir", ".cache/llm"),
+                embedding_model=cache_config.get("embedding_model", "all-MiniLM-L6-v2"),
+                embedding_backend=cache_config.get("embedding_backend", "torch"),
+                embedding_file=cache_config.get("embedding_file"),
+            )
+        except ImportError as e:
+            self.logger.warning(f"Semantic cache disabled, missing dependency: {e}")
+            return None
+
+    def create_result_cache(self) -> Optional[SemanticCache]:
+        """
+        Create a semantic cache for classification results if ``cache.results``
+        is enabled in config.
+
+        Unlike the response cache, which is keyed on the full prompt, this cache
+        is meant to be keyed on the filing text alone, so near-duplicate filings
+        hit regardless of the prompt scaffolding around them.
+
+        Returns:
+            SemanticCache sharing the response cache settings, or None
+        """
+        return self._create_semantic_cache("results", prefix="results_")
+
+    def register_prompt_prefixes(self, prefixes: List[str]) -> None:
+        """
+        Register static prompt prefixes to leave out of semantic cache keys.
+
+        Sentence embedders truncate long inputs (256 tokens for
+        all-MiniLM-L6-v2), so prompts sharing a long static prefix would all
+        embed alike. Keying the semantic cache on the text after the prefix
+        keeps different inputs apart.
+
+        Args:
+            prefixes: Static text that prompts start with
+        """
+        merged = set(self._prompt_prefixes).union(prefix for prefix in prefixes if prefix)
+        self._prompt_prefixes = tuple(sorted(merged, key=len, reverse=True))
+
+    def _semantic_key(self, prompt: str) -> str:
+        """Strip the longest registered static prefix from a prompt."""
+        for prefix in self._prompt_prefixes:
+            if prompt.startswith(prefix):
+                return prompt[len(prefix):]
+        return prompt
+
     def generate(self, prompt: str, **kwargs) -> str:
         """
         Generate text using the configured LLM.
@@ -51,7 +153,139 @@ class LLMClient:
         Returns:
             Generated text
         """
-        return self.provider.generate(prompt, **kwargs)
+        exact_key = self._exact_cache_key(prompt, kwargs)
+        if exact_key is not None:
+            cached = self.exact_cache.get(exact_key)
+            if cached is not None:
+                return cached
+
+        embedding = None
+        if self.semantic_cache is not None:
+            semantic_key = self._semantic_key(prompt)
+            embedding = self.semantic_cache.embed(semantic_key)
+            cached = self.semantic_cache.search(embedding)
+            if cached is not None:
+                return cached
+
+        response = self.provider.generate(prompt, **kwargs)
+
+        if response:
+            if exact_key is not None:
+                self.exact_cache.put(exact_key, response)
+            if embedding is not None:
+                self.semantic_cache.add(embedding, semantic_key, response)
+
+        return response
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        """
+        Generate text asynchronously using the configured LLM.
+
+        Uses the same exact and semantic caches as ``generate``.
+
+        Args:
+            prompt: Input prompt
+            **kwargs: Additional generation parameters
+
+        Returns:
+            Generated text
+        """
+        exact_key = self._exact_cache_key(prompt, kwargs)
+        if exact_key is not None:
+            cached = self.exact_cache.get(exact_key)
+            if cached is not None:
+                return cached
+
+        embedding = None
+        if self.semantic_cache is not None:
+            semantic_key = self._semantic_key(prompt)
+            embedding = self.semantic_cache.embed(semantic_key)
+            cached = self.semantic_cache.search(embedding)
+            if cached is not None:
+                return cached
+
+        response = await self.provider.agenerate(prompt, **kwargs)
+
+        if response:
+            if exact_key is not None:
+                self.exact_cache.put(exact_key, response)
+            if embedding is not None:
+                self.semantic_cache.add(embedding, semantic_key, response)
+
+        return response
+
+    def generate_many(
+        self, prompts: List[str], max_concurrency: int = 4, **kwargs
+    ) -> List[Union[str, Exception]]:
+        """
+        Generate text for several prompts, sending cache misses concurrently.
+
+        Exact-cache lookups are done per prompt and semantic-cache lookups in a
+        single embedding pass and index query; the remaining prompts are sent
+        to the provider in parallel.
+
+        Args:
+            prompts: Input prompts
+            max_concurrency: Maximum number of provider requests in flight
+            **kwargs: Additional generation parameters
+
+        Returns:
+            Generated text for each prompt, in order; failed requests are
+            returned as the raised exception instead of a string
+        """
+        responses: List[Union[str, Exception, None]] = [None] * len(prompts)
+        exact_keys = [self._exact_cache_key(prompt, kwargs) for prompt in prompts]
+        for i, key in enumerate(exact_keys):
+            if key is not None:
+                responses[i] = self.exact_cache.get(key)
+
+        embeddings = None
+        if self.semantic_cache is not None and prompts:
+            semantic_keys = [self._semantic_key(prompt) for prompt in prompts]
+            embeddings = self.semantic_cache.embed_many(semantic_keys)
+            for i, hit in enumerate(self.semantic_cache.search_many(embeddings)):
+                if responses[i] is None:
+                    responses[i] = hit
+
+        misses = [i for i, response in enumerate(responses) if response is None]
+        if misses:
+            generated = asyncio.run(
+                self.provider.generate_many(
+                    [prompts[i] for i in misses], max_concurrency=max_concurrency, **kwargs
+                )
+            )
+            for i, response in zip(misses, generated):
+                responses[i] = response
+                if isinstance(response, Exception) or not response:
+                    continue
+                if exact_keys[i] is not None:
+                    self.exact_cache.put(exact_keys[i], response)
+                if embeddings is not None:
+                    self.semantic_cache.add(embeddings[i], semantic_keys[i], response)
+
+        return responses
+
+    def warmup(self, prompts: List[str]) -> None:
+        """
+        Send prompts to the provider once so the model is loaded and the prompt
+        prefixes are already in the server's KV cache for the first real request.
+
+        Only the prefill matters, so each request decodes a single token.
+        Does nothing unless ``warmup_prefixes`` is enabled in the config.
+        Failures are logged and ignored.
+
+        Args:
+            prompts: Prompts (typically static prompt prefixes) to prime
+        """
+        if not self.config.get("warmup_prefixes", False):
+            return
+
+        for prompt in prompts:
+            try:
+                self.provider.generate(prompt, num_predict=1)
+            except Exception as e:
+                self.logger.warning(f"LLM warmup failed: {e}")
+                return
 
     def is_available(self) -> bool:
         """Check if the LLM provider is available."""
@@ -63,3 +297,30 @@ class LLMClient:
             "provider": self.config.get("provider", "unknown"),
             "model": self.config.get("model", "unknown"),
         }
+
+
+_SHARED_CLIENTS: Dict[str, LLMClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def get_shared_client(config_path: str = "config/llm_config.json") -> LLMClient:
+    """
+    Return a process-wide LLMClient for a config file, creating it on first use.
+
+    Sharing one client lets every classifier in a run reuse the same provider
+    and response caches.
+
+    Args:
+        config_path: Path to configuration file
+
+    Returns:
+        Shared LLMClient instance
+    """
+    client = _SHARED_CLIENTS.get(config_path)
+    if client is None:
+        with _SHARED_CLIENTS_LOCK:
+            client = _SHARED_CLIENTS.get(config_path)
+            if client is None:
+                client = LLMClient(config_path=config_path)
+                _SHARED_CLIENTS[config_path] = client
+    return client
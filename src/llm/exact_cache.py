@@ -0,0 +1,64 @@
+"""Exact-match LRU cache for deterministic LLM calls."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ExactMatchCache:
+    """
+    Size-bounded LRU cache keyed by provider, model, options and prompt hash.
+
+    Only safe for deterministic (temperature 0) generation, where the same
+    inputs always produce the same response. Safe to share across threads.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of cached responses
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(provider: str, model: str, options: Dict[str, Any], prompt: str) -> str:
+        """
+        Build a cache key for a generation request.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            options: Generation options (config options merged with call kwargs)
+            prompt: Input prompt
+
+        Returns:
+            Cache key string
+        """
+        prompt_hash = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        options_key = json.dumps(options, sort_keys=True, default=str)
+        return f"{provider}|{model}|{options_key}|{prompt_hash}"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for a key, marking it most recently used."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+
+    def put(self, key: str, response: str) -> None:
+        """Cache a response, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
@@ -0,0 +1,57 @@
+"""Fast JSON helpers for configuration files and classification output."""
+
+import functools
+import json
+import os
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+def loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, using orjson when available.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json_file(path: str, mtime_ns: int) -> Any:
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def load_json_file(path: str) -> Any:
+    """
+    Load a JSON file, reusing the parsed result until the file changes.
+
+    Results are cached by path and modification time, so repeated loads of an
+    unchanged config file skip the disk read and parse. The returned object is
+    shared between callers and must be treated as read-only.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON content
+    """
+    return _load_json_file(os.path.abspath(path), os.stat(path).st_mtime_ns)
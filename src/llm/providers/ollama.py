@@ -1,30 +1,90 @@
 """Ollama LLM provider."""
 
-import subprocess
-import shutil
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import httpx
+
+# Option keys consumed by this client rather than the Ollama model runner
+_CLIENT_OPTIONS = ("timeout", "stop_pattern")
 
 
 class OllamaProvider:
-    """Ollama LLM provider implementation."""
+    """Ollama LLM provider implementation using the Ollama HTTP API."""
 
-    def __init__(self, model: str = "llama3.2", **options):
+    def __init__(
+        self,
+        model: str = "llama3.2",
+        keep_alive: str = "30m",
+        host: str = "http://localhost:11434",
+        availability_ttl: float = 30.0,
+        transport: Optional[httpx.BaseTransport] = None,
+        **options,
+    ):
         """
         Initialize Ollama provider.
 
         Args:
             model: Model name to use
+            keep_alive: How long the server keeps the model (and its prompt
+                cache) loaded after a request
+            host: Base URL of the Ollama server
+            availability_ttl: Seconds an ``is_available`` result is reused
+            transport: Optional httpx transport (mainly for testing)
             **options: Additional Ollama options
         """
+        self.logger = logging.getLogger(__name__)
         self.model = model
+        self.keep_alive = keep_alive
+        self.host = host.rstrip("/")
+        self.availability_ttl = availability_ttl
         self.options = options
 
+        # Keep-alive connection pool shared by all requests from this provider
+        self._session = httpx.Client(base_url=self.host, transport=transport)
+        self._available: Optional[bool] = None
+        self._available_checked = 0.0
+        self._available_lock = threading.Lock()
+
+        # Async client is created lazily per event loop by _get_async_client
+        self._async_transport = transport if isinstance(transport, httpx.AsyncBaseTransport) else None
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _request_body(
+        self, prompt: str, kwargs: Dict[str, Any], stream: bool = False
+    ) -> Dict[str, Any]:
+        """Build an /api/generate request body for a prompt."""
+        options = {**self.options, **kwargs}
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.keep_alive,
+            "options": {k: v for k, v in options.items() if k not in _CLIENT_OPTIONS},
+        }
+
     def generate(self, prompt: str, **kwargs) -> str:
         """
         Generate text using Ollama.
 
+        Availability is only checked until it has been confirmed once, and
+        again after a failed request; a healthy provider goes straight to
+        ``/api/generate``.
+
+        With a ``stop_pattern`` the response is streamed and the request is
+        closed as soon as the generated text matches the pattern, so the model
+        stops decoding once the caller has what it needs.
+
         Args:
             prompt: Input prompt
-            **kwargs: Additional generation parameters
+            **kwargs: Additional generation parameters; ``stop_pattern`` is a
+                regular expression that ends generation early when matched
 
         Returns:
             Generated text
@@ -32,68 +92,234 @@ class OllamaProvider:
         Raises:
             RuntimeError: If Ollama is not available or generation fails
         """
-        if not self.is_available():
+        if not self._available and not self.is_available():
             raise RuntimeError("Ollama is not available")
 
+        timeout = kwargs.get("timeout", self.options.get("timeout", 60))
+        stop_pattern = kwargs.get("stop_pattern")
         try:
-            # Prepare command
-            cmd = ["ollama", "run", self.model]
+            if stop_pattern:
+                with self._session.stream(
+                    "POST",
+                    "/api/generate",
+                    json=self._request_body(prompt, kwargs, stream=True),
+                    timeout=timeout,
+                ) as response:
+                    response.raise_for_status()
+                    pattern = re.compile(stop_pattern)
+                    text = ""
+                    for line in response.iter_lines():
+                        text, done = self._append_chunk(text, line, pattern)
+                        if done:
+                            break
+                    return text.strip()
 
-            # Run Ollama
-            result = subprocess.run(
-                cmd, input=prompt, capture_output=True, text=True, timeout=kwargs.get("timeout", 60)
+            response = self._session.post(
+                "/api/generate", json=self._request_body(prompt, kwargs), timeout=timeout
             )
+            response.raise_for_status()
+            return response.json()["response"].strip()
+
+        except httpx.TimeoutException:
+            raise RuntimeError("Ollama request timed out")
+        except Exception as e:
+            # Force a fresh availability check on the next call
+            self._available = None
+            raise RuntimeError(f"Ollama generation failed: {str(e)}")
+
+    @staticmethod
+    def _append_chunk(text: str, line: str, pattern: "re.Pattern[str]") -> Tuple[str, bool]:
+        """
+        Add one streamed JSON line to the generated text.
+
+        Returns:
+            (text so far, whether generation is done or ``pattern`` matched)
+        """
+        if not line:
+            return text, False
+        chunk = json.loads(line)
+        text += chunk.get("response", "")
+        return text, bool(chunk.get("done")) or pattern.search(text) is not None
+
+    def warmup(self, timeout: float = 10.0) -> None:
+        """
+        Load the model into server memory without generating any text.
+
+        Ollama loads a model when it receives a generate request with no
+        prompt; ``keep_alive`` then keeps it resident for later requests.
+
+        Args:
+            timeout: Request timeout in seconds
+
+        Raises:
+            httpx.HTTPError: If the server cannot be reached or rejects the request
+        """
+        response = self._session.post(
+            "/api/generate",
+            json={"model": self.model, "keep_alive": self.keep_alive},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the async client for the running event loop, creating it lazily."""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            # Connections are bound to the loop that opened them
+            self._aclient = httpx.AsyncClient(base_url=self.host, transport=self._async_transport)
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def agenerate(self, prompt: str, **kwargs) -> str:
+        """
+        Generate text asynchronously using Ollama.
+
+        Concurrent calls share one pooled ``httpx.AsyncClient``. The server only
+        processes them in parallel up to its ``OLLAMA_NUM_PARALLEL`` setting;
+        further requests wait in the server's queue.
+
+        Args:
+            prompt: Input prompt
+            **kwargs: Additional generation parameters; ``stop_pattern`` works
+                as in ``generate``
+
+        Returns:
+            Generated text
+
+        Raises:
+            RuntimeError: If generation fails
+        """
+        return await self._agenerate(self._get_async_client(), prompt, kwargs)
 
-            if result.returncode != 0:
-                raise RuntimeError(f"Ollama error: {result.stderr}")
+    async def _agenerate(
+        self, client: httpx.AsyncClient, prompt: str, kwargs: Dict[str, Any]
+    ) -> str:
+        """Send one generate request on ``client``; see ``agenerate``."""
+        timeout = kwargs.get("timeout", self.options.get("timeout", 60))
+        stop_pattern = kwargs.get("stop_pattern")
+        try:
+            if stop_pattern:
+                async with client.stream(
+                    "POST",
+                    "/api/generate",
+                    json=self._request_body(prompt, kwargs, stream=True),
+                    timeout=timeout,
+                ) as response:
+                    response.raise_for_status()
+                    pattern = re.compile(stop_pattern)
+                    text = ""
+                    async for line in response.aiter_lines():
+                        text, done = self._append_chunk(text, line, pattern)
+                        if done:
+                            break
+                    return text.strip()
 
-            return result.stdout.strip()
+            response = await client.post(
+                "/api/generate", json=self._request_body(prompt, kwargs), timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json()["response"].strip()
 
-        except subprocess.TimeoutExpired:
+        except httpx.TimeoutException:
             raise RuntimeError("Ollama request timed out")
         except Exception as e:
             raise RuntimeError(f"Ollama generation failed: {str(e)}")
 
-    def is_available(self) -> bool:
-        """Check if Ollama is available and the model is accessible."""
+    async def generate_many(
+        self, prompts: List[str], max_concurrency: int = 4, **kwargs
+    ) -> List[Union[str, Exception]]:
+        """
+        Generate text for several prompts concurrently via the Ollama HTTP API.
 
-        # Check if ollama command is available
-        if not shutil.which("ollama"):
-            return False
+        Requests are sent in parallel so the server can batch them; the server
+        must allow that many parallel requests (``OLLAMA_NUM_PARALLEL``). They
+        share a client opened for this call and closed before it returns, so
+        callers running each batch in a fresh event loop do not leak its pool.
 
-        try:
-            # Check if ollama is running
-            result = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=5)
+        Args:
+            prompts: Input prompts
+            max_concurrency: Maximum number of requests in flight
+            **kwargs: Additional generation parameters
 
-            if result.returncode != 0:
-                return False
+        Returns:
+            Generated text for each prompt, in order; failed requests are
+            returned as the raised exception instead of a string
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
 
-            # Check if our model is available
-            return self.model in result.stdout
+        async with httpx.AsyncClient(base_url=self.host, transport=self._async_transport) as client:
 
-        except (subprocess.TimeoutExpired, Exception):
-            return False
+            async def generate_one(prompt: str) -> str:
+                async with semaphore:
+                    return await self._agenerate(client, prompt, kwargs)
+
+            results = await asyncio.gather(
+                *(generate_one(prompt) for prompt in prompts), return_exceptions=True
+            )
+        return list(results)
+
+    def is_available(self) -> bool:
+        """
+        Check if Ollama is available and the model is accessible.
+
+        The result is cached for ``availability_ttl`` seconds so generation
+        does not pay an extra round-trip per call.
+        """
+        with self._available_lock:
+            now = time.monotonic()
+            if self._available is None or now - self._available_checked > self.availability_ttl:
+                self._available = self._has_model(self._fetch_model_names())
+                self._available_checked = now
+            return self._available
+
+    def _has_model(self, names: List[str]) -> bool:
+        """Check for the model by exact name; an untagged model name means ``:latest``."""
+        wanted = {self.model} if ":" in self.model else {self.model, f"{self.model}:latest"}
+        return any(name in wanted for name in names)
+
+    def _fetch_model_names(self) -> List[str]:
+        """Return the names of locally available models, or [] if unreachable."""
+        try:
+            response = self._session.get("/api/tags", timeout=5)
+            response.raise_for_status()
+            return [model["name"] for model in response.json().get("models", [])]
+        except Exception:
+            return []
 
     def pull_model(self) -> bool:
         """
         Pull the model if it's not available.
 
+        The pull progress is streamed from ``/api/pull`` and logged as it
+        arrives, so large downloads are not bounded by a fixed timeout.
+
         Returns:
             True if successful, False otherwise
         """
+        status = None
         try:
-            result = subprocess.run(
-                ["ollama", "pull", self.model],
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minutes timeout for model download
-            )
-
-            return result.returncode == 0
+            with self._session.stream(
+                "POST", "/api/pull", json={"model": self.model}, timeout=None
+            ) as response:
+                response.raise_for_status()
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    update = json.loads(line)
+                    if "error" in update:
+                        self.logger.error(f"Pulling {self.model} failed: {update['error']}")
+                        return False
+                    status = update.get("status")
+                    self.logger.debug(f"Pulling {self.model}: {status}")
 
-        except (subprocess.TimeoutExpired, Exception):
+        except Exception as e:
+            self.logger.error(f"Pulling {self.model} failed: {e}")
             return False
 
+        # Re-check availability on the next call
+        self._available = None
+        return status == "success"
+
     def list_models(self) -> list:
         """
         List available models.
@@ -101,22 +327,4 @@ class OllamaProvider:
         Returns:
             List of available model names
         """
-        try:
-            result = subprocess.run(["ollama", "list"], capture_output=True, text=True, timeout=5)
-
-            if result.returncode != 0:
-                return []
-
-            # Parse the output to extract model names
-            lines = result.stdout.strip().split("\n")
-            models = []
-
-            for line in lines[1:]:  # Skip header
-                if line.strip():
-                    model_name = line.split()[0]
-                    models.append(model_name)
-
-            return models
-
-        except (subprocess.TimeoutExpired, Exception):
-            return []
+        return self._fetch_model_names()
@@ -0,0 +1,311 @@
+"""Semantic prompt/response cache for LLM calls."""
+
+import atexit
+import logging
+import os
+import pickle
+import re
+import threading
+from typing import Callable, List, Optional
+
+import numpy as np
+
+try:
+    import faiss  # type: ignore
+except ImportError:  # pragma: no cover - faiss is optional
+    faiss = None
+
+
+def _grow(buffer: np.ndarray, size: int, needed: int, limit: Optional[int] = None) -> np.ndarray:
+    """Return ``buffer``, or a copy of its first ``size`` rows with room for ``needed`` rows.
+
+    Capacity doubles (up to ``limit``) so appends are amortized O(1).
+    """
+    if needed <= len(buffer):
+        return buffer
+    capacity = max(1, 2 * len(buffer))
+    if limit is not None:
+        capacity = min(capacity, limit)
+    grown = np.empty((max(needed, capacity), buffer.shape[1]), dtype=buffer.dtype)
+    grown[:size] = buffer[:size]
+    return grown
+
+
+class _NumpyIndex:
+    """Exact inner-product search over a float32 copy of the embeddings, used without FAISS."""
+
+    def __init__(self, dim: int):
+        self._matrix = np.empty((0, dim), dtype=np.float32)
+        self._size = 0
+
+    def add(self, rows: np.ndarray) -> None:
+        end = self._size + len(rows)
+        self._matrix = _grow(self._matrix, self._size, end)
+        self._matrix[self._size : end] = rows
+        self._size = end
+
+    def search(self, queries: np.ndarray, k: int):
+        """Return the best score and id per query (``k`` must be 1), like a FAISS index."""
+        scores = queries @ self._matrix[: self._size].T
+        ids = np.argmax(scores, axis=1)
+        return scores[np.arange(len(queries)), ids][:, None], ids[:, None]
+
+
+class SemanticCache:
+    """
+    Cache LLM responses and serve them for semantically similar prompts.
+
+    Prompts are embedded with a small sentence-transformers model and compared
+    by cosine similarity (inner product of normalized vectors). A stored response
+    is returned when the best match scores at or above the threshold. Lookups and
+    inserts are guarded by a lock so one cache can be shared across threads.
+
+    With FAISS installed, small caches use an exact flat index and switch to an
+    HNSW graph once they reach ``hnsw_min_size`` entries, keeping lookups
+    sub-linear as the cache grows. Embeddings are stored as float16 (an fp16
+    scalar-quantized index with FAISS), halving memory at a negligible cost
+    in similarity precision. Without FAISS, lookups use an exact NumPy search
+    over a float32 copy.
+
+    A full cache evicts its oldest tenth in one step, so the index is rebuilt
+    once per ``max_size // 10`` inserts rather than on every insert.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        threshold: float = 0.92,
+        max_size: int = 10000,
+        cache_dir: Optional[str] = ".cache/llm",
+        embedding_model: str = "all-MiniLM-L6-v2",
+        embedding_backend: str = "torch",
+        embedding_file: Optional[str] = None,
+        encoder: Optional[Callable[[List[str]], np.ndarray]] = None,
+        hnsw_min_size: int = 1024,
+        hnsw_m: int = 32,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            model_name: LLM model name the cached responses belong to
+            threshold: Minimum cosine similarity for a cache hit
+            max_size: Maximum number of cached entries (oldest evicted first,
+                a tenth at a time)
+            cache_dir: Directory for the on-disk cache (None disables persistence)
+            embedding_model: sentence-transformers model used to embed prompts
+            embedding_backend: sentence-transformers backend ("torch" or "onnx")
+            embedding_file: Model file to load with the ONNX backend, e.g.
+                "onnx/model_qint8_avx512_vnni.onnx" for the int8-quantized model
+            encoder: Optional callable mapping a list of prompts to embeddings
+            hnsw_min_size: Entry count at which the FAISS index switches to HNSW
+            hnsw_m: Neighbors per node in the HNSW graph
+
+        Raises:
+            ImportError: If no encoder is given and sentence-transformers is missing
+        """
+        self.logger = logging.getLogger(__name__)
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_size = max_size
+        self.hnsw_min_size = hnsw_min_size
+        self.hnsw_m = hnsw_m
+
+        if encoder is None:
+            from sentence_transformers import SentenceTransformer  # type: ignore
+
+            model_kwargs = {"file_name": embedding_file} if embedding_file else None
+            model = SentenceTransformer(
+                embedding_model, backend=embedding_backend, model_kwargs=model_kwargs
+            )
+            encoder = lambda prompts: model.encode(  # noqa: E731
+                prompts, batch_size=32, convert_to_numpy=True, normalize_embeddings=True
+            )
+        self._encoder = encoder
+
+        # Preallocated fp16 rows; the first _size are in use
+        self._buffer: Optional[np.ndarray] = None
+        self._size = 0
+        self._prompts: List[str] = []
+        self._responses: List[str] = []
+        self._index = None
+        self._lock = threading.Lock()
+
+        self.path = None
+        if cache_dir:
+            safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", model_name)
+            self.path = os.path.join(cache_dir, f"semantic_{safe_name}.pkl")
+            self._load()
+            atexit.register(self.save)
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    @property
+    def _embeddings(self) -> Optional[np.ndarray]:
+        """Stored float16 embeddings, oldest first (None while empty)."""
+        if not self._size:
+            return None
+        return self._buffer[: self._size]
+
+    def embed(self, prompt: str) -> np.ndarray:
+        """Embed a prompt as a normalized float32 vector."""
+        return self.embed_many([prompt])[0]
+
+    def embed_many(self, prompts: List[str]) -> np.ndarray:
+        """Embed prompts in a single encoder call as normalized float32 rows."""
+        embeddings = np.asarray(self._encoder(prompts), dtype=np.float32).reshape(len(prompts), -1)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return embeddings / norms
+
+    def search(self, embedding: np.ndarray) -> Optional[str]:
+        """
+        Find a cached response for an embedded prompt.
+
+        Args:
+            embedding: Normalized prompt embedding
+
+        Returns:
+            Cached response if the best match meets the threshold, None otherwise
+        """
+        return self.search_many(embedding.reshape(1, -1))[0]
+
+    def search_many(self, embeddings: np.ndarray) -> List[Optional[str]]:
+        """
+        Find cached responses for a batch of embedded prompts in one index query.
+
+        Args:
+            embeddings: Normalized prompt embeddings, one per row
+
+        Returns:
+            Cached response or None for each row
+        """
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        with self._lock:
+            if not self._responses:
+                return [None] * len(embeddings)
+
+            scores, ids = self._index.search(embeddings, 1)
+            best_scores, best_ids = scores[:, 0], ids[:, 0]
+
+            results: List[Optional[str]] = []
+            for best_score, best_id in zip(best_scores, best_ids):
+                if best_id < 0 or best_score < self.threshold:
+                    results.append(None)
+                else:
+                    self.logger.debug(f"Semantic cache hit (score {best_score:.3f})")
+                    results.append(self._responses[int(best_id)])
+
+        return results
+
+    def get(self, prompt: str) -> Optional[str]:
+        """Look up a cached response for a prompt."""
+        return self.search(self.embed(prompt))
+
+    def get_many(self, prompts: List[str]) -> List[Optional[str]]:
+        """Look up cached responses for several prompts with one embedding pass."""
+        return self.search_many(self.embed_many(prompts))
+
+    def add(self, embedding: np.ndarray, prompt: str, response: str) -> None:
+        """
+        Insert an embedded prompt and its response.
+
+        Args:
+            embedding: Normalized prompt embedding
+            prompt: Original prompt
+            response: LLM response to cache
+        """
+        row = embedding.reshape(1, -1).astype(np.float32)
+        with self._lock:
+            evicted = self._size >= self.max_size
+            if evicted:
+                self._evict(max(1, self.max_size // 10))
+
+            if self._buffer is None:
+                self._buffer = np.empty((0, row.shape[1]), dtype=np.float16)
+            self._buffer = _grow(self._buffer, self._size, self._size + 1, limit=self.max_size)
+            self._buffer[self._size] = row[0]
+            self._size += 1
+            self._prompts.append(prompt)
+            self._responses.append(response)
+
+            if evicted or self._index is None or self._size == self.hnsw_min_size:
+                # Ids shifted, first insert, or the cache just grew large enough for HNSW
+                self._rebuild_index()
+            else:
+                self._index.add(row)
+
+    def _evict(self, count: int) -> None:
+        """Drop the ``count`` oldest entries in place (caller holds the lock)."""
+        keep = self._size - count
+        self._buffer[:keep] = self._buffer[count : self._size]
+        self._size = keep
+        del self._prompts[:count]
+        del self._responses[:count]
+
+    def put(self, prompt: str, response: str) -> None:
+        """Embed a prompt and cache its response."""
+        self.add(self.embed(prompt), prompt, response)
+
+    def save(self) -> None:
+        """Persist the cache to disk."""
+        if not self.path or self._embeddings is None:
+            return
+
+        with self._lock:
+            data = {
+                "model_name": self.model_name,
+                "embeddings": self._embeddings.copy(),
+                "prompts": list(self._prompts),
+                "responses": list(self._responses),
+            }
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "wb") as f:
+            pickle.dump(data, f)
+
+    def _load(self) -> None:
+        """Load a previously persisted cache if one exists."""
+        if not self.path or not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, "rb") as f:
+                data = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"Failed to load semantic cache from {self.path}: {e}")
+            return
+
+        if data.get("model_name") != self.model_name:
+            return
+
+        self._buffer = np.array(data["embeddings"][-self.max_size :], dtype=np.float16)
+        self._size = len(self._buffer)
+        self._prompts = data["prompts"][-self.max_size :]
+        self._responses = data["responses"][-self.max_size :]
+        self._rebuild_index()
+        self.logger.info(f"Loaded {len(self)} semantic cache entries from {self.path}")
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the fp16 FAISS index (flat or HNSW by size) from the stored embeddings."""
+        if self._embeddings is None:
+            self._index = None
+            return
+
+        dim = self._embeddings.shape[1]
+        if faiss is None:
+            self._index = _NumpyIndex(dim)
+            self._index.add(self._embeddings.astype(np.float32))
+            return
+
+        fp16 = faiss.ScalarQuantizer.QT_fp16
+        if len(self._responses) >= self.hnsw_min_size:
+            self._index = faiss.IndexHNSWSQ(dim, fp16, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        else:
+            self._index = faiss.IndexScalarQuantizer(dim, fp16, faiss.METRIC_INNER_PRODUCT)
+
+        embeddings = self._embeddings.astype(np.float32)
+        if not self._index.is_trained:
+            self._index.train(embeddings)
+        self._index.add(embeddings)
@@ -1,17 +1,39 @@
 """Event classifier for 8-K filing classification using LLMs."""
 
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
 from enum import Enum
 
 from ..llm.client import LLMClient
+from ..llm.semantic_cache import SemanticCache
 from .schema.event_types import (
+    CLASSIFICATION_STOP_PATTERN,
     ClassificationResult,
     load_default_event_config,
     load_event_config,
+    parse_validation_status,
+    validate_batched_classification_result,
     validate_classification_result,
 )
 from .prompts.classification_prompts import ClassificationPrompts
+from .fast_classifier import ITEM_RE, FastClassifier
+
+
+# Default cap on filing characters sent to the LLM; prefill dominates LLM
+# latency and the leading Items carry the event
+MAX_INPUT_CHARS = 16000
+
+
+def default_max_concurrency() -> int:
+    """Return the Ollama server's parallel request limit (``OLLAMA_NUM_PARALLEL``, default 4)."""
+    return max(1, int(os.getenv("OLLAMA_NUM_PARALLEL", "4")))
 
 
 class PromptStrategy(Enum):
@@ -23,6 +45,28 @@ class PromptStrategy(Enum):
     FEW_SHOT = "few_shot"
 
 
+# Prompt builder per strategy, called as render(classifier, text, examples)
+_STRATEGY_DISPATCH = {
+    PromptStrategy.BASIC: lambda self, text, examples: (
+        ClassificationPrompts.basic_classification_prompt(text, self.event_types)
+    ),
+    PromptStrategy.DETAILED: lambda self, text, examples: (
+        ClassificationPrompts.detailed_classification_prompt(text, self._config_dicts)
+    ),
+    PromptStrategy.CHAIN_OF_THOUGHT: lambda self, text, examples: (
+        ClassificationPrompts.chain_of_thought_prompt(text, self.event_types)
+    ),
+    PromptStrategy.FEW_SHOT: lambda self, text, examples: (
+        ClassificationPrompts.few_shot_prompt(text, self.event_types, examples)
+    ),
+}
+
+# Static prompt text around the filing, keyed by strategy and event configuration
+# and shared by every classifier in the process
+_PROMPT_PARTS: Dict[Tuple[Any, ...], Tuple[str, str]] = {}
+_PROMPT_PARTS_LOCK = threading.Lock()
+
+
 class EventClassifier:
     """
     Classifier for 8-K filing events using LLMs.
@@ -39,6 +83,11 @@ class EventClassifier:
         llm_config_path: str = "config/llm_config.json",
         event_config_path: str = "config/event_config.json",
         event_config_dict: Optional[Dict[str, Any]] = None,
+        llm_client: Optional[LLMClient] = None,
+        use_rules: bool = True,
+        result_cache: Optional[SemanticCache] = None,
+        early_stop: bool = True,
+        max_input_chars: Optional[int] = MAX_INPUT_CHARS,
     ):
         """
         Initialize the event classifier.
@@ -47,11 +96,18 @@ class EventClassifier:
             llm_config_path: Path to LLM configuration file
             event_config_path: Path to event configuration file
             event_config_dict: Optional event config dict (overrides file)
+            llm_client: Existing LLM client to share (overrides llm_config_path)
+            use_rules: Classify filings with unambiguous 8-K Item codes without the LLM
+            result_cache: Semantic cache keyed on filing text; near-duplicate
+                filings reuse the stored LLM response instead of calling the LLM
+            early_stop: Stop LLM generation once the CLASSIFICATION line is complete
+            max_input_chars: Filing text beyond this many characters is dropped
+                before prompting (0 or None sends the full text)
         """
         self.logger = logging.getLogger(__name__)
 
         # Initialize LLM client
-        self.llm_client = LLMClient(config_path=llm_config_path)
+        self.llm_client = llm_client or LLMClient(config_path=llm_config_path)
 
         # Load event configuration
         if event_config_dict:
@@ -59,7 +115,40 @@ class EventClassifier:
         else:
             self.event_configs = load_default_event_config(event_config_path)
 
-        self.event_types = list(self.event_configs.keys())
+        self.event_types = tuple(self.event_configs)
+        self.relevant_event_types = tuple(
+            event_type for event_type, config in self.event_configs.items() if config.relevant
+        )
+        self.fast_classifier = FastClassifier(self.event_types) if use_rules else None
+        self.result_cache = result_cache
+        self.max_input_chars = max_input_chars
+        self._generate_kwargs = {"stop_pattern": CLASSIFICATION_STOP_PATTERN} if early_stop else {}
+
+        # EventConfig objects as dictionaries for the detailed prompt
+        self._config_dicts = {
+            event_type: {
+                "relevant": config.relevant,
+                "description": config.description,
+                "keywords": config.keywords,
+            }
+            for event_type, config in self.event_configs.items()
+        }
+
+        # Static prompt text around the filing, rendered once per strategy and
+        # event configuration; classifiers with the same configuration share it
+        config_key = tuple(
+            (event_type, config["relevant"], config["description"], tuple(config["keywords"]))
+            for event_type, config in self._config_dicts.items()
+        )
+        self._prompt_parts = {
+            strategy: self._shared_prompt_parts(strategy, config_key) for strategy in PromptStrategy
+        }
+
+        # Key the client's semantic cache on the filing rather than the static
+        # prefix, and prime the model server's prompt cache with it (if enabled)
+        prefixes = [prefix for prefix, _ in self._prompt_parts.values()]
+        self.llm_client.register_prompt_prefixes(prefixes)
+        self.llm_client.warmup(prefixes)
 
         self.logger.info(f"Initialized EventClassifier with {len(self.event_types)} event types")
 
@@ -86,6 +175,16 @@ class EventClassifier:
             self.logger.warning("Empty text provided for classification")
             return None
 
+        # Skip the LLM when the filing's Item codes are unambiguous
+        result = self._classify_by_rules(text)
+        if result:
+            return result
+
+        # Reuse the result of a near-duplicate filing
+        result, embedding = self._lookup_result(text)
+        if result:
+            return result
+
         # Generate prompt based on strategy
         prompt = self._generate_prompt(text, strategy, examples)
 
@@ -93,24 +192,17 @@ class EventClassifier:
         for attempt in range(max_retries + 1):
             try:
                 # Call LLM
-                response = self.llm_client.generate(prompt)
+                response = self.llm_client.generate(prompt, **self._generate_kwargs)
 
                 if not response:
                     self.logger.warning(f"Empty response from LLM (attempt {attempt + 1})")
                     continue
 
                 # Parse and validate response
-                result = validate_classification_result(response, self.event_types)
+                result = self._parse_response(response)
 
                 if result:
-                    # Add configuration info to result
-                    event_config = self.event_configs.get(result.event_type)
-                    if event_config:
-                        result.relevant = event_config.relevant
-
-                    self.logger.info(
-                        f"Successfully classified as: {result.event_type} (relevant: {result.relevant})"
-                    )
+                    self._store_result(embedding, text, result)
                     return result
                 else:
                     self.logger.warning(
@@ -123,12 +215,452 @@ class EventClassifier:
         self.logger.error(f"Failed to classify after {max_retries + 1} attempts")
         return None
 
+    async def aclassify(
+        self,
+        text: str,
+        strategy: PromptStrategy = PromptStrategy.DETAILED,
+        examples: Optional[List[Dict[str, str]]] = None,
+        max_retries: int = 2,
+    ) -> Optional[ClassificationResult]:
+        """
+        Classify an 8-K filing text without blocking the event loop.
+
+        Async counterpart of ``classify`` with the same rule prefilter, retries
+        and result parsing.
+
+        Args:
+            text: The filing text to classify
+            strategy: Prompt strategy to use
+            examples: Custom examples for few-shot learning
+            max_retries: Maximum number of retries on parsing failure
+
+        Returns:
+            ClassificationResult if successful, None if failed
+        """
+        if not text.strip():
+            self.logger.warning("Empty text provided for classification")
+            return None
+
+        result = self._classify_by_rules(text)
+        if result:
+            return result
+
+        result, embedding = self._lookup_result(text)
+        if result:
+            return result
+
+        prompt = self._generate_prompt(text, strategy, examples)
+
+        for attempt in range(max_retries + 1):
+            try:
+                response = await self.llm_client.agenerate(prompt, **self._generate_kwargs)
+
+                if not response:
+                    self.logger.warning(f"Empty response from LLM (attempt {attempt + 1})")
+                    continue
+
+                result = self._parse_response(response)
+                if result:
+                    self._store_result(embedding, text, result)
+                    return result
+
+                self.logger.warning(
+                    f"Failed to parse LLM response (attempt {attempt + 1}): {response[:100]}..."
+                )
+
+            except Exception as e:
+                self.logger.error(f"Error during classification (attempt {attempt + 1}): {e}")
+
+        self.logger.error(f"Failed to classify after {max_retries + 1} attempts")
+        return None
+
+    async def aclassify_batch(
+        self,
+        texts: List[str],
+        strategy: PromptStrategy = PromptStrategy.DETAILED,
+        examples: Optional[List[Dict[str, str]]] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 2,
+    ) -> List[Optional[ClassificationResult]]:
+        """
+        Classify several filing texts concurrently with ``aclassify``.
+
+        Set ``max_concurrency`` to the Ollama server's ``OLLAMA_NUM_PARALLEL``;
+        higher values only queue requests on the server.
+
+        Args:
+            texts: Filing texts to classify
+            strategy: Prompt strategy to use
+            examples: Custom examples for few-shot learning
+            max_concurrency: Maximum number of classifications in flight
+                (defaults to ``OLLAMA_NUM_PARALLEL``, or 4)
+            max_retries: Maximum number of retries on parsing failure
+
+        Returns:
+            ClassificationResult (or None if failed) for each text, in order
+        """
+        unique = list(dict.fromkeys(texts))
+        if len(unique) < len(texts):
+            results = await self.aclassify_batch(
+                unique, strategy, examples, max_concurrency, max_retries
+            )
+            return self._fan_out(texts, unique, results)
+
+        semaphore = asyncio.Semaphore(max_concurrency or default_max_concurrency())
+
+        async def classify_one(text: str) -> Optional[ClassificationResult]:
+            async with semaphore:
+                return await self.aclassify(text, strategy, examples, max_retries)
+
+        return list(await asyncio.gather(*(classify_one(text) for text in texts)))
+
+    def classify_batch(
+        self,
+        texts: List[str],
+        strategy: PromptStrategy = PromptStrategy.DETAILED,
+        examples: Optional[List[Dict[str, str]]] = None,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 2,
+        max_batch_size: Optional[int] = None,
+    ) -> List[Optional[ClassificationResult]]:
+        """
+        Classify several 8-K filing texts with concurrent LLM requests.
+
+        Prompts are sent to the LLM together (up to ``max_batch_size`` per
+        round) so the server can process them in parallel; texts whose response
+        fails or cannot be parsed fall back to ``classify`` with the remaining
+        retries, run on a thread pool of the same size.
+
+        Args:
+            texts: Filing texts to classify
+            strategy: Prompt strategy to use
+            examples: Custom examples for few-shot learning
+            max_concurrency: Maximum number of LLM requests in flight
+                (defaults to ``OLLAMA_NUM_PARALLEL``, or 4)
+            max_retries: Maximum number of retries on parsing failure
+            max_batch_size: Maximum number of prompts built and sent per round
+                (all at once if None); bounds memory for very large inputs
+
+        Returns:
+            ClassificationResult (or None if failed) for each text, in order
+        """
+        unique = list(dict.fromkeys(texts))
+        if len(unique) < len(texts):
+            results = self.classify_batch(
+                unique, strategy, examples, max_concurrency, max_retries, max_batch_size
+            )
+            return self._fan_out(texts, unique, results)
+
+        results: List[Optional[ClassificationResult]] = [None] * len(texts)
+        pending, embeddings = self._prefilter(texts, results)
+        if not pending:
+            return results
+
+        max_concurrency = max_concurrency or default_max_concurrency()
+        step = max_batch_size or len(pending)
+        retry = []
+        for start in range(0, len(pending), step):
+            chunk = pending[start : start + step]
+            prompts = [self._generate_prompt(texts[i], strategy, examples) for i in chunk]
+            try:
+                responses = self.llm_client.generate_many(
+                    prompts, max_concurrency=max_concurrency, **self._generate_kwargs
+                )
+            except Exception as e:
+                self.logger.error(f"Error during batch classification: {e}")
+                responses = [e] * len(prompts)
+
+            for i, response in zip(chunk, responses):
+                if not isinstance(response, Exception) and response:
+                    results[i] = self._parse_response(response)
+                if results[i] is not None:
+                    self._store_result(embeddings.get(i), texts[i], results[i])
+                elif max_retries > 0:
+                    retry.append(i)
+
+        self._classify_each(
+            texts, retry, results, max_concurrency, strategy, examples, max_retries - 1
+        )
+        return results
+
+    def classify_batched(
+        self,
+        texts: List[str],
+        batch_size: int = 8,
+        max_concurrency: Optional[int] = None,
+        max_retries: int = 2,
+    ) -> List[Optional[ClassificationResult]]:
+        """
+        Classify 8-K filing texts several at a time in a single LLM request each.
+
+        Texts are packed ``batch_size`` per detailed prompt, so the instructions
+        and category list are sent once per batch instead of once per filing.
+        Filings missing from a batch's JSON answer, and every filing of a batch
+        whose answer cannot be parsed, fall back to ``classify``.
+
+        Args:
+            texts: Filing texts to classify
+            batch_size: Number of filings per LLM request
+            max_concurrency: Maximum number of LLM requests in flight
+                (defaults to ``OLLAMA_NUM_PARALLEL``, or 4)
+            max_retries: Maximum number of retries for the per-filing fallback
+
+        Returns:
+            ClassificationResult (or None if failed) for each text, in order
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+        unique = list(dict.fromkeys(texts))
+        if len(unique) < len(texts):
+            results = self.classify_batched(unique, batch_size, max_concurrency, max_retries)
+            return self._fan_out(texts, unique, results)
+
+        results: List[Optional[ClassificationResult]] = [None] * len(texts)
+        pending, embeddings = self._prefilter(texts, results)
+        if not pending:
+            return results
+
+        max_concurrency = max_concurrency or default_max_concurrency()
+        batches = [pending[start : start + batch_size] for start in range(0, len(pending), batch_size)]
+        prompts = [
+            ClassificationPrompts.batched_detailed_prompt(
+                [self._truncate(texts[i]) for i in batch], self._config_dicts
+            )
+            for batch in batches
+        ]
+        try:
+            responses = self.llm_client.generate_many(prompts, max_concurrency=max_concurrency)
+        except Exception as e:
+            self.logger.error(f"Error during batched classification: {e}")
+            responses = [e] * len(prompts)
+
+        retry = []
+        for batch, response in zip(batches, responses):
+            batch_results = None
+            if not isinstance(response, Exception) and response:
+                batch_results = validate_batched_classification_result(
+                    response, self.event_types, len(batch)
+                )
+            if batch_results is None:
+                self.logger.warning(
+                    f"Failed to parse batched LLM response for {len(batch)} filings, "
+                    "classifying them individually"
+                )
+                batch_results = [None] * len(batch)
+
+            for i, result in zip(batch, batch_results):
+                if result:
+                    self._apply_event_config(result)
+                    results[i] = result
+                    self._store_result(embeddings.get(i), texts[i], result)
+                else:
+                    retry.append(i)
+
+        self._classify_each(
+            texts, retry, results, max_concurrency, PromptStrategy.DETAILED, None, max_retries
+        )
+        return results
+
+    def _prefilter(
+        self, texts: List[str], results: List[Optional[ClassificationResult]]
+    ) -> Tuple[List[int], Dict[int, np.ndarray]]:
+        """
+        Fill ``results`` from the Item-code rules and the result cache.
+
+        Cache lookups for all texts the rules leave open share one embedding
+        pass and index query.
+
+        Returns:
+            (indices still needing the LLM, their embeddings for ``_store_result``)
+        """
+        pending = []
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+            results[i] = self._classify_by_rules(text)
+            if results[i] is None:
+                pending.append(i)
+        if not pending:
+            return pending, {}
+
+        cached, embeddings = self._lookup_results([texts[i] for i in pending])
+        if embeddings is None:
+            return pending, {}
+
+        remaining = []
+        pending_embeddings = {}
+        for i, result, embedding in zip(pending, cached, embeddings):
+            if result:
+                results[i] = result
+            else:
+                remaining.append(i)
+                pending_embeddings[i] = embedding
+        return remaining, pending_embeddings
+
+    def _fan_out(
+        self,
+        texts: List[str],
+        unique: List[str],
+        results: List[Optional[ClassificationResult]],
+    ) -> List[Optional[ClassificationResult]]:
+        """Map results for the distinct texts back onto ``texts``; repeats get copies."""
+        self.logger.debug(
+            f"Classified {len(unique)} distinct texts for {len(texts)} filings "
+            f"({len(texts) - len(unique)} duplicates)"
+        )
+        by_text = dict(zip(unique, results))
+        seen = set()
+        fanned_out = []
+        for text in texts:
+            result = by_text[text]
+            if text in seen and result is not None:
+                result = replace(result)
+            seen.add(text)
+            fanned_out.append(result)
+        return fanned_out
+
+    def _classify_each(
+        self,
+        texts: List[str],
+        indices: List[int],
+        results: List[Optional[ClassificationResult]],
+        max_workers: int,
+        strategy: PromptStrategy,
+        examples: Optional[List[Dict[str, str]]],
+        max_retries: int,
+    ) -> None:
+        """Run ``classify`` for ``texts[i]`` on a thread pool, storing into ``results[i]``."""
+        if not indices:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(indices))) as executor:
+            classified = executor.map(
+                lambda i: self.classify(texts[i], strategy, examples, max_retries=max_retries),
+                indices,
+            )
+            for i, result in zip(indices, classified):
+                results[i] = result
+
+    def validate_classification(self, text: str, result: ClassificationResult) -> bool:
+        """
+        Ask the LLM to double-check a classification.
+
+        Args:
+            text: The filing text that was classified
+            result: Classification to validate
+
+        Returns:
+            True if the LLM judges the classification VALID, False otherwise
+        """
+        classification = (
+            f"Event Type: {result.event_type}, Relevant: {str(result.relevant).lower()}"
+        )
+        prompt = ClassificationPrompts.validation_prompt(text, classification, self.event_types)
+
+        try:
+            response = self.llm_client.generate(prompt)
+        except Exception as e:
+            self.logger.error(f"Error during classification validation: {e}")
+            return False
+
+        return bool(response) and parse_validation_status(response)
+
+    def _lookup_result(self, text: str) -> Tuple[Optional[ClassificationResult], Optional[np.ndarray]]:
+        """
+        Look up a cached result for a near-duplicate filing text.
+
+        Returns:
+            (cached result or None, text embedding for storing a new result)
+        """
+        results, embeddings = self._lookup_results([text])
+        return results[0], None if embeddings is None else embeddings[0]
+
+    def _lookup_results(
+        self, texts: List[str]
+    ) -> Tuple[List[Optional[ClassificationResult]], Optional[np.ndarray]]:
+        """
+        Look up cached results for several filing texts with one embedding pass.
+
+        Returns:
+            (cached result or None per text, text embeddings or None without a cache)
+        """
+        if self.result_cache is None:
+            return [None] * len(texts), None
+
+        embeddings = self.result_cache.embed_many([self._result_key(text) for text in texts])
+        results: List[Optional[ClassificationResult]] = []
+        for cached in self.result_cache.search_many(embeddings):
+            result = self._parse_response(cached) if cached is not None else None
+            if result:
+                self.logger.debug("Reused classification of a near-duplicate filing")
+            results.append(result)
+        return results, embeddings
+
+    def _store_result(
+        self, embedding: Optional[np.ndarray], text: str, result: ClassificationResult
+    ) -> None:
+        """Cache an LLM classification under the filing text's embedding."""
+        if self.result_cache is not None and embedding is not None:
+            self.result_cache.add(embedding, self._result_key(text), result.raw_response)
+
+    @staticmethod
+    def _result_key(text: str) -> str:
+        """
+        Return the part of a filing the result cache embeds: everything from the
+        first Item heading on.
+
+        The embedder only reads the first few hundred tokens, which for the full
+        text is mostly the issuer's cover page, so two different 8-Ks from one
+        company would otherwise look alike.
+        """
+        match = ITEM_RE.search(text)
+        return text[match.start():] if match else text
+
+    def _classify_by_rules(self, text: str) -> Optional[ClassificationResult]:
+        """Classify from 8-K Item codes, or return None to fall through to the LLM."""
+
+        if self.fast_classifier is None:
+            return None
+
+        result = self.fast_classifier.classify(text)
+        if result:
+            self._apply_event_config(result)
+            self.logger.info(
+                f"Classified by rule ({result.raw_response}) as: {result.event_type} "
+                f"(relevant: {result.relevant})"
+            )
+        return result
+
+    def _apply_event_config(self, result: ClassificationResult) -> None:
+        """Set the result's relevance from the event configuration."""
+        event_config = self.event_configs.get(result.event_type)
+        if event_config:
+            result.relevant = event_config.relevant
+
+    def _parse_response(self, response: str) -> Optional[ClassificationResult]:
+        """Parse an LLM response and apply the configured relevance."""
+
+        result = validate_classification_result(response, self.event_types)
+        if not result:
+            return None
+
+        # Add configuration info to result
+        self._apply_event_config(result)
+
+        self.logger.info(
+            f"Successfully classified as: {result.event_type} (relevant: {result.relevant})"
+        )
+        return result
+
     def _generate_prompt(
         self, text: str, strategy: PromptStrategy, examples: Optional[List[Dict[str, str]]] = None
     ) -> str:
         """
         Generate prompt based on strategy.
 
+        Text beyond ``max_input_chars`` is truncated.
+
         Args:
             text: Filing text to classify
             strategy: Prompt strategy to use
@@ -137,25 +669,45 @@ class EventClassifier:
         Returns:
             Generated prompt string
         """
-        if strategy == PromptStrategy.BASIC:
-            return ClassificationPrompts.basic_classification_prompt(text, self.event_types)
-
-        elif strategy == PromptStrategy.DETAILED:
-            # Convert EventConfig objects to dictionaries for prompt generation
-            config_dicts = {}
-            for event_type, config in self.event_configs.items():
-                config_dicts[event_type] = {
-                    "relevant": config.relevant,
-                    "description": config.description,
-                    "keywords": config.keywords,
-                }
-            return ClassificationPrompts.detailed_classification_prompt(text, config_dicts)
-
-        elif strategy == PromptStrategy.CHAIN_OF_THOUGHT:
-            return ClassificationPrompts.chain_of_thought_prompt(text, self.event_types)
-
-        elif strategy == PromptStrategy.FEW_SHOT:
-            return ClassificationPrompts.few_shot_prompt(text, self.event_types, examples)
+        text = self._truncate(text)
+
+        if examples is None and strategy in self._prompt_parts:
+            prefix, suffix = self._prompt_parts[strategy]
+            return "".join((prefix, text, suffix))
+
+        return self._render_prompt(text, strategy, examples)
+
+    def _truncate(self, text: str) -> str:
+        """Cut filing text to ``max_input_chars``, logging when anything is dropped."""
+        if self.max_input_chars and len(text) > self.max_input_chars:
+            self.logger.info(
+                f"Truncating filing text from {len(text)} to {self.max_input_chars} characters"
+            )
+            return text[: self.max_input_chars]
+        return text
+
+    def _shared_prompt_parts(
+        self, strategy: PromptStrategy, config_key: Tuple[Any, ...]
+    ) -> Tuple[str, str]:
+        """Return the process-wide (prefix, suffix) for a strategy, rendering it on first use."""
+
+        key = (strategy, config_key)
+        parts = _PROMPT_PARTS.get(key)
+        if parts is None:
+            parts = ClassificationPrompts.split_prompt(
+                lambda text: self._render_prompt(text, strategy)
+            )
+            with _PROMPT_PARTS_LOCK:
+                parts = _PROMPT_PARTS.setdefault(key, parts)
+        return parts
+
+    def _render_prompt(
+        self, text: str, strategy: PromptStrategy, examples: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """Render the full prompt template for a strategy."""
 
-        else:
+        render = _STRATEGY_DISPATCH.get(strategy)
+        if render is None:
             raise ValueError(f"Unknown prompt strategy: {strategy}")
+
+        return render(self, text, examples)
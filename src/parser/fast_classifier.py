@@ -0,0 +1,94 @@
+"""Rule-based prefilter that classifies unambiguous 8-K filings without the LLM."""
+
+import logging
+import re
+import threading
+from typing import Dict, Iterable, Optional
+
+from .schema.event_types import ClassificationResult
+
+# 8-K Item codes that map to exactly one event category
+ITEM_EVENT_TYPES = {
+    "1.03": "Corporate Restructuring",  # Bankruptcy or Receivership
+    "2.02": "Financial Event",  # Results of Operations and Financial Condition
+    "2.03": "Capital Market Event",  # Creation of a Direct Financial Obligation
+    "2.05": "Corporate Restructuring",  # Costs Associated with Exit or Disposal Activities
+    "3.02": "Capital Market Event",  # Unregistered Sales of Equity Securities
+    "5.02": "Personnel Change",  # Departure/Election of Directors or Officers
+}
+
+# Items that accompany other items and carry no event signal of their own
+NEUTRAL_ITEMS = frozenset({"7.01", "9.01"})  # Regulation FD Disclosure, Exhibits
+
+# Item headings, e.g. "Item 2.02 Results of Operations" or "ITEM 5.02."
+ITEM_RE = re.compile(r"\bItem\s+(\d\.\d{2})\b", re.IGNORECASE)
+
+
+class FastClassifier:
+    """
+    Classify filings whose 8-K Item codes identify a single event type.
+
+    A filing is classified only when every substantive Item it reports maps to
+    the same event type; anything else (unmapped Items, conflicting Items or no
+    Items at all) falls through to the LLM.
+    """
+
+    def __init__(self, event_types: Iterable[str], item_event_types: Optional[Dict[str, str]] = None):
+        """
+        Initialize the prefilter.
+
+        Args:
+            event_types: Configured event types; rules for other types are dropped
+            item_event_types: Item code to event type mapping (defaults to ITEM_EVENT_TYPES)
+        """
+        self.logger = logging.getLogger(__name__)
+        valid_types = set(event_types)
+        mapping = ITEM_EVENT_TYPES if item_event_types is None else item_event_types
+        self.item_event_types = {
+            item: event_type for item, event_type in mapping.items() if event_type in valid_types
+        }
+        self.calls = 0
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of filings classified without the LLM."""
+        return self.hits / self.calls if self.calls else 0.0
+
+    def classify(self, text: str) -> Optional[ClassificationResult]:
+        """
+        Classify a filing from its Item codes.
+
+        Args:
+            text: Extracted filing text
+
+        Returns:
+            ClassificationResult if the Items identify one event type, None otherwise
+        """
+        items = set(ITEM_RE.findall(text)) - NEUTRAL_ITEMS
+        event_types = {self.item_event_types.get(item) for item in items}
+
+        result = None
+        if len(event_types) == 1 and None not in event_types:
+            event_type = event_types.pop()
+            matched = ", ".join(sorted(items))
+            result = ClassificationResult(
+                event_type=event_type,
+                relevant=False,
+                confidence=0.99,
+                reasoning=f"Filing reports 8-K Item {matched}, which maps to {event_type}.",
+                raw_response=f"rule:Item {matched}",
+            )
+
+        with self._lock:
+            self.calls += 1
+            if result:
+                self.hits += 1
+
+        if result:
+            self.logger.debug(
+                f"Rule match {result.raw_response} -> {result.event_type} "
+                f"(hit rate {self.hit_rate:.0%} over {self.calls} filings)"
+            )
+        return result
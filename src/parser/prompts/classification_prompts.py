@@ -1,20 +1,62 @@
 """Prompt templates for LLM-based event classification."""
 
-from typing import Dict, List, Any
+import functools
+from typing import Callable, Dict, List, Any, Tuple
 
 from .prompt_templates import (
-    BASIC_CLASSIFICATION_TEMPLATE,
-    DETAILED_CLASSIFICATION_TEMPLATE,
-    CHAIN_OF_THOUGHT_TEMPLATE,
-    FEW_SHOT_TEMPLATE,
-    VALIDATION_TEMPLATE,
+    BASIC_CLASSIFICATION_RENDER,
+    DETAILED_CLASSIFICATION_RENDER,
+    BATCHED_DETAILED_CLASSIFICATION_RENDER,
+    CHAIN_OF_THOUGHT_RENDER,
+    FEW_SHOT_RENDER,
+    VALIDATION_RENDER,
     DEFAULT_FEW_SHOT_EXAMPLES,
 )
 
 
+# Stand-in for the filing text when rendering the static parts of a prompt
+TEXT_PLACEHOLDER = "\x00FILING_TEXT\x00"
+
+
+@functools.lru_cache(maxsize=32)
+def _joined(event_types: Tuple[str, ...]) -> str:
+    """Comma-separated event type list, built once per taxonomy."""
+    return ", ".join(event_types)
+
+
+@functools.lru_cache(maxsize=32)
+def _descriptions(event_configs: Tuple[Tuple[str, str, Tuple[str, ...]], ...]) -> str:
+    """Event description block for (event_type, description, keywords) tuples."""
+    event_descriptions = []
+
+    for event_type, description, keywords in event_configs:
+        if keywords:
+            event_descriptions.append(
+                f"- {event_type}: {description} (Keywords: {', '.join(keywords)})"
+            )
+        else:
+            event_descriptions.append(f"- {event_type}: {description}")
+
+    return "\n".join(event_descriptions)
+
+
 class ClassificationPrompts:
     """Collection of prompt templates for event classification."""
 
+    @staticmethod
+    def split_prompt(render: Callable[[str], str]) -> Tuple[str, str]:
+        """
+        Render a prompt once and split it around the filing text.
+
+        Args:
+            render: Function building the full prompt from the filing text
+
+        Returns:
+            (prefix, suffix) such that ``prefix + text + suffix == render(text)``
+        """
+        prefix, suffix = render(TEXT_PLACEHOLDER).split(TEXT_PLACEHOLDER, 1)
+        return prefix, suffix
+
     @staticmethod
     def basic_classification_prompt(text: str, event_types: List[str]) -> str:
         """
@@ -27,11 +69,30 @@ class ClassificationPrompts:
         Returns:
             Formatted prompt string
         """
-        return BASIC_CLASSIFICATION_TEMPLATE.format(
+        return BASIC_CLASSIFICATION_RENDER(
             text=text,
-            event_types=", ".join(event_types)
+            event_types=_joined(tuple(event_types))
         )
 
+    @staticmethod
+    def batch_basic_prompt(texts: List[str], event_types: List[str]) -> List[str]:
+        """
+        Generate basic classification prompts for several filings.
+
+        The prompts share an identical static prefix, so an inference server
+        with prefix caching or batched decoding only prefills it once; send
+        them together (e.g. ``LLMClient.generate_many``).
+
+        Args:
+            texts: 8-K filing texts to classify
+            event_types: List of possible event types
+
+        Returns:
+            One formatted prompt per text, in order
+        """
+        joined = _joined(tuple(event_types))
+        return [BASIC_CLASSIFICATION_RENDER(text=text, event_types=joined) for text in texts]
+
     @staticmethod
     def detailed_classification_prompt(text: str, event_configs: Dict[str, Any]) -> str:
         """
@@ -44,23 +105,42 @@ class ClassificationPrompts:
         Returns:
             Formatted prompt string
         """
-        # Build event type descriptions
-        event_descriptions = []
+        return DETAILED_CLASSIFICATION_RENDER(
+            text=text,
+            event_descriptions=ClassificationPrompts._event_descriptions(event_configs)
+        )
+
+    @staticmethod
+    def batched_detailed_prompt(texts: List[str], event_configs: Dict[str, Any]) -> str:
+        """
+        Generate a detailed classification prompt for several filings at once.
 
-        for event_type, config in event_configs.items():
-            description = config.get("description", "")
-            keywords = config.get("keywords", [])
+        The model is asked for a JSON array with one object per filing, keyed
+        by the filing's 1-based position in ``texts``.
 
-            desc_text = f"- {event_type}: {description}"
-            if keywords:
-                desc_text += f" (Keywords: {', '.join(keywords)})"
-            event_descriptions.append(desc_text)
+        Args:
+            texts: 8-K filing texts to classify
+            event_configs: Dictionary of event configurations with descriptions
 
-        return DETAILED_CLASSIFICATION_TEMPLATE.format(
-            text=text,
-            event_descriptions=chr(10).join(event_descriptions)
+        Returns:
+            Formatted prompt string
+        """
+        filings = "\n\n".join(f"Filing {i}:\n{text}" for i, text in enumerate(texts, 1))
+
+        return BATCHED_DETAILED_CLASSIFICATION_RENDER(
+            count=len(texts),
+            filings=filings,
+            event_descriptions=ClassificationPrompts._event_descriptions(event_configs)
         )
 
+    @staticmethod
+    def _event_descriptions(event_configs: Dict[str, Any]) -> str:
+        """Format one line per event type with its description and keywords."""
+        return _descriptions(tuple(
+            (event_type, config.get("description", ""), tuple(config.get("keywords", [])))
+            for event_type, config in event_configs.items()
+        ))
+
     @staticmethod
     def chain_of_thought_prompt(text: str, event_types: List[str]) -> str:
         """
@@ -73,9 +153,9 @@ class ClassificationPrompts:
         Returns:
             Formatted prompt string
         """
-        return CHAIN_OF_THOUGHT_TEMPLATE.format(
+        return CHAIN_OF_THOUGHT_RENDER(
             text=text,
-            event_types=", ".join(event_types)
+            event_types=_joined(tuple(event_types))
         )
 
     @staticmethod
@@ -97,19 +177,21 @@ class ClassificationPrompts:
             examples = DEFAULT_FEW_SHOT_EXAMPLES
 
         # Build examples section
-        examples_text = []
+        parts = []
         for i, example in enumerate(examples, 1):
-            examples_text.append(f"Example {i}:")
-            examples_text.append(f"Text: {example['text']}")
-            examples_text.append("REASONING:")
-            examples_text.append(example.get('reasoning', 'Analysis of the key factors and materiality.'))
-            examples_text.append("CLASSIFICATION:")
-            examples_text.append(f"{example['classification']}")
-            examples_text.append("")
-
-        return FEW_SHOT_TEMPLATE.format(
-            event_types=", ".join(event_types),
-            examples_text=chr(10).join(examples_text),
+            parts.extend([
+                f"Example {i}:\n",
+                f"Text: {example['text']}\n",
+                "REASONING:\n",
+                example.get('reasoning', 'Analysis of the key factors and materiality.'),
+                "\nCLASSIFICATION:\n",
+                example['classification'],
+                "\n\n",
+            ])
+
+        return FEW_SHOT_RENDER(
+            event_types=_joined(tuple(event_types)),
+            examples_text="".join(parts)[:-1],  # single newline after the last example
             text=text
         )
 
@@ -126,10 +208,10 @@ class ClassificationPrompts:
         Returns:
             Validation prompt string
         """
-        return VALIDATION_TEMPLATE.format(
+        return VALIDATION_RENDER(
             text=text,
             classification=classification,
-            event_types=", ".join(event_types)
+            event_types=_joined(tuple(event_types))
         )
 
 
@@ -1,9 +1,48 @@
 """String constants for LLM prompt templates."""
 
-# Basic classification prompt template
-BASIC_CLASSIFICATION_TEMPLATE = """Classify the following 8-K filing event:
+from string import Formatter
+from typing import Callable
 
-{text}
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Split a ``str.format`` template into literal chunks and field names once.
+
+    Args:
+        template: Template with plain ``{name}`` fields
+
+    Returns:
+        Function rendering the template from keyword arguments, equivalent to
+        ``template.format(**fields)`` without re-parsing the template per call
+    """
+    literals = [""]
+    names = []
+    for literal, name, spec, conversion in Formatter().parse(template):
+        literals[-1] += literal
+        if name is not None:
+            if spec or conversion:
+                raise ValueError(f"Unsupported template field: {{{name}!{conversion}:{spec}}}")
+            names.append(name)
+            literals.append("")
+
+    head, tail = literals[0], tuple(zip(names, literals[1:]))
+
+    def render(**fields) -> str:
+        parts = [head]
+        for name, literal in tail:
+            parts.append(str(fields[name]))
+            parts.append(literal)
+        return "".join(parts)
+
+    return render
+
+
+# Prompt templates keep all static text (instructions, categories, output format)
+# ahead of the filing, so consecutive prompts share the longest possible prefix
+# and the model server can reuse its cached prefill for it.
+
+# Basic classification prompt template
+BASIC_CLASSIFICATION_TEMPLATE = """Classify the following 8-K filing event.
 
 Choose from these categories:
 {event_types}
@@ -19,14 +58,14 @@ REASONING:
 CLASSIFICATION:
 Event Type: [Category], Relevant: [true/false]
 
-Begin your analysis:"""
-
-# Detailed classification prompt template  
-DETAILED_CLASSIFICATION_TEMPLATE = """You are an expert financial analyst. Classify the following 8-K filing event:
-
 Filing Content:
 {text}
 
+Begin your analysis:"""
+
+# Detailed classification prompt template
+DETAILED_CLASSIFICATION_TEMPLATE = """You are an expert financial analyst. Classify the 8-K filing event given at the end.
+
 Event Categories:
 {event_descriptions}
 
@@ -61,13 +100,37 @@ REASONING:
 CLASSIFICATION:
 Event Type: [Category], Relevant: [true/false]
 
+Filing Content:
+{text}
+
 Begin your analysis:"""
 
-# Chain of thought prompt template
-CHAIN_OF_THOUGHT_TEMPLATE = """Analyze this 8-K filing step by step:
+# Batched detailed classification prompt template (several filings per request)
+BATCHED_DETAILED_CLASSIFICATION_TEMPLATE = """You are an expert financial analyst. Classify each of the 8-K filing events given at the end independently.
 
-Filing Content:
-{text}
+Event Categories:
+{event_descriptions}
+
+Instructions:
+1. Read each filing carefully
+2. Identify the main business event it reports
+3. Choose the most appropriate category from the list above
+4. Determine if the event is relevant/significant for investors
+
+An event is RELEVANT if it could materially impact stock price, financial
+performance, business operations, competitive position or strategic direction.
+Routine administrative filings, minor operational changes, scheduled announcements
+and immaterial events are NOT RELEVANT.
+
+Respond with a JSON array containing exactly one object per filing, in order:
+[{{"id": 1, "event_type": "[Category]", "relevant": [true/false], "reasoning": "[One or two sentences]"}}, ...]
+
+{filings}
+
+Respond with a JSON array of {count} objects only:"""
+
+# Chain of thought prompt template
+CHAIN_OF_THOUGHT_TEMPLATE = """Analyze the 8-K filing given at the end step by step.
 
 Available Categories:
 {event_types}
@@ -92,20 +155,15 @@ Step 3: Assess significance
 CLASSIFICATION:
 Event Type: [Category], Relevant: [true/false]
 
+Filing Content:
+{text}
+
 Begin your step-by-step analysis:"""
 
 # Few shot prompt template
 FEW_SHOT_TEMPLATE = """Classify 8-K filing events into these categories:
 {event_types}
 
-Here are some examples of the expected format:
-
-{examples_text}
-
-Now classify this filing using the same structure:
-
-Text: {text}
-
 Please provide your response in this exact structure:
 
 REASONING:
@@ -114,15 +172,18 @@ REASONING:
 CLASSIFICATION:
 Event Type: [Category], Relevant: [true/false]
 
-Begin your analysis:"""
+Here are some examples of the expected format:
 
-# Validation prompt template
-VALIDATION_TEMPLATE = """Please validate this event classification:
+{examples_text}
 
-Original Filing:
-{text}
+Now classify this filing using the same structure:
 
-Proposed Classification: {classification}
+Text: {text}
+
+Begin your analysis:"""
+
+# Validation prompt template
+VALIDATION_TEMPLATE = """Please validate this event classification of the 8-K filing given at the end.
 
 Valid Categories: {event_types}
 
@@ -139,6 +200,11 @@ VALIDATION:
 Status: [VALID or INVALID]
 Issues: [If INVALID, describe the specific problems]
 
+Original Filing:
+{text}
+
+Proposed Classification: {classification}
+
 Begin your validation analysis:"""
 
 # Default examples for few-shot prompting
@@ -158,4 +224,12 @@ DEFAULT_FEW_SHOT_EXAMPLES = [
         "reasoning": "Executive appointments at the CTO level can signal strategic direction changes and are relevant for investor assessment of company leadership and technology strategy.",
         "classification": "Event Type: Personnel Change, Relevant: true",
     },
-] 
\ No newline at end of file
+] 
+
+# Precompiled renderers for the templates above
+BASIC_CLASSIFICATION_RENDER = _compile_template(BASIC_CLASSIFICATION_TEMPLATE)
+DETAILED_CLASSIFICATION_RENDER = _compile_template(DETAILED_CLASSIFICATION_TEMPLATE)
+BATCHED_DETAILED_CLASSIFICATION_RENDER = _compile_template(BATCHED_DETAILED_CLASSIFICATION_TEMPLATE)
+CHAIN_OF_THOUGHT_RENDER = _compile_template(CHAIN_OF_THOUGHT_TEMPLATE)
+FEW_SHOT_RENDER = _compile_template(FEW_SHOT_TEMPLATE)
+VALIDATION_RENDER = _compile_template(VALIDATION_TEMPLATE)
@@ -1,24 +1,29 @@
 """Event type definitions and schemas for 8-K classification."""
 
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, field, replace
 
+from ...llm.json_utils import load_json_file, loads
 
-@dataclass
+
+@dataclass(slots=True)
 class EventConfig:
     """Configuration for event types and their relevance criteria."""
 
     event_type: str
     relevant: bool
     description: str = ""
-    keywords: List[str] = None
+    keywords: List[str] = field(default_factory=list)
 
     def __post_init__(self):
         if self.keywords is None:
             self.keywords = []
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassificationResult:
     """Result of event classification."""
 
@@ -41,6 +46,54 @@ class ClassificationResult:
 
 # No hardcoded defaults - all configuration comes from config files
 
+# Structured reasoning sections, tried in order
+_REASONING_RES = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"REASONING:\s*(.+?)(?=CLASSIFICATION:|$)",
+        r"reasoning:\s*(.+?)(?=classification:|event type:|$)",
+        r"analysis:\s*(.+?)(?=classification:|event type:|$)",
+    )
+)
+
+# Single-line reasoning, used when no structured section is found
+_LEGACY_REASONING_RES = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r"reasoning:\s*(.+?)(?:\n|$)",
+        r"because:\s*(.+?)(?:\n|$)",
+        r"explanation:\s*(.+?)(?:\n|$)",
+    )
+)
+
+# Event type and relevance, e.g. "Event Type: [Category], Relevant: [true/false]"
+_CLASSIFICATION_RES = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"Event Type:\s*([^,]+),\s*Relevant:\s*(true|false)",
+        r"CLASSIFICATION:\s*Event Type:\s*([^,]+),\s*Relevant:\s*(true|false)",
+        r"Type:\s*([^,]+),\s*Relevant:\s*(true|false)",
+        r"Classification:\s*([^,]+),\s*Significant:\s*(true|false)",
+        # Fallback pattern
+        r"([^:,\n]+):\s*(true|false|yes|no)",
+    )
+)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Validation verdicts; the VALIDATION block sits at the end of the response
+_VALID_RE = re.compile(r"\bVALID\b(?!\s*INVALID)", re.IGNORECASE)
+_INVALID_RE = re.compile(r"\bINVALID\b", re.IGNORECASE)
+_VALIDATION_TAIL_CHARS = 512
+
+# Matches once a response's CLASSIFICATION line is complete; used to stop streaming
+CLASSIFICATION_STOP_PATTERN = (
+    r"(?i)CLASSIFICATION:\s*Event Type:\s*[^,\n]+,\s*Relevant:\s*(?:true|false)"
+)
+
+# Optional fields of an event configuration entry and their JSON types
+_EVENT_CONFIG_FIELDS = {"relevant": bool, "description": str, "keywords": list}
+
 
 def load_event_config(config_dict: Dict[str, Any]) -> Dict[str, EventConfig]:
     """
@@ -51,20 +104,42 @@ def load_event_config(config_dict: Dict[str, Any]) -> Dict[str, EventConfig]:
 
     Returns:
         Dictionary of EventConfig objects
+
+    Raises:
+        ValueError: If an entry does not match the event configuration schema
     """
     configs = {}
 
     for event_type, config in config_dict.items():
+        _check_event_config(event_type, config)
         configs[event_type] = EventConfig(
             event_type=event_type,
             relevant=config.get("relevant", False),
             description=config.get("description", ""),
-            keywords=config.get("keywords", []),
+            # Copied so the cached, shared JSON from load_json_file is never mutated
+            keywords=list(config.get("keywords") or []),
         )
 
     return configs
 
 
+def _check_event_config(event_type: Any, config: Any) -> None:
+    """Raise ValueError if one event configuration entry has the wrong shape."""
+    if not isinstance(event_type, str) or not isinstance(config, dict):
+        raise ValueError(f"Invalid event configuration for {event_type!r}: expected an object")
+
+    for key, expected in _EVENT_CONFIG_FIELDS.items():
+        value = config.get(key)
+        if value is not None and not isinstance(value, expected):
+            raise ValueError(
+                f"Invalid event configuration for {event_type!r}: "
+                f"'{key}' must be {expected.__name__}, got {type(value).__name__}"
+            )
+
+    if not all(isinstance(keyword, str) for keyword in config.get("keywords") or ()):
+        raise ValueError(f"Invalid event configuration for {event_type!r}: keywords must be strings")
+
+
 def load_default_event_config(
     config_file_path: str = "config/event_config.json",
 ) -> Dict[str, EventConfig]:
@@ -77,20 +152,16 @@ def load_default_event_config(
     Returns:
         Dictionary of EventConfig objects
     """
-    import json
-    import os
-
     if not os.path.exists(config_file_path):
         raise FileNotFoundError(f"Event configuration file not found: {config_file_path}")
 
-    with open(config_file_path, "r") as f:
-        config_dict = json.load(f)
+    config_dict = load_json_file(config_file_path)
 
     return load_event_config(config_dict)
 
 
 def validate_classification_result(
-    result: str, valid_event_types: List[str]
+    result: str, valid_event_types: Sequence[str]
 ) -> Optional[ClassificationResult]:
     """
     Parse and validate LLM classification result.
@@ -102,39 +173,57 @@ def validate_classification_result(
     Returns:
         ClassificationResult if valid, None otherwise
     """
-    import re
+    return _parse_classification(result, _event_type_lookup(tuple(valid_event_types)))
+
+
+def validate_many(
+    results: Sequence[str], valid_event_types: Sequence[str]
+) -> List[Optional[ClassificationResult]]:
+    """
+    Parse and validate several LLM classification results.
+
+    Each distinct response is parsed once; repeats (common in evaluation
+    sweeps at temperature 0) get a copy of the first result.
+
+    Args:
+        results: Raw LLM responses
+        valid_event_types: List of valid event type names
+
+    Returns:
+        ClassificationResult (or None if invalid) for each response, in order
+    """
+    lookup = _event_type_lookup(tuple(valid_event_types))
+    parsed: Dict[str, Optional[ClassificationResult]] = {}
+    validated = []
+    for result in results:
+        if result in parsed:
+            first = parsed[result]
+            validated.append(first and replace(first))
+        else:
+            parsed[result] = _parse_classification(result, lookup)
+            validated.append(parsed[result])
+    return validated
+
+
+def _parse_classification(
+    result: str, lookup: Dict[str, str]
+) -> Optional[ClassificationResult]:
+    """Parse one classification response against a prebuilt event type lookup."""
 
     # Extract reasoning section first
     reasoning = ""
-    reasoning_patterns = [
-        r"REASONING:\s*(.+?)(?=CLASSIFICATION:|$)",
-        r"reasoning:\s*(.+?)(?=classification:|event type:|$)",
-        r"analysis:\s*(.+?)(?=classification:|event type:|$)",
-    ]
-    
-    for pattern in reasoning_patterns:
-        reason_match = re.search(pattern, result, re.IGNORECASE | re.DOTALL)
+    for pattern in _REASONING_RES:
+        reason_match = pattern.search(result)
         if reason_match:
-            reasoning = reason_match.group(1).strip()
-            # Clean up reasoning text
-            reasoning = re.sub(r'\n+', ' ', reasoning)  # Replace multiple newlines with space
-            reasoning = re.sub(r'\s+', ' ', reasoning)  # Replace multiple spaces with single space
+            # Collapse newlines and repeated spaces to single spaces
+            reasoning = _WHITESPACE_RE.sub(" ", reason_match.group(1).strip())
             break
 
     # Try to parse the classification result
     # Expected format: "Event Type: [Category], Relevant: [true/false]"
-    classification_patterns = [
-        r"Event Type:\s*([^,]+),\s*Relevant:\s*(true|false)",
-        r"CLASSIFICATION:\s*Event Type:\s*([^,]+),\s*Relevant:\s*(true|false)",
-        r"Type:\s*([^,]+),\s*Relevant:\s*(true|false)",
-        r"Classification:\s*([^,]+),\s*Significant:\s*(true|false)",
-        # Fallback patterns
-        r"([^:,\n]+):\s*(true|false|yes|no)",
-    ]
-
     match = None
-    for pattern in classification_patterns:
-        match = re.search(pattern, result, re.IGNORECASE)
+    for pattern in _CLASSIFICATION_RES:
+        match = pattern.search(result)
         if match:
             break
 
@@ -144,20 +233,7 @@ def validate_classification_result(
     event_type = match.group(1).strip()
     relevant_str = match.group(2).strip().lower()
 
-    # Normalize event type
-    event_type_clean = None
-    for valid_type in valid_event_types:
-        if event_type.lower() == valid_type.lower():
-            event_type_clean = valid_type
-            break
-
-    if not event_type_clean:
-        # Try partial matching
-        for valid_type in valid_event_types:
-            if valid_type.lower() in event_type.lower() or event_type.lower() in valid_type.lower():
-                event_type_clean = valid_type
-                break
-
+    event_type_clean = _lookup_event_type(event_type, lookup)
     if not event_type_clean:
         return None
 
@@ -166,14 +242,8 @@ def validate_classification_result(
 
     # If we didn't find reasoning in structured format, try legacy patterns
     if not reasoning:
-        legacy_reasoning_patterns = [
-            r"reasoning:\s*(.+?)(?:\n|$)",
-            r"because:\s*(.+?)(?:\n|$)",
-            r"explanation:\s*(.+?)(?:\n|$)",
-        ]
-
-        for pattern in legacy_reasoning_patterns:
-            reason_match = re.search(pattern, result, re.IGNORECASE | re.DOTALL)
+        for pattern in _LEGACY_REASONING_RES:
+            reason_match = pattern.search(result)
             if reason_match:
                 reasoning = reason_match.group(1).strip()
                 break
@@ -185,3 +255,104 @@ def validate_classification_result(
         reasoning=reasoning,
         raw_response=result,
     )
+
+
+def validate_batched_classification_result(
+    result: str, valid_event_types: Sequence[str], count: int
+) -> Optional[List[Optional[ClassificationResult]]]:
+    """
+    Parse and validate a JSON-array LLM response for a batch of filings.
+
+    Args:
+        result: Raw LLM response, expected to contain a JSON array of
+            ``{"id", "event_type", "relevant", "reasoning"}`` objects
+        valid_event_types: List of valid event type names
+        count: Number of filings in the batch
+
+    Returns:
+        ClassificationResult (or None if missing or invalid) for each filing by
+        position, or None if the response is not a JSON array
+    """
+    start, end = result.find("["), result.rfind("]")
+    if start == -1 or end < start:
+        return None
+
+    try:
+        items = loads(result[start : end + 1].encode("utf-8"))
+    except ValueError:
+        return None
+
+    if not isinstance(items, list):
+        return None
+
+    lookup = _event_type_lookup(tuple(valid_event_types))
+    results: List[Optional[ClassificationResult]] = [None] * count
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+
+        index = item.get("id")
+        if not isinstance(index, int) or not 1 <= index <= count:
+            continue
+
+        event_type = _lookup_event_type(str(item.get("event_type", "")), lookup)
+        if not event_type:
+            continue
+
+        relevant = item.get("relevant", False)
+        if isinstance(relevant, str):
+            relevant = relevant.strip().lower() in ["true", "yes", "1"]
+
+        results[index - 1] = ClassificationResult(
+            event_type=event_type,
+            relevant=bool(relevant),
+            confidence=0.8,  # Default confidence
+            reasoning=str(item.get("reasoning", "")),
+            raw_response=f"Event Type: {event_type}, Relevant: {str(bool(relevant)).lower()}",
+        )
+
+    return results
+
+
+def parse_validation_status(response: str) -> bool:
+    """
+    Decide whether a validation-prompt response accepts the classification.
+
+    Only the tail of the response is searched, where the VALIDATION block is.
+
+    Args:
+        response: Raw LLM response to a validation prompt
+
+    Returns:
+        True if the response says VALID and nowhere INVALID, False otherwise
+    """
+    tail = response[-_VALIDATION_TAIL_CHARS:]
+    return bool(_VALID_RE.search(tail)) and not _INVALID_RE.search(tail)
+
+
+@lru_cache(maxsize=32)
+def _event_type_lookup(valid_event_types: Tuple[str, ...]) -> Dict[str, str]:
+    """Map each valid type name, and its lowercase form, to the canonical name."""
+    lookup = {valid_type: valid_type for valid_type in valid_event_types}
+    for valid_type in valid_event_types:
+        lookup.setdefault(valid_type.lower(), valid_type)
+    return lookup
+
+
+def _lookup_event_type(event_type: str, lookup: Dict[str, str]) -> Optional[str]:
+    """Resolve an event type via exact, then case-insensitive, then partial match."""
+    event_type = event_type.strip()
+    if not event_type:
+        return None
+
+    event_type_lower = event_type.lower()
+    match = lookup.get(event_type) or lookup.get(event_type_lower)
+    if match:
+        return match
+
+    # Try partial matching, in configured order
+    for valid_type in dict.fromkeys(lookup.values()):
+        if valid_type.lower() in event_type_lower or event_type_lower in valid_type.lower():
+            return valid_type
+
+    return None
@@ -1,142 +1,647 @@
-"""Simple text extractor for 8-K filings using BeautifulSoup."""
+"""Simple text extractor for 8-K filings using BeautifulSoup or selectolax (lexbor)."""
 
+import codecs
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
 from bs4 import BeautifulSoup # type: ignore
+from bs4.element import Tag  # type: ignore
+from lxml import etree  # type: ignore
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+except ImportError:  # pragma: no cover - selectolax is optional
+    LexborHTMLParser = None
+
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - pyahocorasick is optional
+    ahocorasick = None
+
+try:
+    import numpy as np
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+
+if njit is not None:
+
+    # Not cached on disk: the cache records the importing module's name, and
+    # this module can be imported both as src.parser and (via sys.path) as parser
+    @njit
+    def _collapse_whitespace(buf):
+        """Collapse space/tab runs to one space and cap newline runs at two."""
+        out = np.empty_like(buf)
+        n = 0
+        newlines = 0
+        in_space = False
+        for i in range(buf.shape[0]):
+            byte = buf[i]
+            if byte == 32 or byte == 9:  # space, tab
+                newlines = 0
+                if not in_space:
+                    out[n] = 32
+                    n += 1
+                    in_space = True
+            elif byte == 10:  # newline
+                in_space = False
+                newlines += 1
+                if newlines <= 2:
+                    out[n] = 10
+                    n += 1
+            else:
+                in_space = False
+                newlines = 0
+                out[n] = byte
+                n += 1
+        return out[:n]
+
+else:
+    _collapse_whitespace = None
+
+_TAB_TO_SPACE = str.maketrans("\t", " ")
+
+
+# Tags to remove completely
+REMOVE_TAGS = (
+    "script",
+    "style",
+    "meta",
+    "link",
+    "head",
+    "title",
+    "nav",
+    "noscript",
+    "iframe",
+    "button",
+    "input",
+    "img",
+)
+_REMOVE_TAG_SET = frozenset(REMOVE_TAGS)
+
+# String types BeautifulSoup's get_text() reads from ordinary tags
+_TEXT_STRING_TYPES = Tag.MAIN_CONTENT_STRING_TYPES
+
+# Bytes fed to the lxml push parser at a time
+_FEED_CHUNK_SIZE = 32768
+
+# Starting a forkserver pool costs ~0.4 s, about what serial extraction gets
+# through in 8 MiB of HTML, so each worker needs at least that much input.
+_MIN_BYTES_PER_WORKER = 8 * 1024 * 1024
+
+# Charset declared in a document's <meta> tag
+_META_CHARSET_RE = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9._:-]+)""", re.IGNORECASE
+)
+
+# Declared charsets the UTF-8-with-cp1252-fallback decoding already covers
+_UTF8_COMPATIBLE_CODECS = frozenset({"utf-8", "ascii", "iso8859-1", "cp1252"})
+
+# Boilerplate patterns to filter out
+NOISE_PATTERNS = (
+    r"SEC\.gov",
+    r"EDGAR",
+    r"Filing Detail",
+    r"Document Format Files",
+    r"Complete submission text file",
+    r"XBRL.*DOCUMENT",
+    r"Washington.*D\.?C\.?[^\S\n]*20549",
+    r"Securities and Exchange Commission",
+    r"Form[^\S\n]+8-K",
+    r"Current Report",
+    r"Commission File Number",
+    r"Check the appropriate box",
+    r"[☐☑□■]",  # checkbox symbols
+)
+
+# Markers identifying EDGAR navigation tables and wrapper divs
+EDGAR_TABLE_MARKERS = ("Document Format Files", "Filing Detail", "tableFile", "Navigation")
+EDGAR_DIV_IDENTIFIERS = ("header", "footer", "breadCrumb", "formDiv", "mailer")
+
+
+def _lowercase_literals(pattern: str) -> str:
+    """Lowercase a regular expression's literal text, leaving escapes such as ``\\S`` intact."""
+    return re.sub(
+        r"\\.|[^\\]+",
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(),
+        pattern,
+    )
+
+
+def _marker_matcher(markers: Iterable[str]) -> Callable[[str], bool]:
+    """Return a predicate telling whether a string contains any of ``markers``.
+
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, and one
+    substring check per marker otherwise.
+    """
+    markers = tuple(markers)
+    if ahocorasick is None:
+        return lambda text: any(marker in text for marker in markers)
+
+    automaton = ahocorasick.Automaton()
+    for marker in markers:
+        automaton.add_word(marker, marker)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
 
 
 class Filing8KTextExtractor:
-    """Simple extractor to get clean text from 8-K HTML filings."""
-
-    def __init__(self):
-        # Tags to remove completely
-        self.remove_tags = [
-            "script",
-            "style",
-            "meta",
-            "link",
-            "head",
-            "title",
-            "nav",
-            "noscript",
-            "iframe",
-            "button",
-            "input",
-            "img",
-        ]
-
-        # Boilerplate patterns to filter out
-        self.noise_patterns = [
-            r"SEC\.gov",
-            r"EDGAR",
-            r"Filing Detail",
-            r"Document Format Files",
-            r"Complete submission text file",
-            r"XBRL.*DOCUMENT",
-            r"Washington.*D\.?C\.?\s*20549",
-            r"Securities and Exchange Commission",
-            r"Form\s+8-K",
-            r"Current Report",
-            r"Commission File Number",
-            r"Check the appropriate box",
-            r"☐|☑|□|■",  # checkbox symbols
-        ]
-
-    def extract_from_html(self, html_content: str) -> str:
+    """Simple extractor to get clean text from 8-K HTML filings.
+
+    All patterns are compiled once at import time by ``compile_once`` and shared
+    by every instance, so constructing an extractor is free and the per-call
+    path does no pattern compilation.
+
+    ``backend="lexbor"`` parses HTML with selectolax's lexbor backend, a C parser
+    that is much faster on large filings. Lexbor follows HTML5 tree construction,
+    so text placed directly inside malformed ``<table>`` markup is moved out of
+    the table; the default BeautifulSoup backend keeps it in place.
+
+    ``backend="lxml"`` streams the document through lxml's HTML pull parser
+    and drops unwanted subtrees as they are parsed, so no full DOM of Python
+    objects is ever built and memory stays bounded on very large filings.
+    """
+
+    remove_tags = REMOVE_TAGS
+    noise_patterns = NOISE_PATTERNS
+
+    def __init__(self, backend: str = "bs4"):
+        """
+        Initialize the extractor.
+
+        Args:
+            backend: HTML parser backend, "bs4", "lexbor" (falls back to "lxml"
+                when selectolax is not installed) or "lxml"
+        """
+        if backend not in ("lexbor", "lxml", "bs4"):
+            raise ValueError(f"Unknown HTML backend: {backend}")
+        if backend == "lexbor" and LexborHTMLParser is None:
+            backend = "lxml"
+        self.backend = backend
+
+    @classmethod
+    def compile_once(cls) -> None:
+        """Compile the extractor's regular expressions into class attributes."""
+        # Matches each line worth keeping and captures it stripped, so the whole
+        # text is filtered in one scan. The negative lookaheads fail on the
+        # first letter of an ordinary line, so they run before the capture,
+        # which scans the whole line
+        cls._keep_line_re = re.compile(
+            r"^[^\S\n]*"
+            r"(?!(?:[^\S\n]|[-_=*.])+$)"  # not only separator characters
+            r"(?!\d+[^\S\n]*$)"  # not only a number (e.g. page numbers)
+            r"(\S[^\n]{8,}\S)"  # at least 10 characters once stripped
+            r"[^\S\n]*$",
+            re.MULTILINE,
+        )
+        # Noise patterns never span lines. Case-insensitive matching is much
+        # slower than matching case-folded text against a lowercased pattern,
+        # so the case-insensitive form is only used when folding changes the
+        # text length (and with it the match offsets)
+        noise = "|".join(f"(?:{pattern})" for pattern in NOISE_PATTERNS)
+        cls._noise_re = re.compile(_lowercase_literals(noise))
+        cls._noise_ci_re = re.compile(noise, re.IGNORECASE)
+        cls._multi_newline_re = re.compile(r"\n{3,}")
+        cls._has_table_marker = staticmethod(_marker_matcher(EDGAR_TABLE_MARKERS))
+        cls._has_div_identifier = staticmethod(_marker_matcher(EDGAR_DIV_IDENTIFIERS))
+        cls._item_heading_re = re.compile(r"\bItem\s+\d+\.\d+", re.IGNORECASE)
+
+    def summarize_for_classification(
+        self, text: str, max_chars: int = 4096, section_chars: int = 500
+    ) -> str:
+        """
+        Reduce extracted text to the parts that carry the event signal.
+
+        8-K events are announced under "Item X.XX" headings, so long filings are
+        cut down to each heading and the text that follows it. Text without any
+        Item headings is truncated instead.
+
+        Args:
+            text: Clean text from ``extract_from_html``
+            max_chars: Maximum length of the returned text
+            section_chars: Characters kept from the start of each Item heading
+
+        Returns:
+            Text of at most ``max_chars`` characters
+        """
+        if len(text) <= max_chars:
+            return text
+
+        # Merge overlapping heading windows into disjoint spans
+        spans = []
+        for match in self._item_heading_re.finditer(text):
+            start, end = match.start(), min(len(text), match.start() + section_chars)
+            if spans and start <= spans[-1][1]:
+                spans[-1][1] = end
+            else:
+                spans.append([start, end])
+
+        if not spans:
+            return text[:max_chars]
+
+        return "\n\n".join(text[start:end] for start, end in spans)[:max_chars]
+
+    def extract_from_stream(self, chunks: Iterable[bytes]) -> str:
+        """
+        Extract clean text from HTML delivered as byte chunks.
+
+        With the lxml backend each chunk is parsed as it arrives, so the full
+        document is never held in memory. The lexbor and BeautifulSoup
+        backends only parse complete documents, so for them the chunks are
+        still joined into one bytes buffer first.
+
+        Args:
+            chunks: Iterable of raw HTML byte chunks, e.g. ``response.iter_content()``
+
+        Returns:
+            Clean text content
+        """
+        if self.backend == "lxml":
+            return self._clean_text(self._extract_text_lxml(chunks))
+        return self.extract_from_html(b"".join(chunks))
+
+    def extract_many(
+        self, html_contents: Sequence[Union[str, bytes]], workers: Optional[int] = None
+    ) -> List[Union[str, Exception]]:
+        """
+        Extract clean text from many HTML documents on a process pool.
+
+        Parsing and cleaning hold the GIL, so large batches are spread across
+        worker processes. Workers are capped so each gets at least
+        ``_MIN_BYTES_PER_WORKER`` of input; smaller batches are extracted in
+        this process. Workers come from a forkserver where available, so they
+        don't inherit the caller's threads, HTTP clients or loaded models.
+
+        Args:
+            html_contents: Raw HTML documents (str or undecoded bytes)
+            workers: Maximum number of worker processes (defaults to the CPU count)
+
+        Returns:
+            Clean text for each document, in order; failed documents are
+            returned as the raised exception instead of a string
+        """
+        total_bytes = sum(len(html) for html in html_contents if html is not None)
+        workers = min(
+            workers or os.cpu_count() or 1,
+            len(html_contents),
+            total_bytes // _MIN_BYTES_PER_WORKER,
+        )
+        if workers <= 1:
+            return [_extract_one(self.backend, html) for html in html_contents]
+
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+        else:
+            context = None
+        chunksize = max(1, len(html_contents) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            return list(
+                executor.map(
+                    _extract_one,
+                    [self.backend] * len(html_contents),
+                    html_contents,
+                    chunksize=chunksize,
+                )
+            )
+
+    def extract_from_html(self, html_content: Union[str, bytes]) -> str:
         """
         Extract clean text from HTML content.
 
         Args:
-            html_content: Raw HTML content
+            html_content: Raw HTML content (str or undecoded bytes)
 
         Returns:
             Clean text content
         """
-        soup = BeautifulSoup(html_content, "html.parser")
+        if self.backend == "lexbor":
+            text = self._extract_text_lexbor(html_content)
+        elif self.backend == "lxml":
+            text = self._extract_text_lxml(
+                html_content[start : start + _FEED_CHUNK_SIZE]
+                for start in range(0, len(html_content), _FEED_CHUNK_SIZE)
+            )
+        else:
+            soup = BeautifulSoup(html_content, "lxml")
 
-        # Remove unwanted elements
-        self._clean_soup(soup)
+            # Remove unwanted elements
+            self._clean_soup(soup)
 
-        # Extract text
-        text = soup.get_text(separator="\n", strip=True)
+            # Extract text
+            text = soup.get_text(separator="\n", strip=True)
 
         # Clean the text
         clean_text = self._clean_text(text)
 
         return clean_text
 
+    def _extract_text_lexbor(self, html_content: Union[str, bytes]) -> str:
+        """Parse with lexbor, drop unwanted elements and return the raw text."""
+
+        tree = LexborHTMLParser(html_content)
+        tree.strip_tags(list(REMOVE_TAGS))
+
+        # Find EDGAR navigation tables and wrapper divs before mutating the tree
+        matches = []
+        for table in tree.css("table"):
+            table_text = table.text() or ""
+            if self._has_table_marker(table_text):
+                matches.append(table)
+        for div in tree.css("div"):
+            attributes = div.attributes
+            div_id = attributes.get("id") or ""
+            div_class = attributes.get("class") or ""
+            if self._has_div_identifier(f"{div_id} {div_class}"):
+                matches.append(div)
+
+        # Only remove outermost matches; descendants go with their ancestor
+        matched_ids = {node.mem_id for node in matches}
+        for node in matches:
+            parent = node.parent
+            while parent is not None and parent.mem_id not in matched_ids:
+                parent = parent.parent
+            if parent is None:
+                node.decompose()
+
+        root = tree.body or tree.root
+        if root is None:
+            return ""
+        return root.text(separator="\n", strip=True)
+
+    def _extract_text_lxml(self, chunks: Iterable[Union[str, bytes]]) -> str:
+        """Stream-parse HTML chunks with lxml, skip unwanted subtrees and return the raw text."""
+
+        raw: List[str] = []  # Text outside removed tags, for the table marker check
+        out: List[str] = []  # Stripped text that survives every filter
+        tables: List[Tuple[int, int]] = []  # (len(raw), len(out)) at each open table
+        open_kinds: List[Optional[str]] = []  # Filter that applies to each open element
+        depth = {"removed": 0, "dropped": 0}  # Open REMOVE_TAGS elements / EDGAR divs
+
+        def add(text: Optional[str]) -> None:
+            if not text or depth["removed"]:
+                return
+            raw.append(text)
+            stripped = text.strip()
+            if stripped and not depth["dropped"]:
+                out.append(stripped)
+
+        def text_before(elem) -> Optional[str]:
+            # Text between the previous node (or the parent's start tag) and elem
+            previous = elem.getprevious()
+            if previous is not None:
+                return previous.tail
+            parent = elem.getparent()
+            return parent.text if parent is not None else None
+
+        for event, elem in _iter_html_events(_utf8_chunks(chunks)):
+            if event in ("comment", "pi"):
+                add(text_before(elem))
+                continue
+
+            if event == "start":
+                add(text_before(elem))
+                kind = None
+                if elem.tag in _REMOVE_TAG_SET:
+                    kind = "removed"
+                elif elem.tag == "div" and self._is_edgar_div(elem):
+                    kind = "dropped"
+                elif elem.tag == "table":
+                    tables.append((len(raw), len(out)))
+                    kind = "table"
+                if kind in depth:
+                    depth[kind] += 1
+                open_kinds.append(kind)
+                continue
+
+            # Text between the last child (or the start tag) and the end tag
+            add(elem[-1].tail if len(elem) else elem.text)
+            kind = open_kinds.pop()
+            if kind in depth:
+                depth[kind] -= 1
+            elif kind == "table":
+                raw_start, out_start = tables.pop()
+                if self._has_table_marker("".join(raw[raw_start:])):
+                    del out[out_start:]
+
+            # Free the finished subtree and everything before it
+            elem.clear(keep_tail=True)
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        return "\n".join(out)
+
+    def _is_edgar_div(self, div) -> bool:
+        """Check an lxml div's id and class for EDGAR wrapper identifiers."""
+        div_id = div.get("id") or ""
+        div_class = " ".join((div.get("class") or "").split())
+        return self._has_div_identifier(f"{div_id} {div_class}")
+
     def _clean_soup(self, soup: BeautifulSoup) -> None:
         """Remove unwanted tags and elements."""
 
+        # Walk the tree once and run every filter over that document-order
+        # list; elements inside an already removed element are skipped
+        tags = soup.find_all()
+        removed = set()
+
+        def remove(tag) -> None:
+            removed.add(id(tag))
+            removed.update(id(descendant) for descendant in tag.descendants)
+            tag.decompose()
+
         # Remove unwanted tags
-        for tag_name in self.remove_tags:
-            for tag in soup.find_all(tag_name):
-                tag.decompose()
+        for tag in tags:
+            if tag.name in _REMOVE_TAG_SET and id(tag) not in removed:
+                remove(tag)
 
-        # Remove tables that look like EDGAR navigation
-        for table in soup.find_all("table"):
-            if table is None:  # Safety check
+        # Remove tables that look like EDGAR navigation and divs with
+        # EDGAR-specific classes/ids
+        for tag in tags:
+            if id(tag) in removed:
                 continue
-            table_text = table.get_text() or ""
-            if any(
-                pattern in table_text
-                for pattern in ["Document Format Files", "Filing Detail", "tableFile", "Navigation"]
-            ):
-                table.decompose()
-
-        # Remove divs with EDGAR-specific classes/ids
-        for div in soup.find_all("div"):
-            if div is None:  # Safety check
-                continue
-            div_id = div.get("id", "") or ""
-            div_class = " ".join(div.get("class", []) or [])
-            if any(
-                identifier in f"{div_id} {div_class}"
-                for identifier in ["header", "footer", "breadCrumb", "formDiv", "mailer"]
-            ):
-                div.decompose()
+            if tag.name == "table":
+                if self._has_table_marker(tag.get_text() or ""):
+                    remove(tag)
+            elif tag.name == "div":
+                div_id = tag.get("id", "") or ""
+                div_class = " ".join(tag.get("class", []) or [])
+                if self._has_div_identifier(f"{div_id} {div_class}"):
+                    remove(tag)
 
         # Remove empty elements after cleanup
-        for _ in range(2):  # Multiple passes for nested empty tags
-            for tag in soup.find_all():
-                if tag.name and not tag.get_text(strip=True):
-                    tag.decompose()
+        tags = [tag for tag in tags if id(tag) not in removed]
+        if all(tag.interesting_string_types == _TEXT_STRING_TYPES for tag in tags):
+            # Every tag counts the same string types, so a tag has text iff a
+            # child string or child tag does: one bottom-up pass finds every
+            # empty tag, and removing them cannot empty another one
+            has_text = set()
+            for tag in reversed(tags):
+                for child in tag.contents:
+                    if isinstance(child, Tag):
+                        found = id(child) in has_text
+                    else:
+                        found = type(child) in _TEXT_STRING_TYPES and bool(child.strip())
+                    if found:
+                        has_text.add(id(tag))
+                        break
+            for tag in tags:
+                if id(tag) not in has_text and id(tag) not in removed:
+                    remove(tag)
+        else:
+            # Tags such as <template> count different string types; removing
+            # one empty tag can empty its parent, hence the second pass
+            for _ in range(2):
+                for tag in tags:
+                    if id(tag) not in removed and next(iter(tag.stripped_strings), None) is None:
+                        remove(tag)
 
     def _clean_text(self, text: str) -> str:
         """Clean and normalize the extracted text."""
 
-        lines = text.split("\n")
-        clean_lines = []
+        # Blank out lines with SEC/EDGAR boilerplate, then keep stripped lines
+        # that are not empty, junk or short (likely navigation/formatting)
+        result = "\n".join(self._keep_line_re.findall(self._drop_noise_lines(text)))
 
-        for line in lines:
-            line = line.strip()
+        # Kept lines are non-empty and joined by single newlines, so only runs
+        # of spaces/tabs inside a line can remain
+        if "\t" in result or "  " in result:
+            result = self._normalize_whitespace(result)
 
-            # Skip empty lines
-            if not line:
-                continue
+        return result.strip()
 
-            # Skip lines with only special characters or numbers
-            if re.match(r"^[\s\-_=*\.]+$", line) or re.match(r"^\d+$", line):
-                continue
+    def _drop_noise_lines(self, text: str) -> str:
+        """Return the text with the content of every line containing noise removed."""
+
+        # casefold() maps every character that IGNORECASE matches to an ASCII
+        # letter onto that letter, except the dotless i
+        folded = text.casefold().replace("\u0131", "i")
+        if len(folded) == len(text):
+            matches = self._noise_re.finditer(folded)
+        else:
+            matches = self._noise_ci_re.finditer(text)
 
-            # Skip short lines that are likely navigation/formatting
-            if len(line) < 10:
+        pieces = []
+        kept_from = 0
+        for match in matches:
+            line_start = text.rfind("\n", 0, match.start()) + 1
+            if line_start < kept_from:  # Line already dropped
                 continue
+            pieces.append(text[kept_from:line_start])
+            line_end = text.find("\n", match.end())
+            kept_from = len(text) if line_end == -1 else line_end
 
-            # Skip lines matching noise patterns
-            is_noise = False
-            for pattern in self.noise_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    is_noise = True
-                    break
+        if not pieces:
+            return text
+        pieces.append(text[kept_from:])
+        return "".join(pieces)
 
-            if not is_noise:
-                clean_lines.append(line)
+    def _normalize_whitespace(self, text: str) -> str:
+        """Cap newline runs at two and collapse space/tab runs to one space."""
 
-        # Join lines and clean up spacing
-        result = "\n".join(clean_lines)
+        has_newline_run = "\n\n\n" in text
+        if not has_newline_run and "\t" not in text and "  " not in text:
+            return text
 
-        # Remove excessive whitespace
-        result = re.sub(r"\n{3,}", "\n\n", result)  # Max 2 consecutive newlines
-        result = re.sub(r"[ \t]+", " ", result)  # Normalize spaces
+        if _collapse_whitespace is not None:
+            # ASCII whitespace bytes never occur inside multi-byte UTF-8 sequences,
+            # so the byte-level kernel is safe on encoded text
+            buf = np.frombuffer(text.encode("utf-8", "surrogatepass"), dtype=np.uint8)
+            return _collapse_whitespace(buf).tobytes().decode("utf-8", "surrogatepass")
 
-        return result.strip()
+        if has_newline_run:
+            text = self._multi_newline_re.sub("\n\n", text)  # Max 2 consecutive newlines
+        # Normalize spaces; each replace pass halves every remaining run
+        text = text.translate(_TAB_TO_SPACE)
+        while "  " in text:
+            text = text.replace("  ", " ")
+        return text
+
+
+Filing8KTextExtractor.compile_once()
+
+
+def _decode_as_cp1252(error: UnicodeDecodeError) -> Tuple[str, int]:
+    """Decode bytes that are not valid UTF-8 as cp1252 (Latin-1 where cp1252 has no character)."""
+    chars = []
+    for byte in error.object[error.start : error.end]:
+        try:
+            chars.append(bytes((byte,)).decode("cp1252"))
+        except UnicodeDecodeError:
+            chars.append(chr(byte))
+    return "".join(chars), error.end
+
+
+codecs.register_error("text_extractor.cp1252", _decode_as_cp1252)
+
+
+def _utf8_chunks(chunks: Iterable[Union[str, bytes]]) -> Iterator[bytes]:
+    """Re-encode HTML chunks as valid UTF-8 one chunk at a time.
+
+    libxml2 needs the encoding before the first byte. EDGAR documents are
+    mostly UTF-8 with the odd cp1252 byte, so bytes are decoded as UTF-8
+    with a per-byte cp1252 fallback, as browsers and BeautifulSoup do. A BOM,
+    or a non-Latin charset declared in the first chunk, takes precedence.
+    """
+    decoder = None
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            yield chunk.encode("utf-8")
+            continue
+        if not chunk:
+            continue
+        if decoder is None:
+            decoder = _chunk_decoder(chunk)
+        yield decoder.decode(chunk).encode("utf-8")
+    if decoder is not None:
+        yield decoder.decode(b"", final=True).encode("utf-8")
+
+
+def _chunk_decoder(first_chunk: bytes) -> codecs.IncrementalDecoder:
+    """Pick the incremental decoder for a document from its first chunk."""
+    if first_chunk[:2] in (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE):
+        return codecs.getincrementaldecoder("utf-16")(errors="replace")
+
+    match = _META_CHARSET_RE.search(first_chunk)
+    if match:
+        try:
+            codec = codecs.lookup(match.group(1).decode("ascii")).name
+        except LookupError:
+            codec = None
+        if codec and codec not in _UTF8_COMPATIBLE_CODECS:
+            return codecs.getincrementaldecoder(codec)(errors="replace")
+
+    return codecs.getincrementaldecoder("utf-8-sig")(errors="text_extractor.cp1252")
+
+
+def _iter_html_events(chunks: Iterable[bytes]):
+    """Yield lxml parse events for UTF-8 HTML fed to the parser chunk by chunk.
+
+    libxml2's push parser loses the end of a ``<script>`` or ``<style>`` element
+    when a chunk boundary falls inside its end tag, so every chunk is cut
+    right after its last ``>`` and the rest carried into the next one.
+    """
+    parser = etree.HTMLPullParser(events=("start", "end", "comment", "pi"), encoding="utf-8")
+    carry = b""
+    for chunk in chunks:
+        data = carry + chunk if carry else chunk
+        cut = data.rfind(b">") + 1
+        if cut:
+            parser.feed(data[:cut])
+            yield from parser.read_events()
+        carry = data[cut:]
+    if carry:
+        parser.feed(carry)
+    parser.close()
+    yield from parser.read_events()
+
+
+def _extract_one(backend: str, html_content: Union[str, bytes]) -> Union[str, Exception]:
+    """Extract one document for ``extract_many``, returning any error instead of raising."""
+    try:
+        return Filing8KTextExtractor(backend=backend).extract_from_html(html_content)
+    except Exception as e:
+        return e
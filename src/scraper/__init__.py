@@ -1,6 +1,8 @@
 """Minimal SEC filing scraper module."""
 
-from .edgar_scraper import EdgarScraper, FilingInfo
+from .edgar_scraper import EdgarScraper, FilingInfo, create_session
 from .filing_organizer import FilingOrganizer
+from .rate_limit import SEC_RATE_LIMITER, TokenBucket
 
-__all__ = ["EdgarScraper", "FilingInfo", "FilingOrganizer"] 
\ No newline at end of file
+__all__ = ["EdgarScraper", "FilingInfo", "FilingOrganizer", "create_session",
+           "SEC_RATE_LIMITER", "TokenBucket"] 
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""Concurrent, rate-limited downloader for SEC EDGAR documents."""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Union
+
+import httpx
+
+try:
+    import h2  # type: ignore  # noqa: F401
+except ImportError:  # pragma: no cover - h2 is optional
+    h2 = None
+
+from .rate_limit import SEC_RATE_LIMITER, TokenBucket
+
+
+async def download_many(
+    urls: List[str],
+    headers: Dict[str, str],
+    rate_limiter: Optional[TokenBucket] = None,
+    max_concurrency: int = 8,
+    timeout: float = 30.0,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> List[Union[str, Exception]]:
+    """
+    Download several URLs concurrently while respecting a request-rate limit.
+
+    Requests are multiplexed over HTTP/2 when the optional ``h2`` package is
+    installed; responses are gzip-compressed whenever the server supports it.
+
+    Args:
+        urls: URLs to download
+        headers: HTTP headers sent with every request (SEC requires a User-Agent)
+        rate_limiter: Token bucket to draw from (defaults to the process-wide
+            SEC limiter shared with the synchronous scraper)
+        max_concurrency: Maximum number of requests in flight
+        timeout: Per-request timeout in seconds
+        transport: Optional httpx transport (mainly for testing)
+
+    Returns:
+        Response bodies in the same order as ``urls``; failed downloads are
+        returned as the raised exception instead of a string
+    """
+    logger = logging.getLogger(__name__)
+    bucket = rate_limiter or SEC_RATE_LIMITER
+    semaphore = asyncio.Semaphore(max_concurrency)
+    limits = httpx.Limits(max_connections=max_concurrency)
+
+    async with httpx.AsyncClient(
+        headers=headers,
+        limits=limits,
+        timeout=timeout,
+        follow_redirects=True,
+        http2=h2 is not None,
+        transport=transport,
+    ) as client:
+
+        async def fetch(url: str) -> str:
+            async with semaphore:
+                await bucket.acquire_async()
+                response = await client.get(url)
+                response.raise_for_status()
+                return response.text
+
+        results = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+
+    failures = sum(isinstance(result, Exception) for result in results)
+    logger.info(f"Downloaded {len(urls) - failures}/{len(urls)} documents")
+    return list(results)
@@ -1,12 +1,36 @@
 """Minimal SEC EDGAR scraper for downloading 8-K filings."""
 
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 from typing import Dict, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..llm.json_utils import dumps, loads
+from .rate_limit import SEC_RATE_LIMITER, TokenBucket
+
+
+def create_session(headers: Dict[str, str], pool_size: int = 10) -> requests.Session:
+    """Create a keep-alive session with connection pooling and retry/backoff.
+    
+    Retries back off on SEC throttling (429) and transient server errors.
+    """
+    session = requests.Session()
+    session.headers.update(headers)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
 
 @dataclass
@@ -36,35 +60,71 @@ class EdgarScraper:
     BASE_URL = "https://data.sec.gov"
     ARCHIVES_URL = "https://www.sec.gov/Archives/edgar/data"
     
-    def __init__(self, user_agent: str = "Python SEC Scraper 1.0"):
+    def __init__(self, user_agent: str = "Python SEC Scraper 1.0",
+                 rate_limiter: Optional[TokenBucket] = None,
+                 cache_dir: Optional[str] = None):
+        """Initialize the scraper.
+
+        Args:
+            user_agent: User-Agent sent with every request (required by the SEC)
+            rate_limiter: Token bucket to draw from (defaults to SEC_RATE_LIMITER)
+            cache_dir: Directory for cached submissions data (None disables it)
+        """
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.rate_limiter = rate_limiter or SEC_RATE_LIMITER
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.session = create_session({
             "User-Agent": user_agent,
             "Accept": "application/json",
         })
-        self.last_request_time = 0
         
     def _rate_limit(self):
-        """Simple rate limiting."""
-        current_time = time.time()
-        if current_time - self.last_request_time < 0.1:  # 100ms between requests
-            time.sleep(0.1)
-        self.last_request_time = time.time()
+        """Wait for a token from the shared SEC rate limiter."""
+        self.rate_limiter.acquire()
     
-    def _make_request(self, url: str) -> requests.Response:
+    def _make_request(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
         """Make rate-limited request."""
         self._rate_limit()
-        response = self.session.get(url)
+        response = self.session.get(url, headers=headers)
         response.raise_for_status()
         return response
     
     def get_company_submissions(self, cik: str) -> Dict:
-        """Get company submissions from SEC."""
+        """Get company submissions from SEC.
+
+        With a ``cache_dir`` the response is kept on disk with its ETag and
+        Last-Modified headers; later calls make a conditional request and
+        reuse the cached copy when the SEC answers 304 Not Modified.
+        """
         cik_padded = str(cik).zfill(10)
         url = f"{self.BASE_URL}/submissions/CIK{cik_padded}.json"
-        response = self._make_request(url)
-        return response.json()
+        if self.cache_dir is None:
+            return self._make_request(url).json()
+
+        body_path = self.cache_dir / f"CIK{cik_padded}.json"
+        validators_path = self.cache_dir / f"CIK{cik_padded}.validators.json"
+        headers = {}
+        if body_path.exists() and validators_path.exists():
+            validators = loads(validators_path.read_bytes())
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = self._make_request(url, headers=headers)
+        if response.status_code == 304:
+            self.logger.debug(f"Submissions for CIK {cik_padded} not modified, using cache")
+            return loads(body_path.read_bytes())
+
+        # Body first, so validators never describe a body that was not written
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        validators_path.unlink(missing_ok=True)
+        body_path.write_bytes(response.content)
+        validators_path.write_bytes(dumps({
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }))
+        return loads(response.content)
     
     def filter_8k_filings(self, submissions_data: Dict, 
                          start_date: Optional[str] = None,
@@ -83,20 +143,18 @@ class EdgarScraper:
         company_name = submissions_data.get("name", "Unknown")
         cik = str(submissions_data.get("cik", "")).zfill(10)
         
-        start_dt = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
-        end_dt = datetime.strptime(end_date, "%Y-%m-%d") if end_date else None
+        # ISO dates order the same as strings, so only the bounds are parsed
+        # (to reject malformed input) and filings are compared as text
+        start = datetime.strptime(start_date, "%Y-%m-%d").strftime("%Y-%m-%d") if start_date else None
+        end = datetime.strptime(end_date, "%Y-%m-%d").strftime("%Y-%m-%d") if end_date else None
         
-        for i, form in enumerate(forms):
+        for form, filing_date, accession_number in zip(forms, filing_dates, accession_numbers):
             if form == "8-K":
-                filing_date = filing_dates[i]
-                filing_dt = datetime.strptime(filing_date, "%Y-%m-%d")
-                
-                if start_dt and filing_dt < start_dt:
+                if start and filing_date < start:
                     continue
-                if end_dt and filing_dt > end_dt:
+                if end and filing_date > end:
                     continue
                 
-                accession_number = accession_numbers[i]
                 clean_accession = accession_number.replace("-", "")
                 document_url = f"{self.ARCHIVES_URL}/{cik}/{clean_accession}/{accession_number}.txt"
                 
@@ -117,8 +175,15 @@ class EdgarScraper:
         response = self._make_request(filing_info.document_url)
         return response.text
     
-    def scrape_8k_filings(self, cik: str, start_date: str, end_date: str) -> List[FilingInfo]:
-        """Main scraping method."""
+    def scrape_8k_filings(self, cik: str, start_date: str, end_date: str,
+                          download: bool = True, max_workers: int = 4) -> List[FilingInfo]:
+        """Main scraping method.
+
+        Filing content is downloaded on up to ``max_workers`` threads; the
+        shared rate limiter still caps the overall request rate. Set
+        ``download=False`` to only list filings and fetch their content
+        separately (e.g. concurrently via ``async_downloader.download_many``).
+        """
         self.logger.info(f"Scraping 8-K filings for CIK {cik}")
         
         # Get submissions
@@ -128,12 +193,20 @@ class EdgarScraper:
         filings = self.filter_8k_filings(submissions, start_date, end_date)
         
         # Download content for each filing
-        for filing in filings:
-            try:
-                content = self.download_filing_content(filing)
-                filing._raw_content = content
-            except Exception as e:
-                self.logger.error(f"Error downloading {filing.accession_number}: {e}")
+        if download:
+            def download_one(filing: FilingInfo) -> None:
+                try:
+                    content = self.download_filing_content(filing)
+                    filing._raw_content = content
+                except Exception as e:
+                    self.logger.error(f"Error downloading {filing.accession_number}: {e}")
+
+            if max_workers > 1 and len(filings) > 1:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    list(executor.map(download_one, filings))
+            else:
+                for filing in filings:
+                    download_one(filing)
         
         self.logger.info(f"Found {len(filings)} 8-K filings")
         return filings 
\ No newline at end of file
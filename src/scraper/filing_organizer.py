@@ -1,15 +1,46 @@
 """Filing organizer with event classification for saving SEC filings."""
 
-import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from .edgar_scraper import FilingInfo
+from ..llm.client import get_shared_client
+from ..llm.json_utils import dumps, loads
 from ..parser.event_classifier import EventClassifier, PromptStrategy
+from ..parser.schema.event_types import ClassificationResult
 from ..parser.text_extractor import Filing8KTextExtractor
 
 
+# Classifiers shared by all organizers, keyed by (llm_config_path, event_config_path)
+_CLASSIFIERS: Dict[Tuple[str, str], EventClassifier] = {}
+_CLASSIFIERS_LOCK = threading.Lock()
+
+# Text extractor shared by all organizers (C lexbor parser, streaming lxml without selectolax)
+_TEXT_EXTRACTOR = Filing8KTextExtractor(backend="lexbor")
+
+
+def _get_classifier(llm_config_path: str, event_config_path: str) -> EventClassifier:
+    """Return the shared classifier for a config pair, creating it on first use."""
+    key = (llm_config_path, event_config_path)
+    classifier = _CLASSIFIERS.get(key)
+    if classifier is None:
+        with _CLASSIFIERS_LOCK:
+            classifier = _CLASSIFIERS.get(key)
+            if classifier is None:
+                llm_client = get_shared_client(llm_config_path)
+                classifier = EventClassifier(
+                    event_config_path=event_config_path,
+                    llm_client=llm_client,
+                    result_cache=llm_client.create_result_cache()
+                )
+                _CLASSIFIERS[key] = classifier
+    return classifier
+
+
 class FilingOrganizer:
     """Organizer for SEC filings with event classification."""
     
@@ -18,20 +49,47 @@ class FilingOrganizer:
                  llm_config_path: str = "config/llm_config.json",
                  event_config_path: str = "config/event_config.json",
                  classify_events: bool = True,
-                 prompt_strategy: PromptStrategy = PromptStrategy.DETAILED):
+                 prompt_strategy: PromptStrategy = PromptStrategy.DETAILED,
+                 classification_output: str = "json",
+                 metadata_output: str = "json",
+                 skip_existing: bool = False):
+        """
+        Initialize the organizer.
+
+        Args:
+            data_dir: Directory filings are saved under
+            llm_config_path: Path to LLM configuration file
+            event_config_path: Path to event configuration file
+            classify_events: Classify filings while saving them
+            prompt_strategy: Prompt strategy used for classification
+            classification_output: "json" writes classification.json in each
+                filing directory; "jsonl" appends one line per filing to
+                classifications.jsonl in data_dir
+            metadata_output: "json" writes metadata.json in each filing
+                directory; "jsonl" appends one line per filing to
+                <cik>/manifest.jsonl in data_dir
+            skip_existing: Skip filings an earlier run already saved (and,
+                with classification enabled, classified)
+        """
+        if classification_output not in ("json", "jsonl"):
+            raise ValueError(f"Unknown classification output: {classification_output}")
+        if metadata_output not in ("json", "jsonl"):
+            raise ValueError(f"Unknown metadata output: {metadata_output}")
+        
         self.logger = logging.getLogger(__name__)
         self.data_dir = Path(data_dir)
-        self.data_dir.mkdir(exist_ok=True)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
         self.classify_events = classify_events
+        self.classification_output = classification_output
+        self.metadata_output = metadata_output
+        self.skip_existing = skip_existing
+        self._jsonl_lock = threading.Lock()
         
         # Initialize classification components
         if classify_events:
             try:
-                self.classifier = EventClassifier(
-                    llm_config_path=llm_config_path,
-                    event_config_path=event_config_path
-                )
-                self.text_extractor = Filing8KTextExtractor()
+                self.classifier = _get_classifier(llm_config_path, event_config_path)
+                self.text_extractor = _TEXT_EXTRACTOR
                 self.prompt_strategy = prompt_strategy
                 self.logger.info("Event classification enabled")
             except Exception as e:
@@ -40,89 +98,296 @@ class FilingOrganizer:
         
     def save_filing(self, filing_info: FilingInfo) -> Path:
         """Save a filing with optional event classification."""
+        if self.skip_existing and self._already_saved(filing_info, {}):
+            self.logger.info(f"Skipping {filing_info.accession_number}, already saved")
+            return self._filing_dir(filing_info)
+        return self._save_filing(filing_info)
+    
+    def _save_filing(self, filing_info: FilingInfo, write_manifest: bool = True,
+                     dir_exists: bool = False) -> Path:
+        """Save and classify one filing; see ``_write_filing`` for the flags."""
         
-        # Create company directory
-        company_dir = self.data_dir / filing_info.cik
-        company_dir.mkdir(exist_ok=True)
+        filing_dir = self._write_filing(filing_info, write_manifest, dir_exists)
         
-        # Create filing directory
-        filing_dir = company_dir / filing_info.get_directory_name()
-        filing_dir.mkdir(exist_ok=True)
+        # Perform event classification
+        if self.classify_events and self._has_content(filing_info):
+            self._classify_and_save(filing_info, filing_dir)
         
-        # Save metadata
-        metadata = {
-            "cik": filing_info.cik,
-            "company_name": filing_info.company_name,
-            "form": filing_info.form,
-            "filing_date": filing_info.filing_date,
-            "accession_number": filing_info.accession_number,
-            "document_url": filing_info.document_url,
-            "filename": filing_info.get_filename()
-        }
+        self.logger.info(f"Saved filing to {filing_dir}")
+        return filing_dir
+    
+    @staticmethod
+    def _has_content(filing_info: FilingInfo) -> bool:
+        """Check whether raw filing content was downloaded."""
+        return bool(getattr(filing_info, '_raw_content', None))
+    
+    def _filing_dir(self, filing_info: FilingInfo) -> Path:
+        """Return the directory a filing is saved under."""
+        return self.data_dir / filing_info.cik / filing_info.get_directory_name()
+    
+    def unsaved_filings(self, filings: List[FilingInfo]) -> List[FilingInfo]:
+        """Return the filings an earlier run has not saved (and, if enabled, classified).
+
+        Lets callers skip downloading filings that ``skip_existing`` would skip anyway.
+        """
+        logged: Dict[Path, Set[str]] = {}
+        return [filing for filing in filings if not self._already_saved(filing, logged)]
+    
+    def _already_saved(self, filing_info: FilingInfo, logged: Dict[Path, Set[str]]) -> bool:
+        """Check whether an earlier run saved (and, if enabled, classified) a filing.
+
+        ``logged`` caches the accession numbers read from JSONL files so a
+        batch reads each manifest and classification log once.
+        """
+        filing_dir = self._filing_dir(filing_info)
+        if self.metadata_output == "json":
+            if not (filing_dir / "metadata.json").exists():
+                return False
+        elif filing_info.accession_number not in self._logged_accessions(
+                self.data_dir / filing_info.cik / "manifest.jsonl", logged):
+            return False
+        
+        if not self.classify_events:
+            return True
+        if self.classification_output == "json":
+            return (filing_dir / "classification.json").exists()
+        return filing_info.accession_number in self._logged_accessions(
+            self.data_dir / "classifications.jsonl", logged)
+    
+    @staticmethod
+    def _logged_accessions(path: Path, logged: Dict[Path, Set[str]]) -> Set[str]:
+        """Return the accession numbers recorded in a JSONL file, cached in ``logged``."""
+        if path not in logged:
+            accessions = set()
+            if path.exists():
+                with open(path, "rb") as f:
+                    accessions = {loads(line)["accession_number"] for line in f if line.strip()}
+            logged[path] = accessions
+        return logged[path]
+    
+    def _write_filing(self, filing_info: FilingInfo, write_manifest: bool = True,
+                      dir_exists: bool = False) -> Path:
+        """Create the filing directory and write its metadata.
+
+        With ``metadata_output="jsonl"`` the metadata goes to the CIK's
+        manifest.jsonl instead (unless ``write_manifest`` is False, for batches
+        that append all records at once), and the directory is only created
+        when a classification.json will be written into it. ``dir_exists``
+        skips the mkdir for directories a batch already found on disk.
+        """
         
-        with open(filing_dir / "metadata.json", "w") as f:
-            json.dump(metadata, f, indent=2)
+        # Create the filing directory (and, for a CIK's first filing, its
+        # company directory)
+        filing_dir = self._filing_dir(filing_info)
+        if self.metadata_output == "json":
+            if not dir_exists:
+                filing_dir.mkdir(parents=True, exist_ok=True)
+            metadata = self._filing_metadata(filing_info)
+            (filing_dir / "metadata.json").write_bytes(dumps(metadata, indent=True))
+        else:
+            if self.classify_events and self.classification_output == "json" and not dir_exists:
+                filing_dir.mkdir(parents=True, exist_ok=True)
+            if write_manifest:
+                self._append_manifest([filing_info])
         
         # Save raw content if available
-        if hasattr(filing_info, '_raw_content') and filing_info._raw_content:
+        if self._has_content(filing_info):
             raw_file = filing_dir / f"{filing_info.get_filename()}.txt"
             # with open(raw_file, "w", encoding="utf-8") as f:
             #     f.write(filing_info._raw_content)
-            
-            # Perform event classification
-            if self.classify_events:
-                self._classify_and_save(filing_info, filing_dir)
         
-        self.logger.info(f"Saved filing to {filing_dir}")
         return filing_dir
     
+    def _scan_cik(self, cik: str) -> Set[str]:
+        """List the filing directories saved under a CIK with one scandir call."""
+        try:
+            with os.scandir(self.data_dir / cik) as entries:
+                return {entry.name for entry in entries if entry.is_dir()}
+        except FileNotFoundError:
+            return set()
+    
+    @staticmethod
+    def _filing_metadata(filing_info: FilingInfo) -> dict:
+        """Build the serialized form of a filing's metadata."""
+        return {
+            "cik": filing_info.cik,
+            "company_name": filing_info.company_name,
+            "form": filing_info.form,
+            "filing_date": filing_info.filing_date,
+            "accession_number": filing_info.accession_number,
+            "document_url": filing_info.document_url,
+            "filename": filing_info.get_filename()
+        }
+    
+    def _append_manifest(self, filings: List[FilingInfo]):
+        """Append filing metadata to each CIK's manifest.jsonl, one write per CIK."""
+        payloads: Dict[str, List[bytes]] = {}
+        for filing in filings:
+            payloads.setdefault(filing.cik, []).append(dumps(self._filing_metadata(filing)) + b"\n")
+        with self._jsonl_lock:
+            for cik, lines in payloads.items():
+                cik_dir = self.data_dir / cik
+                cik_dir.mkdir(exist_ok=True)
+                with open(cik_dir / "manifest.jsonl", "ab") as f:
+                    f.write(b"".join(lines))
+    
     def _classify_and_save(self, filing_info: FilingInfo, filing_dir: Path):
         """Classify filing and save classification results."""
         try:
             # Extract clean text for classification
-            if hasattr(filing_info, '_raw_content'):
-                clean_text = self.text_extractor.extract_from_html(filing_info._raw_content)
-                
-                # Classify the filing
-                self.logger.info(f"Classifying filing {filing_info.accession_number}")
-                classification_result = self.classifier.classify(
-                    text=clean_text,
-                    strategy=self.prompt_strategy
-                )
-                
-                if classification_result:
-                    # Save classification results
-                    classification_data = {
-                        "accession_number": filing_info.accession_number,
-                        "event_type": classification_result.event_type,
-                        "relevant": classification_result.relevant,
-                        "reasoning": classification_result.reasoning,
-                        "confidence": getattr(classification_result, 'confidence', None),
-                        "prompt_strategy": self.prompt_strategy.value,
-                        "classification_timestamp": filing_info.filing_date
-                    }
-                    
-                    classification_file = filing_dir / "classification.json"
-                    with open(classification_file, "w") as f:
-                        json.dump(classification_data, f, indent=2)
-                    
-                    self.logger.info(f"Classification saved: {classification_result.event_type} (relevant: {classification_result.relevant})")
-                else:
-                    self.logger.warning(f"Classification failed for {filing_info.accession_number}")
+            clean_text = self.text_extractor.extract_from_html(filing_info._raw_content)
+            
+            # Classify the filing
+            self.logger.info(f"Classifying filing {filing_info.accession_number}")
+            classification_result = self.classifier.classify(
+                text=clean_text,
+                strategy=self.prompt_strategy
+            )
+            
+            self._save_classification(filing_info, filing_dir, classification_result)
                     
         except Exception as e:
             self.logger.error(f"Error during classification: {e}")
     
-    def save_filings_batch(self, filings: List[FilingInfo]) -> List[Path]:
-        """Save multiple filings with classification."""
-        saved_paths = []
+    def _classification_data(self, filing_info: FilingInfo,
+                             classification_result: ClassificationResult) -> dict:
+        """Build the serialized form of a classification result."""
+        return {
+            "accession_number": filing_info.accession_number,
+            "event_type": classification_result.event_type,
+            "relevant": classification_result.relevant,
+            "reasoning": classification_result.reasoning,
+            "confidence": getattr(classification_result, 'confidence', None),
+            "prompt_strategy": self.prompt_strategy.value,
+            "classification_timestamp": filing_info.filing_date
+        }
+    
+    def _save_classification(self, filing_info: FilingInfo, filing_dir: Path,
+                             classification_result: Optional[ClassificationResult]):
+        """Write a classification result next to the filing (or to the JSONL log)."""
+        if classification_result:
+            # Save classification results
+            classification_data = self._classification_data(filing_info, classification_result)
+            
+            if self.classification_output == "jsonl":
+                self._append_jsonl([classification_data])
+            else:
+                (filing_dir / "classification.json").write_bytes(dumps(classification_data, indent=True))
+            
+            self.logger.info(f"Classification saved: {classification_result.event_type} (relevant: {classification_result.relevant})")
+        else:
+            self.logger.warning(f"Classification failed for {filing_info.accession_number}")
+    
+    def _append_jsonl(self, records: List[dict]):
+        """Append records to classifications.jsonl with a single write."""
+        payload = b"".join(dumps(record) + b"\n" for record in records)
+        with self._jsonl_lock:
+            with open(self.data_dir / "classifications.jsonl", "ab") as f:
+                f.write(payload)
+    
+    def _classify_batch(self, filings: List[FilingInfo],
+                        max_concurrency: int) -> Dict[str, Optional[ClassificationResult]]:
+        """Classify all downloaded filings with concurrent LLM requests."""
+        with_content = [filing for filing in filings if self._has_content(filing)]
+        extracted = self.text_extractor.extract_many(
+            [filing._raw_content for filing in with_content], workers=max_concurrency
+        )
+        to_classify = []
+        texts = []
+        for filing, text in zip(with_content, extracted):
+            if isinstance(text, Exception):
+                self.logger.error(f"Error extracting text from {filing.accession_number}: {text}")
+                continue
+            texts.append(text)
+            to_classify.append(filing)
         
-        for i, filing in enumerate(filings, 1):
+        if not to_classify:
+            return {}
+        
+        self.logger.info(f"Classifying {len(to_classify)} filings")
+        try:
+            results = self.classifier.classify_batch(
+                texts, strategy=self.prompt_strategy, max_concurrency=max_concurrency
+            )
+        except Exception as e:
+            self.logger.error(f"Error during batch classification: {e}")
+            return {}
+        
+        return {filing.accession_number: result for filing, result in zip(to_classify, results)}
+    
+    def save_filings_batch(self, filings: List[FilingInfo], max_workers: int = 1) -> List[Path]:
+        """Save multiple filings with classification.
+
+        Filings are classified up front in one batch, with up to ``max_workers``
+        LLM requests in flight; with ``max_workers > 1`` the results are also
+        written on a thread pool. Each CIK directory is listed once so
+        existing filing directories are not re-created. With
+        ``skip_existing`` filings saved by an earlier run are neither
+        classified nor rewritten.
+        """
+        total = len(filings)
+        skipped: Set[str] = set()
+        if self.skip_existing:
+            unsaved = {f.accession_number for f in self.unsaved_filings(filings)}
+            skipped = {f.accession_number for f in filings} - unsaved
+            if skipped:
+                self.logger.info(f"Skipping {len(skipped)} filings saved by an earlier run")
+        
+        classifications = {}
+        if self.classify_events:
+            classifications = self._classify_batch(
+                [f for f in filings if f.accession_number not in skipped],
+                max_concurrency=max(1, max_workers)
+            )
+        
+        existing = {cik: self._scan_cik(cik) for cik in {f.cik for f in filings}}
+        
+        # In JSONL mode all batch results (and manifest records) go out in one
+        # append after saving
+        batch_jsonl = self.classification_output == "jsonl"
+        batch_manifest = self.metadata_output == "jsonl"
+        
+        def save_one(item):
+            i, filing = item
+            dir_exists = filing.get_directory_name() in existing[filing.cik]
             try:
-                path = self.save_filing(filing)
-                saved_paths.append(path)
-                self.logger.info(f"Progress: {i}/{len(filings)} filings processed")
+                if filing.accession_number in skipped:
+                    path = self._filing_dir(filing)
+                elif filing.accession_number in classifications:
+                    path = self._write_filing(filing, not batch_manifest, dir_exists)
+                    result = classifications[filing.accession_number]
+                    if not (batch_jsonl and result):
+                        self._save_classification(filing, path, result)
+                    self.logger.info(f"Saved filing to {path}")
+                else:
+                    path = self._save_filing(filing, not batch_manifest, dir_exists)
+                self.logger.info(f"Progress: {i}/{total} filings processed")
+                return path
             except Exception as e:
                 self.logger.error(f"Error saving {filing.accession_number}: {e}")
+                return None
+        
+        items = list(enumerate(filings, 1))
+        if max_workers > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(save_one, items))
+        else:
+            results = [save_one(item) for item in items]
+        
+        if batch_manifest:
+            self._append_manifest([
+                filing for filing, path in zip(filings, results)
+                if path is not None and filing.accession_number not in skipped
+            ])
+        
+        if batch_jsonl:
+            records = [
+                self._classification_data(filing, classifications[filing.accession_number])
+                for filing, path in zip(filings, results)
+                if path is not None and classifications.get(filing.accession_number)
+            ]
+            if records:
+                self._append_jsonl(records)
+                self.logger.info(f"Saved {len(records)} classifications to {self.data_dir / 'classifications.jsonl'}")
         
-        return saved_paths 
\ No newline at end of file
+        return [path for path in results if path is not None]
@@ -0,0 +1,66 @@
+"""Token-bucket rate limiting shared by all SEC request paths."""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket usable from both threads and coroutines.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``; every
+    request consumes one token, so the sustained request rate never exceeds
+    ``rate`` regardless of how many threads or tasks share the bucket.
+
+    The bucket starts full, so up to ``burst`` plus ``rate`` requests can go
+    out in the first second; keep ``burst`` at 1 for a hard per-second limit.
+    """
+
+    def __init__(self, rate: float = 9.0, burst: int = 1):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens that can accumulate
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _try_acquire(self) -> float:
+        """Consume a token if one is available, otherwise return seconds to wait."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return
+            await asyncio.sleep(wait)
+
+
+# Process-wide limiter; 9 req/s with no burst stays under SEC's 10 req/s limit
+# in every one-second window
+SEC_RATE_LIMITER = TokenBucket(rate=9, burst=1)
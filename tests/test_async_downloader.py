@@ -0,0 +1,97 @@
+"""Tests for the concurrent SEC document downloader."""
+
+import asyncio
+import time
+import unittest
+from unittest import mock
+
+import httpx
+
+from src.scraper.async_downloader import download_many
+from src.scraper.rate_limit import SEC_RATE_LIMITER, TokenBucket
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket."""
+
+    def test_acquire_paces_requests(self):
+        """Test that tokens are released no faster than the configured rate."""
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # First token is immediate, the remaining five wait 1/50s each
+        self.assertGreaterEqual(elapsed, 5 / 50 * 0.9)
+
+    def test_acquire_async_paces_requests(self):
+        """Test that the async path shares the same pacing."""
+
+        async def acquire_many(bucket, count):
+            for _ in range(count):
+                await bucket.acquire_async()
+
+        bucket = TokenBucket(rate=50, burst=1)
+        start = time.monotonic()
+        asyncio.run(acquire_many(bucket, 6))
+        elapsed = time.monotonic() - start
+
+        self.assertGreaterEqual(elapsed, 5 / 50 * 0.9)
+
+    def test_sec_limiter_first_second_stays_under_limit(self):
+        """Test that a fresh SEC limiter releases at most 10 tokens in its first second."""
+        clock = [0.0]
+
+        def sleep(seconds):
+            # Like a real sleep, never shorter than the clock's resolution
+            clock[0] += max(seconds, 1e-6)
+
+        with mock.patch("src.scraper.rate_limit.time.monotonic", lambda: clock[0]), \
+                mock.patch("src.scraper.rate_limit.time.sleep", sleep):
+            bucket = TokenBucket(rate=SEC_RATE_LIMITER.rate, burst=SEC_RATE_LIMITER.burst)
+            completed = []
+            while clock[0] < 1.0:
+                bucket.acquire()
+                completed.append(clock[0])
+
+        self.assertLessEqual(sum(1 for t in completed if t < 1.0), 10)
+
+    def test_burst_is_immediate(self):
+        """Test that up to burst tokens are available without waiting."""
+        bucket = TokenBucket(rate=1, burst=5)
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+
+        self.assertLess(time.monotonic() - start, 0.5)
+
+
+class TestDownloadMany(unittest.TestCase):
+    """Test cases for download_many."""
+
+    def test_results_preserve_order_and_errors(self):
+        """Test that bodies come back in URL order with failures as exceptions."""
+
+        def handler(request):
+            if request.url.path == "/missing":
+                return httpx.Response(404, text="not found")
+            return httpx.Response(200, text=f"body of {request.url.path}")
+
+        urls = ["https://example.test/a", "https://example.test/missing", "https://example.test/b"]
+        results = asyncio.run(
+            download_many(
+                urls,
+                headers={"User-Agent": "test"},
+                rate_limiter=TokenBucket(rate=1000, burst=10),
+                transport=httpx.MockTransport(handler),
+            )
+        )
+
+        self.assertEqual(results[0], "body of /a")
+        self.assertIsInstance(results[1], httpx.HTTPStatusError)
+        self.assertEqual(results[2], "body of /b")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,18 +1,28 @@
 """Integration tests for classify_8k.py end-to-end functionality."""
 
+import asyncio
 import unittest
 import tempfile
-import json
 import os
 import sys
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, MagicMock
 from io import StringIO
 
 # Add the project root to sys.path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
 # Import the main classification function
-from classify_8k import classify_8k_filing, print_results, main
+import classify_8k
+import src.llm.client as llm_client_module
+from classify_8k import (
+    _render_results,
+    classify_8k_filing,
+    classify_8k_filing_async,
+    classify_8k_filings_batch,
+    is_url,
+    main,
+    print_results,
+)
 from src.parser.event_classifier import PromptStrategy
 from src.parser.schema.event_types import ClassificationResult
 
@@ -20,16 +30,27 @@ from src.parser.schema.event_types import ClassificationResult
 class TestClassify8KIntegration(unittest.TestCase):
     """Integration tests for the complete 8-K classification pipeline."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Read the sample fixture once for the whole class."""
+        cls.sample_8k_path = "tests/fixtures/sample_8k.html"
+        with open(cls.sample_8k_path, "r", encoding="utf-8") as f:
+            cls.sample_8k_content = f.read()
+
     def setUp(self):
-        """Set up test fixtures and temporary config files."""
-        # Create temporary LLM config file
+        """Set up test fixtures."""
+        # Drop shared classifier/client so each test builds them under its own mocks
+        classify_8k._CLASSIFIER = None
+        llm_client_module._SHARED_CLIENTS.clear()
+
+        # LLM config
         self.llm_config = {
             "provider": "ollama",
             "model": "test-model",
             "options": {"temperature": 0.1, "timeout": 30},
         }
 
-        # Create temporary event config
+        # Event config
         self.event_config = {
             "Financial Event": {
                 "relevant": True,
@@ -56,15 +77,6 @@ class TestClassify8KIntegration(unittest.TestCase):
             },
         }
 
-        # Create temporary config files
-        self.temp_llm_config = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        json.dump(self.llm_config, self.temp_llm_config)
-        self.temp_llm_config.close()
-
-        self.temp_event_config = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        json.dump(self.event_config, self.temp_event_config)
-        self.temp_event_config.close()
-
         # Expected LLM response for the sample 8K fixture
         self.expected_llm_response = """REASONING:
 The 8-K filing reports Apple Inc.'s financial results for its fiscal 2023 fourth quarter, which ended on September 30, 2023. This is a quarterly earnings announcement containing revenue, profit, and other financial metrics that are material to investors and stakeholders. The filing includes comprehensive financial data and operational results that directly impact stock valuation and business performance assessment.
@@ -72,22 +84,11 @@ The 8-K filing reports Apple Inc.'s financial results for its fiscal 2023 fourth
 CLASSIFICATION:
 Event Type: Financial Event, Relevant: true"""
 
-        # Path to sample fixture
-        self.sample_8k_path = "tests/fixtures/sample_8k.html"
-
         # Real SEC URL for testing
         self.real_sec_url = (
             "https://www.sec.gov/Archives/edgar/data/320193/000119312521328151/d259993d8k.htm"
         )
 
-    def tearDown(self):
-        """Clean up temporary files."""
-        try:
-            os.unlink(self.temp_llm_config.name)
-            os.unlink(self.temp_event_config.name)
-        except OSError:
-            pass
-
     def test_real_data_integration_board_appointment(self):
         """Test with real SEC filing URL - board appointment event (no mocking)."""
         print(f"\nTesting with real SEC URL: {self.real_sec_url}")
@@ -203,6 +204,38 @@ Event Type: Financial Event, Relevant: true"""
         self.assertIn("Results of Operations and Financial Condition", extracted_text)
         self.assertIn("financial results", extracted_text)
 
+    @patch("src.parser.event_classifier.EventClassifier.classify")
+    def test_classify_8k_filing_async_matches_sync(self, mock_classify):
+        """Test that the async pipeline produces the same result as the sync one."""
+        mock_classify.return_value = ClassificationResult(
+            event_type="Financial Event", relevant=True, confidence=0.85
+        )
+
+        sync_result = classify_8k_filing(input_source=self.sample_8k_path)
+        async_result = asyncio.run(classify_8k_filing_async(input_source=self.sample_8k_path))
+
+        self.assertIsNotNone(async_result)
+        self.assertEqual(async_result, sync_result)
+        self.assertIsNone(asyncio.run(classify_8k_filing_async("nonexistent_8k.html")))
+
+    @patch("src.parser.event_classifier.EventClassifier.classify")
+    def test_classify_8k_filings_batch(self, mock_classify):
+        """Test that batch classification returns one result per source, in order."""
+        mock_classify.return_value = ClassificationResult(
+            event_type="Financial Event", relevant=True, confidence=0.85
+        )
+
+        results = asyncio.run(
+            classify_8k_filings_batch(
+                [self.sample_8k_path, "nonexistent_8k.html", self.sample_8k_path]
+            )
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertIsNone(results[1])
+        self.assertEqual(results[0], classify_8k_filing(input_source=self.sample_8k_path))
+        self.assertEqual(results[2], results[0])
+
     @patch("src.parser.event_classifier.EventClassifier.classify")
     def test_classify_8k_filing_different_strategies(self, mock_classify):
         """Test classification with different prompt strategies."""
@@ -255,7 +288,7 @@ Event Type: Financial Event, Relevant: true"""
         # Should return None when classification fails
         self.assertIsNone(result)
 
-    @patch("requests.get")
+    @patch("classify_8k._SESSION.get")
     @patch("src.llm.client.LLMClient")
     @patch("src.parser.event_classifier.load_default_event_config")
     def test_classify_8k_filing_url_download_mocked(
@@ -277,12 +310,12 @@ Event Type: Financial Event, Relevant: true"""
         }
 
         # Read the sample file content
-        with open(self.sample_8k_path, "r", encoding="utf-8") as f:
-            sample_content = f.read()
+        sample_content = self.sample_8k_content
 
-        # Mock HTTP response
-        mock_response = Mock()
-        mock_response.text = sample_content
+        # Mock streamed HTTP response
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.return_value = [sample_content.encode("utf-8")]
         mock_response.raise_for_status = Mock()
         mock_requests.return_value = mock_response
 
@@ -305,8 +338,7 @@ Event Type: Financial Event, Relevant: true"""
         # Verify HTTP request was made
         mock_requests.assert_called_once()
 
-    @patch("sys.stdout", new_callable=StringIO)
-    def test_print_results_output_format(self, mock_stdout):
+    def test_print_results_output_format(self):
         """Test that print_results produces expected output format."""
         sample_results = {
             "input_source": "test_file.html",
@@ -322,9 +354,7 @@ Event Type: Financial Event, Relevant: true"""
             },
         }
 
-        print_results(sample_results)
-
-        output = mock_stdout.getvalue()
+        output = _render_results(sample_results)
 
         # Verify key information is in the output
         self.assertIn("8-K FILING CLASSIFICATION RESULTS", output)
@@ -334,6 +364,10 @@ Event Type: Financial Event, Relevant: true"""
         self.assertIn("Yes", output)  # Relevant status
         self.assertIn("earnings and financial results", output)  # Reasoning
 
+        with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+            print_results(sample_results)
+        self.assertEqual(mock_stdout.getvalue(), output)
+
     @patch("sys.argv", ["classify_8k.py", "tests/fixtures/sample_8k.html", "--strategy", "basic"])
     @patch("src.parser.event_classifier.EventClassifier.classify")
     @patch("sys.stdout", new_callable=StringIO)
@@ -387,29 +421,34 @@ Event Type: Financial Event, Relevant: true"""
         mock_llm_client.return_value = mock_client_instance
 
         # Capture logging output
-        import logging
-        from io import StringIO
-
-        log_capture = StringIO()
-        handler = logging.StreamHandler(log_capture)
-        logging.getLogger().addHandler(handler)
-        logging.getLogger().setLevel(logging.DEBUG)
-
-        try:
+        with self.assertLogs(level="DEBUG") as captured:
             result = classify_8k_filing(
                 input_source=self.sample_8k_path, strategy=PromptStrategy.DETAILED, verbose=True
             )
 
-            self.assertIsNotNone(result)
+        self.assertIsNotNone(result)
+
+        # Check that verbose logging was produced
+        log_output = "\n".join(captured.output)
+        self.assertIn("Reading file", log_output)
+        self.assertIn("Extracting text", log_output)
+        self.assertIn("Classifying event", log_output)
 
-            # Check that verbose logging was produced
-            log_output = log_capture.getvalue()
-            self.assertIn("Reading file", log_output)
-            self.assertIn("Extracting text", log_output)
-            self.assertIn("Classifying event", log_output)
+    def test_extract_file_text_reparses_modified_file(self):
+        """Test that cached file extraction is reused until the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "filing.html")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("<p>Apple reported quarterly revenue of $90 billion.</p>")
+            first = classify_8k.extract_file_text(path)
+            self.assertIs(classify_8k.extract_file_text(path), first)
 
-        finally:
-            logging.getLogger().removeHandler(handler)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("<p>Apple appointed a new Chief Financial Officer.</p>")
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            self.assertIn("Chief Financial Officer", classify_8k.extract_file_text(path))
 
     def test_sample_fixture_contains_expected_content(self):
         """Verify the sample fixture has the expected content for testing."""
@@ -419,8 +458,7 @@ Event Type: Financial Event, Relevant: true"""
             f"Sample fixture not found at {self.sample_8k_path}",
         )
 
-        with open(self.sample_8k_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = self.sample_8k_content
 
         # Verify key content that should trigger Financial Event classification
         expected_content = [
@@ -437,5 +475,28 @@ Event Type: Financial Event, Relevant: true"""
             )
 
 
+class TestIsUrl(unittest.TestCase):
+    """Test URL detection for classify_8k inputs."""
+
+    def test_is_url_matrix(self):
+        """Test that only HTTP(S) URLs are treated as URLs."""
+        cases = {
+            "https://www.sec.gov/Archives/edgar/data/320193/test.htm": True,
+            "http://www.sec.gov/test.htm": True,
+            "HTTPS://WWW.SEC.GOV/test.htm": True,
+            "ftp://ftp.sec.gov/test.htm": False,
+            "tests/fixtures/sample_8k.html": False,
+            "/tmp/filing.html": False,
+            "C:\\filings\\sample_8k.html": False,
+            "file:///tmp/filing.html": False,
+            "https": False,
+            "": False,
+            None: False,
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(is_url(value), expected)
+
+
 if __name__ == "__main__":
     unittest.main()
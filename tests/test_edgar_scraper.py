@@ -0,0 +1,67 @@
+"""Tests for the SEC EDGAR scraper."""
+
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from src.scraper.edgar_scraper import EdgarScraper
+from src.scraper.rate_limit import TokenBucket
+
+
+def _response(status_code: int, content: bytes = b"", headers=None) -> Mock:
+    response = Mock(status_code=status_code, content=content, headers=headers or {})
+    response.raise_for_status.return_value = None
+    return response
+
+
+class TestEdgarScraper(unittest.TestCase):
+    """Test cases for EdgarScraper."""
+
+    def setUp(self):
+        """Set up a temporary cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def test_submissions_cache_uses_conditional_request(self):
+        """Test that cached submissions are revalidated and reused on 304."""
+        scraper = EdgarScraper(rate_limiter=TokenBucket(rate=1000, burst=10),
+                               cache_dir=self.temp_dir.name)
+        body = b'{"cik": "320193", "name": "Apple Inc."}'
+        responses = [
+            _response(200, body, {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            _response(304),
+        ]
+
+        with patch.object(scraper.session, "get", side_effect=responses) as get:
+            first = scraper.get_company_submissions("320193")
+            second = scraper.get_company_submissions("320193")
+
+        self.assertEqual(first, {"cik": "320193", "name": "Apple Inc."})
+        self.assertEqual(second, first)
+        self.assertEqual(get.call_args_list[0].kwargs["headers"], {})
+        self.assertEqual(get.call_args_list[1].kwargs["headers"], {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        })
+
+    def test_filter_8k_filings_by_date(self):
+        """Test that only 8-Ks inside the inclusive date range are returned."""
+        submissions = {
+            "cik": "320193",
+            "name": "Apple Inc.",
+            "filings": {"recent": {
+                "form": ["8-K", "10-Q", "8-K", "8-K", "8-K"],
+                "filingDate": ["2023-12-31", "2024-01-15", "2024-01-01", "2024-02-01", "2024-02-02"],
+                "accessionNumber": ["0001", "0002", "0003", "0004", "0005"],
+            }},
+        }
+
+        filings = EdgarScraper().filter_8k_filings(submissions, "2024-01-01", "2024-2-1")
+
+        self.assertEqual([f.accession_number for f in filings], ["0003", "0004"])
+        with self.assertRaises(ValueError):
+            EdgarScraper().filter_8k_filings(submissions, "01/01/2024")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
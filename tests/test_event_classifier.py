@@ -1,10 +1,35 @@
 """Tests for EventClassifier functionality."""
 
+import asyncio
+import atexit
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
-from src.parser.event_classifier import EventClassifier, PromptStrategy
-from src.parser.schema.event_types import ClassificationResult, validate_classification_result
+import numpy as np
+
+from src.llm.client import LLMClient
+from src.llm.semantic_cache import SemanticCache
+from src.parser.event_classifier import MAX_INPUT_CHARS, EventClassifier, PromptStrategy
+from src.parser.schema.event_types import (
+    ClassificationResult,
+    parse_validation_status,
+    validate_classification_result,
+)
+
+
+def _bag_of_words_encoder(texts):
+    """Deterministic toy encoder: hashed bag-of-words counts."""
+    vectors = np.zeros((len(texts), 64), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in text.lower().split():
+            vectors[row, sum(map(ord, word)) % 64] += 1.0
+    return vectors
+
+
+def _truncating_encoder(texts, max_words=128):
+    """Toy encoder that, like sentence-transformers, ignores input past a length cap."""
+    return _bag_of_words_encoder([" ".join(text.split()[:max_words]) for text in texts])
 
 
 class TestEventClassifier(unittest.TestCase):
@@ -51,6 +76,7 @@ Event Type: Acquisition, Relevant: true"""
         self.assertEqual(len(classifier.event_types), 2)
         self.assertIn("Acquisition", classifier.event_types)
         self.assertIn("Other", classifier.event_types)
+        self.assertEqual(classifier.relevant_event_types, ("Acquisition",))
 
         # Verify LLM client was initialized
         mock_llm_client.assert_called_once_with(config_path="dummy_llm.json")
@@ -102,6 +128,31 @@ Event Type: Acquisition, Relevant: true"""
         # Should have tried multiple times (max_retries + 1)
         self.assertEqual(mock_client_instance.generate.call_count, 3)
 
+    def test_prompt_semantic_cache_keys_on_filing_text(self):
+        """Test that filings behind a long static prefix do not share a cache entry."""
+        client = LLMClient(config={"provider": "ollama", "model": "test-model", "warmup": False})
+        client.semantic_cache = SemanticCache(
+            model_name="test-model", encoder=_truncating_encoder, cache_dir=None
+        )
+        client.provider = Mock()
+        client.provider.generate.side_effect = [
+            "Event Type: Acquisition, Relevant: true",
+            "Event Type: Other, Relevant: false",
+        ]
+        classifier = EventClassifier(
+            llm_client=client, event_config_dict=self.sample_event_config, use_rules=False
+        )
+
+        first = classifier.classify(self.sample_text, strategy=PromptStrategy.DETAILED)
+        second = classifier.classify(
+            "The board declared a quarterly dividend of $0.24 per share.",
+            strategy=PromptStrategy.DETAILED,
+        )
+
+        self.assertEqual(client.provider.generate.call_count, 2)
+        self.assertEqual(first.event_type, "Acquisition")
+        self.assertEqual(second.event_type, "Other")
+
     @patch("src.parser.event_classifier.LLMClient")
     def test_classify_empty_text(self, mock_llm_client):
         """Test classification with empty text."""
@@ -178,6 +229,357 @@ Event Type: Acquisition, Relevant: true"""
         # All prompts should be different
         self.assertEqual(len(set(prompts)), len(strategies))
 
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_cached_prompt_parts_match_full_render(self, mock_llm_client):
+        """Test that prefix + text + suffix equals the fully rendered template."""
+        mock_llm_client.return_value = Mock()
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+
+        for strategy in PromptStrategy:
+            with self.subTest(strategy=strategy):
+                self.assertEqual(
+                    classifier._generate_prompt(self.sample_text, strategy),
+                    classifier._render_prompt(self.sample_text, strategy),
+                )
+
+        # Warmup is offered the static prefix of every strategy
+        warmup_prompts = mock_llm_client.return_value.warmup.call_args[0][0]
+        self.assertEqual(len(warmup_prompts), len(PromptStrategy))
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_generate_prompt_truncates_long_text(self, mock_llm_client):
+        """Test that filing text is capped at MAX_INPUT_CHARS in the prompt."""
+        mock_llm_client.return_value = Mock()
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+
+        text = "a" * MAX_INPUT_CHARS + "TAIL"
+        prompt = classifier._generate_prompt(text, PromptStrategy.BASIC)
+
+        self.assertIn("a" * MAX_INPUT_CHARS, prompt)
+        self.assertNotIn("TAIL", prompt)
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_max_input_chars_configurable(self, mock_llm_client):
+        """Test that the input cap can be raised or disabled per classifier."""
+        mock_llm_client.return_value = Mock()
+        text = "a" * MAX_INPUT_CHARS + "TAIL"
+
+        for max_input_chars in (None, 0, MAX_INPUT_CHARS + 4):
+            with self.subTest(max_input_chars=max_input_chars):
+                classifier = EventClassifier(
+                    llm_config_path="dummy_llm.json",
+                    event_config_dict=self.sample_event_config,
+                    max_input_chars=max_input_chars,
+                )
+                self.assertIn(text, classifier._generate_prompt(text, PromptStrategy.BASIC))
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        with self.assertLogs("src.parser.event_classifier", level="INFO") as logs:
+            classifier._generate_prompt(text, PromptStrategy.BASIC)
+        self.assertTrue(any("Truncating filing text" in line for line in logs.output))
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_prompt_parts_shared_across_classifiers(self, mock_llm_client):
+        """Test that classifiers with the same event config share rendered prompt text."""
+        mock_llm_client.return_value = Mock()
+        first = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        second = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        other = EventClassifier(
+            llm_config_path="dummy_llm.json",
+            event_config_dict={**self.sample_event_config, "Earnings": {"relevant": True}},
+        )
+
+        for strategy in PromptStrategy:
+            self.assertIs(first._prompt_parts[strategy], second._prompt_parts[strategy])
+            self.assertNotEqual(first._prompt_parts[strategy], other._prompt_parts[strategy])
+            self.assertEqual(
+                first._generate_prompt(self.sample_text, strategy),
+                first._render_prompt(self.sample_text, strategy),
+            )
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_classify_item_code_skips_llm(self, mock_llm_client):
+        """Test that filings with an unambiguous Item code bypass the LLM."""
+        mock_client_instance = Mock()
+        mock_llm_client.return_value = mock_client_instance
+
+        event_config = {
+            **self.sample_event_config,
+            "Financial Event": {"relevant": True, "description": "Financial results"},
+        }
+        classifier = EventClassifier(llm_config_path="dummy_llm.json", event_config_dict=event_config)
+        result = classifier.classify("Item 2.02 Results of Operations and Financial Condition")
+
+        self.assertEqual(result.event_type, "Financial Event")
+        self.assertTrue(result.relevant)
+        mock_client_instance.generate.assert_not_called()
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_result_cache_reuses_near_duplicate_filing(self, mock_llm_client):
+        """Test that a near-duplicate filing text reuses the cached LLM result."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate.return_value = self.valid_llm_response
+        mock_llm_client.return_value = mock_client_instance
+
+        result_cache = SemanticCache(
+            model_name="test-model", threshold=0.9, cache_dir=None, encoder=_bag_of_words_encoder
+        )
+        atexit.unregister(result_cache.save)
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json",
+            event_config_dict=self.sample_event_config,
+            result_cache=result_cache,
+        )
+
+        first = classifier.classify(self.sample_text)
+        second = classifier.classify(self.sample_text.replace("$1.2", "$1.3"))
+
+        self.assertEqual(second.event_type, first.event_type)
+        self.assertEqual(second.relevant, first.relevant)
+        mock_client_instance.generate.assert_called_once()
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_batch_methods_use_result_cache(self, mock_llm_client):
+        """Test that batch classification reads and writes the result cache."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate_many.side_effect = lambda prompts, **kwargs: [
+            self.valid_llm_response for _ in prompts
+        ]
+        mock_llm_client.return_value = mock_client_instance
+
+        result_cache = SemanticCache(
+            model_name="test-model", threshold=0.9, cache_dir=None, encoder=_bag_of_words_encoder
+        )
+        atexit.unregister(result_cache.save)
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json",
+            event_config_dict=self.sample_event_config,
+            result_cache=result_cache,
+        )
+        texts = [
+            self.sample_text,
+            "Apple Inc. completed its merger with ABC Holdings, a maker of chips, on Monday morning.",
+        ]
+
+        first = classifier.classify_batch(texts)
+        self.assertEqual(len(result_cache), 2)
+        mock_client_instance.generate_many.reset_mock()
+
+        near_duplicates = [text.replace("Apple", "APPLE") for text in texts]
+        second = classifier.classify_batch(near_duplicates)
+        third = classifier.classify_batched(near_duplicates)
+
+        mock_client_instance.generate_many.assert_not_called()
+        for results in (second, third):
+            self.assertEqual([r.event_type for r in results], [r.event_type for r in first])
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_result_cache_keys_on_item_sections(self, mock_llm_client):
+        """Test that same-company filings with different Items do not share a cached result."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate.side_effect = [
+            "Event Type: Acquisition, Relevant: true",
+            "Event Type: Other, Relevant: false",
+        ]
+        mock_llm_client.return_value = mock_client_instance
+
+        result_cache = SemanticCache(
+            model_name="test-model", threshold=0.92, cache_dir=None, encoder=_truncating_encoder
+        )
+        atexit.unregister(result_cache.save)
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json",
+            event_config_dict=self.sample_event_config,
+            result_cache=result_cache,
+            use_rules=False,
+        )
+        cover_page = " ".join(
+            ["Apple Inc. One Apple Park Way Cupertino California 95014 IRS 94-2404110"] * 20
+        )
+
+        first = classifier.classify(
+            f"{cover_page}\nItem 2.01 Completion of Acquisition. Apple acquired XYZ Corp."
+        )
+        second = classifier.classify(
+            f"{cover_page}\nItem 8.01 Other Events. The board declared a quarterly dividend."
+        )
+
+        self.assertEqual(mock_client_instance.generate.call_count, 2)
+        self.assertEqual(first.event_type, "Acquisition")
+        self.assertEqual(second.event_type, "Other")
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_aclassify_batch(self, mock_llm_client):
+        """Test async batch classification with a concurrency bound."""
+        in_flight = []
+        peak = []
+
+        async def agenerate(prompt, **kwargs):
+            in_flight.append(prompt)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(prompt)
+            return self.valid_llm_response
+
+        mock_client_instance = Mock()
+        mock_client_instance.agenerate = agenerate
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        texts = [f"{self.sample_text} ({i})" for i in range(5)] + [""]
+        results = asyncio.run(classifier.aclassify_batch(texts, max_concurrency=2))
+
+        self.assertEqual([r.event_type for r in results[:5]], ["Acquisition"] * 5)
+        self.assertIsNone(results[5])
+        self.assertLessEqual(max(peak), 2)
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_classify_batch(self, mock_llm_client):
+        """Test batch classification with per-text fallback on parse failure."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate_many.return_value = [
+            self.valid_llm_response,
+            self.invalid_llm_response,
+        ]
+        mock_client_instance.generate.return_value = "Event Type: Other, Relevant: false"
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        results = classifier.classify_batch([self.sample_text, "Routine filing text.", "   "])
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(results[0].event_type, "Acquisition")
+        self.assertEqual(results[1].event_type, "Other")
+        self.assertIsNone(results[2])
+
+        # Empty text is never sent; the unparseable response is retried individually
+        self.assertEqual(len(mock_client_instance.generate_many.call_args[0][0]), 2)
+        mock_client_instance.generate.assert_called_once()
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_classify_batch_max_batch_size(self, mock_llm_client):
+        """Test that max_batch_size splits prompts into several rounds."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate_many.side_effect = lambda prompts, **kwargs: [
+            self.valid_llm_response
+        ] * len(prompts)
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        texts = [f"{self.sample_text} Filing {i}." for i in range(5)]
+        results = classifier.classify_batch(texts, max_batch_size=2)
+
+        self.assertEqual([r.event_type for r in results], ["Acquisition"] * 5)
+        batch_sizes = [len(c[0][0]) for c in mock_client_instance.generate_many.call_args_list]
+        self.assertEqual(batch_sizes, [2, 2, 1])
+
+    @patch.dict("os.environ", {"OLLAMA_NUM_PARALLEL": "2"})
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_classify_batch_retries_concurrently(self, mock_llm_client):
+        """Test that per-text fallbacks run in parallel up to OLLAMA_NUM_PARALLEL."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def generate(prompt, **kwargs):
+            # Both fallbacks must be in flight at once to pass the barrier
+            barrier.wait()
+            return self.valid_llm_response
+
+        mock_client_instance = Mock()
+        mock_client_instance.generate_many.return_value = [self.invalid_llm_response] * 2
+        mock_client_instance.generate.side_effect = generate
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        results = classifier.classify_batch([self.sample_text, self.sample_text + " Amended."])
+
+        self.assertEqual([r.event_type for r in results], ["Acquisition", "Acquisition"])
+        self.assertEqual(mock_client_instance.generate_many.call_args[1]["max_concurrency"], 2)
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_classify_batched(self, mock_llm_client):
+        """Test that filings are packed into one JSON-array request per batch."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate_many.return_value = [
+            '```json\n[{"id": 1, "event_type": "Acquisition", "relevant": true, '
+            '"reasoning": "Announces a merger."}, '
+            '{"id": 2, "event_type": "other", "relevant": false, "reasoning": "Routine."}]\n```',
+            '[{"id": 1, "event_type": "Acquisition", "relevant": false, "reasoning": "Deal."}]',
+        ]
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        texts = [self.sample_text, "Annual meeting date set.", "Company agrees to merger."]
+        results = classifier.classify_batched(texts, batch_size=2)
+
+        self.assertEqual([r.event_type for r in results], ["Acquisition", "Other", "Acquisition"])
+        # Relevance comes from the event configuration
+        self.assertEqual([r.relevant for r in results], [True, False, True])
+        self.assertEqual(results[0].reasoning, "Announces a merger.")
+
+        prompts = mock_client_instance.generate_many.call_args[0][0]
+        self.assertEqual(len(prompts), 2)
+        self.assertIn("Filing 2:\nAnnual meeting date set.", prompts[0])
+        self.assertIn("JSON array", prompts[0])
+        mock_client_instance.generate.assert_not_called()
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_classify_batched_falls_back_on_invalid_json(self, mock_llm_client):
+        """Test that filings in an unparseable batch are classified individually."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate_many.return_value = ["Filing 1 is an acquisition."]
+        mock_client_instance.generate.return_value = self.valid_llm_response
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        results = classifier.classify_batched([self.sample_text, self.sample_text + " Amended."])
+
+        self.assertEqual([r.event_type for r in results], ["Acquisition", "Acquisition"])
+        self.assertEqual(mock_client_instance.generate.call_count, 2)
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_batch_methods_classify_duplicates_once(self, mock_llm_client):
+        """Test that identical texts in a batch are sent to the LLM only once."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate_many.side_effect = lambda prompts, **kwargs: [
+            self.valid_llm_response
+        ] * len(prompts)
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        other = "Company agrees to merger with a competitor."
+        texts = [self.sample_text, other, self.sample_text, self.sample_text]
+        results = classifier.classify_batch(texts)
+
+        self.assertEqual(len(mock_client_instance.generate_many.call_args[0][0]), 2)
+        self.assertEqual([r.event_type for r in results], ["Acquisition"] * 4)
+        self.assertIsNot(results[0], results[2])
+        self.assertEqual(results[0].to_dict(), results[3].to_dict())
+
     @patch("src.parser.event_classifier.LLMClient")
     def test_generate_prompt_invalid_strategy(self, mock_llm_client):
         """Test prompt generation with invalid strategy."""
@@ -286,5 +688,30 @@ Event Type: Acquisition, Relevant: true"""
         self.assertTrue(result.relevant)
 
 
+    def test_parse_validation_status(self):
+        """Test VALID/INVALID detection in validation responses."""
+        self.assertTrue(parse_validation_status("REASONING:\nLooks right.\n\nVALIDATION:\nStatus: VALID"))
+        self.assertFalse(
+            parse_validation_status("VALIDATION:\nStatus: INVALID\nIssues: Wrong event type")
+        )
+        self.assertFalse(parse_validation_status("Status: VALID\nIssues: actually INVALID"))
+        self.assertFalse(parse_validation_status("No verdict given."))
+
+    @patch("src.parser.event_classifier.LLMClient")
+    def test_validate_classification(self, mock_llm_client):
+        """Test that validate_classification sends the validation prompt."""
+        mock_client_instance = Mock()
+        mock_client_instance.generate.return_value = "VALIDATION:\nStatus: VALID\nIssues: None"
+        mock_llm_client.return_value = mock_client_instance
+
+        classifier = EventClassifier(
+            llm_config_path="dummy_llm.json", event_config_dict=self.sample_event_config
+        )
+        result = ClassificationResult(event_type="Acquisition", relevant=True)
+
+        self.assertTrue(classifier.validate_classification(self.sample_text, result))
+        prompt = mock_client_instance.generate.call_args[0][0]
+        self.assertIn("Proposed Classification: Event Type: Acquisition, Relevant: true", prompt)
+
 if __name__ == "__main__":
     unittest.main()
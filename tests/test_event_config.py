@@ -10,7 +10,9 @@ from src.parser.schema.event_types import (
     load_event_config,
     load_default_event_config,
     validate_classification_result,
+    validate_many,
 )
+from src.parser.prompts import prompt_templates
 from src.parser.prompts.classification_prompts import (
     ClassificationPrompts,
     get_basic_prompt,
@@ -141,6 +143,54 @@ class TestEventConfig(unittest.TestCase):
         finally:
             os.unlink(temp_file_path)
 
+    def test_load_event_config_reloads_after_edit(self):
+        """Test that the cached config is invalidated when the file changes."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(self.sample_config, f)
+            temp_file_path = f.name
+
+        try:
+            self.assertEqual(len(load_default_event_config(temp_file_path)), 2)
+
+            with open(temp_file_path, "w") as f:
+                json.dump({"Only Event": {"relevant": True}}, f)
+            stat = os.stat(temp_file_path)
+            os.utime(temp_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+            config = load_default_event_config(temp_file_path)
+            self.assertEqual(list(config), ["Only Event"])
+        finally:
+            os.unlink(temp_file_path)
+
+    def test_loaded_configs_do_not_share_cached_json(self):
+        """Test that mutating a loaded config leaves the cached file content intact."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(self.sample_config, f)
+            temp_file_path = f.name
+
+        try:
+            first = load_default_event_config(temp_file_path)
+            first["Test Event"].keywords.append("mutated")
+
+            second = load_default_event_config(temp_file_path)
+            self.assertNotIn("mutated", second["Test Event"].keywords)
+        finally:
+            os.unlink(temp_file_path)
+
+    def test_load_event_config_rejects_malformed_entries(self):
+        """Test that entries with the wrong shape are rejected at load time."""
+        malformed = [
+            {"Bad": ["not", "an", "object"]},
+            {"Bad": {"relevant": "yes"}},
+            {"Bad": {"description": 42}},
+            {"Bad": {"keywords": "merger"}},
+            {"Bad": {"keywords": ["merger", 7]}},
+        ]
+        for config in malformed:
+            with self.subTest(config=config):
+                with self.assertRaises(ValueError):
+                    load_event_config(config)
+
     def test_event_config_with_missing_fields(self):
         """Test event configuration with missing optional fields."""
         minimal_config = {
@@ -252,6 +302,40 @@ class TestEventConfig(unittest.TestCase):
 
         self.assertIsNone(parsed)
 
+    def test_validate_many(self):
+        """Test batch validation matches validating each response on its own."""
+        valid_types = ["Acquisition", "Personnel Change", "Other"]
+        responses = [
+            "Event Type: acquisition, Relevant: true",
+            "CLASSIFICATION: Event Type: Personnel Change, Relevant: false",
+            "Event Type: Invalid Type, Relevant: true",
+            "REASONING: New CFO appointed.\nType: Personnel changes, Relevant: true",
+        ]
+
+        parsed = validate_many(responses, valid_types)
+
+        self.assertEqual(len(parsed), len(responses))
+        self.assertIsNone(parsed[2])
+        self.assertEqual(parsed[0].event_type, "Acquisition")
+        self.assertEqual(parsed[3].event_type, "Personnel Change")
+        for response, result in zip(responses, parsed):
+            single = validate_classification_result(response, valid_types)
+            self.assertEqual(result and result.to_dict(), single and single.to_dict())
+
+    def test_validate_many_repeated_responses(self):
+        """Test repeated responses give equal but independent results."""
+        valid_types = ["Acquisition", "Other"]
+        response = "Event Type: Acquisition, Relevant: true"
+
+        first, second, invalid, invalid_again = validate_many(
+            [response, response, "no classification", "no classification"], valid_types
+        )
+
+        self.assertEqual(first.to_dict(), second.to_dict())
+        self.assertIsNot(first, second)
+        self.assertIsNone(invalid)
+        self.assertIsNone(invalid_again)
+
     def test_classification_result_to_dict(self):
         """Test ClassificationResult to_dict method."""
         result = ClassificationResult(
@@ -493,6 +577,56 @@ class TestClassificationPrompts(unittest.TestCase):
         # Note: Our sample text happens to contain "XYZ Corp" but that's in the "Now classify" section
         self.assertNotIn("quarterly earnings results", prompt)  # This is from default examples
 
+    def test_split_prompt(self):
+        """Test that split_prompt returns the static parts around the text."""
+        event_types = ["Acquisition", "Other"]
+        prefix, suffix = ClassificationPrompts.split_prompt(
+            lambda text: ClassificationPrompts.basic_classification_prompt(text, event_types)
+        )
+
+        text = "Apple acquired XYZ Corp."
+        self.assertEqual(
+            prefix + text + suffix,
+            ClassificationPrompts.basic_classification_prompt(text, event_types),
+        )
+        # All static content precedes the filing text so prompts share a long prefix
+        self.assertIn("Acquisition, Other", prefix)
+        self.assertEqual(suffix, "\n\nBegin your analysis:")
+
+    def test_batch_basic_prompt(self):
+        """Test that batch prompts match the single-text basic prompt."""
+        texts = ["Apple acquired XYZ Corp.", "CEO resigned."]
+        prompts = ClassificationPrompts.batch_basic_prompt(texts, self.event_types)
+
+        self.assertEqual(
+            prompts,
+            [ClassificationPrompts.basic_classification_prompt(t, self.event_types) for t in texts],
+        )
+
+    def test_compiled_templates_match_format(self):
+        """Test that precompiled template renderers match str.format."""
+        fields = {
+            "text": "Filing {with braces}",
+            "event_types": "Acquisition, Other",
+            "event_descriptions": "- Acquisition: Mergers",
+            "examples_text": "Example 1:",
+            "classification": "Event Type: Other, Relevant: false",
+            "filings": "Filing 1:\nText",
+            "count": 2,
+        }
+        for name in (
+            "BASIC_CLASSIFICATION",
+            "DETAILED_CLASSIFICATION",
+            "BATCHED_DETAILED_CLASSIFICATION",
+            "CHAIN_OF_THOUGHT",
+            "FEW_SHOT",
+            "VALIDATION",
+        ):
+            with self.subTest(template=name):
+                template = getattr(prompt_templates, f"{name}_TEMPLATE")
+                render = getattr(prompt_templates, f"{name}_RENDER")
+                self.assertEqual(render(**fields), template.format(**fields))
+
     def test_validation_prompt(self):
         """Test validation prompt generation."""
         classification = "Event Type: Acquisition, Relevant: true"
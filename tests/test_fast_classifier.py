@@ -0,0 +1,56 @@
+"""Tests for the rule-based 8-K Item prefilter."""
+
+import unittest
+
+from src.parser.fast_classifier import FastClassifier
+
+
+class TestFastClassifier(unittest.TestCase):
+    """Test cases for FastClassifier."""
+
+    def setUp(self):
+        """Set up a prefilter over the default event types."""
+        self.classifier = FastClassifier(
+            ["Financial Event", "Personnel Change", "Capital Market Event", "Other"]
+        )
+
+    def test_single_mapped_item(self):
+        """Test that a single mapped Item is classified by rule."""
+        text = (
+            "Item 2.02 Results of Operations and Financial Condition\n"
+            "Apple reported quarterly revenue of $90 billion.\n"
+            "Item 9.01 Financial Statements and Exhibits"
+        )
+        result = self.classifier.classify(text)
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.event_type, "Financial Event")
+        self.assertEqual(result.raw_response, "rule:Item 2.02")
+        self.assertEqual(self.classifier.hit_rate, 1.0)
+
+    def test_conflicting_items_fall_through(self):
+        """Test that Items mapping to different event types are left to the LLM."""
+        text = "ITEM 2.02 Results of Operations\nITEM 5.02 Departure of Directors"
+
+        self.assertIsNone(self.classifier.classify(text))
+
+    def test_unmapped_item_falls_through(self):
+        """Test that an ambiguous Item (e.g. 1.01) prevents a rule match."""
+        text = "Item 1.01 Entry into a Material Definitive Agreement\nItem 2.03 Creation of Obligation"
+
+        self.assertIsNone(self.classifier.classify(text))
+
+    def test_no_items_falls_through(self):
+        """Test that text without Item headings is left to the LLM."""
+        self.assertIsNone(self.classifier.classify("Apple announced a new product line."))
+        self.assertEqual(self.classifier.hit_rate, 0.0)
+
+    def test_rules_for_unconfigured_types_dropped(self):
+        """Test that rules targeting event types outside the config are ignored."""
+        classifier = FastClassifier(["Other"])
+
+        self.assertIsNone(classifier.classify("Item 2.02 Results of Operations"))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
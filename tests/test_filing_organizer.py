@@ -0,0 +1,139 @@
+"""Tests for FilingOrganizer output."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from src.parser.schema.event_types import ClassificationResult
+from src.scraper.edgar_scraper import FilingInfo
+from src.scraper.filing_organizer import FilingOrganizer
+
+
+def _make_filing(accession_number: str) -> FilingInfo:
+    filing = FilingInfo(
+        cik="320193",
+        company_name="Apple Inc.",
+        form="8-K",
+        filing_date="2024-02-01",
+        accession_number=accession_number,
+        document_url=f"https://www.sec.gov/Archives/edgar/data/320193/{accession_number}.htm",
+    )
+    filing._raw_content = "<html><body><p>Apple reported quarterly results today.</p></body></html>"
+    return filing
+
+
+class TestFilingOrganizer(unittest.TestCase):
+    """Test cases for FilingOrganizer."""
+
+    def setUp(self):
+        """Set up a temporary data directory and a mocked classifier."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.classifier = Mock()
+        self.classifier.classify_batch.side_effect = lambda texts, **kwargs: [
+            ClassificationResult(event_type="Financial Event", relevant=True, confidence=0.9)
+            for _ in texts
+        ]
+        patcher = patch("src.scraper.filing_organizer._get_classifier", return_value=self.classifier)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Clean up the temporary data directory."""
+        self.temp_dir.cleanup()
+
+    def test_batch_writes_classification_json(self):
+        """Test that the default output writes classification.json per filing."""
+        organizer = FilingOrganizer(data_dir=self.temp_dir.name)
+        paths = organizer.save_filings_batch([_make_filing("0001"), _make_filing("0002")])
+
+        self.assertEqual(len(paths), 2)
+        for path in paths:
+            data = json.loads((path / "classification.json").read_text())
+            self.assertEqual(data["event_type"], "Financial Event")
+            self.assertTrue((path / "metadata.json").exists())
+
+    def test_batch_writes_jsonl(self):
+        """Test that JSONL output appends one line per classified filing."""
+        organizer = FilingOrganizer(data_dir=self.temp_dir.name, classification_output="jsonl")
+        paths = organizer.save_filings_batch(
+            [_make_filing("0001"), _make_filing("0002")], max_workers=2
+        )
+
+        lines = (Path(self.temp_dir.name) / "classifications.jsonl").read_text().splitlines()
+        self.assertEqual([json.loads(line)["accession_number"] for line in lines], ["0001", "0002"])
+        self.assertFalse(any((path / "classification.json").exists() for path in paths))
+
+    def test_batch_writes_manifest(self):
+        """Test that JSONL metadata goes to one manifest per CIK without filing directories."""
+        organizer = FilingOrganizer(
+            data_dir=self.temp_dir.name, classification_output="jsonl", metadata_output="jsonl"
+        )
+        paths = organizer.save_filings_batch(
+            [_make_filing("0001"), _make_filing("0002")], max_workers=2
+        )
+
+        manifest = Path(self.temp_dir.name) / "320193" / "manifest.jsonl"
+        records = [json.loads(line) for line in manifest.read_text().splitlines()]
+        self.assertEqual([r["accession_number"] for r in records], ["0001", "0002"])
+        self.assertEqual(records[0]["company_name"], "Apple Inc.")
+        self.assertEqual(len(paths), 2)
+        self.assertFalse(any(path.exists() for path in paths))
+
+        organizer.save_filing(_make_filing("0003"))
+        self.assertEqual(len(manifest.read_text().splitlines()), 3)
+
+    def test_batch_skips_mkdir_for_existing_directories(self):
+        """Test that a batch only creates filing directories missing from disk."""
+        organizer = FilingOrganizer(data_dir=self.temp_dir.name)
+        organizer.save_filings_batch([_make_filing("0001")])
+
+        with patch.object(Path, "mkdir", autospec=True, side_effect=Path.mkdir) as mkdir:
+            paths = organizer.save_filings_batch([_make_filing("0001"), _make_filing("0002")])
+
+        self.assertEqual([call.args[0] for call in mkdir.call_args_list], [paths[1]])
+        self.assertTrue((paths[0] / "metadata.json").exists())
+        self.assertTrue((paths[1] / "metadata.json").exists())
+
+    def test_skip_existing_filings(self):
+        """Test that filings saved by an earlier run are not classified again."""
+        for output in ("json", "jsonl"):
+            with self.subTest(output=output):
+                data_dir = Path(self.temp_dir.name) / output
+                kwargs = dict(data_dir=str(data_dir), classification_output=output,
+                              metadata_output=output, skip_existing=True)
+                first = FilingOrganizer(**kwargs).save_filings_batch([_make_filing("0001")])
+                self.classifier.classify_batch.reset_mock()
+
+                unsaved = FilingOrganizer(**kwargs).unsaved_filings(
+                    [_make_filing("0001"), _make_filing("0002")]
+                )
+                self.assertEqual([f.accession_number for f in unsaved], ["0002"])
+
+                paths = FilingOrganizer(**kwargs).save_filings_batch(
+                    [_make_filing("0001"), _make_filing("0002")]
+                )
+
+                self.assertEqual(paths[0], first[0])
+                texts = self.classifier.classify_batch.call_args.args[0]
+                self.assertEqual(len(texts), 1)
+                if output == "jsonl":
+                    manifest = data_dir / "320193" / "manifest.jsonl"
+                    self.assertEqual(len(manifest.read_text().splitlines()), 2)
+                    self.assertEqual(len((data_dir / "classifications.jsonl").read_text().splitlines()), 2)
+
+                self.classifier.classify.reset_mock()
+                FilingOrganizer(**kwargs).save_filing(_make_filing("0002"))
+                self.classifier.classify.assert_not_called()
+
+    def test_invalid_classification_output(self):
+        """Test that an unknown output format is rejected."""
+        with self.assertRaises(ValueError):
+            FilingOrganizer(data_dir=self.temp_dir.name, classification_output="xml")
+        with self.assertRaises(ValueError):
+            FilingOrganizer(data_dir=self.temp_dir.name, metadata_output="xml")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
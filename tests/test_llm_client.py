@@ -6,11 +6,13 @@ import os
 import unittest
 import json
 import tempfile
+from unittest.mock import Mock, patch
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from llm import LLMClient
+from llm import LLMClient, get_shared_client
+from llm.providers.ollama import OllamaProvider
 
 
 class TestLLMClient(unittest.TestCase):
@@ -168,6 +170,71 @@ class TestLLMClient(unittest.TestCase):
 
         print("✓ Falls back to default config for non-existent file")
 
+    def test_exact_cache_deterministic_calls(self):
+        """Test that identical temperature-0 prompts hit the exact-match cache."""
+        config = {**self.test_config, "options": {"temperature": 0}, "cache": {"exact": True}}
+        client = LLMClient(config=config)
+        client.provider = Mock()
+        client.provider.generate.return_value = "Event Type: Other, Relevant: false"
+
+        first = client.generate("Classify this filing")
+        second = client.generate("Classify this filing")
+
+        self.assertEqual(first, second)
+        client.provider.generate.assert_called_once()
+
+    def test_exact_cache_skips_sampled_calls(self):
+        """Test that non-zero temperature bypasses the exact-match cache."""
+        config = {**self.test_config, "options": {"temperature": 0.7}, "cache": {"exact": True}}
+        client = LLMClient(config=config)
+        client.provider = Mock()
+        client.provider.generate.return_value = "Event Type: Other, Relevant: false"
+
+        client.generate("Classify this filing")
+        client.generate("Classify this filing")
+
+        self.assertEqual(client.provider.generate.call_count, 2)
+        self.assertEqual(len(client.exact_cache), 0)
+
+    def test_model_warmup_on_construction(self):
+        """Test that the model is loaded at construction unless warmup is disabled."""
+        with patch.object(OllamaProvider, "warmup") as mock_warmup:
+            LLMClient(config=self.test_config)
+            mock_warmup.assert_called_once()
+
+        with patch.object(OllamaProvider, "warmup", side_effect=RuntimeError("offline")) as mock_warmup:
+            client = LLMClient(config=self.test_config)  # must not raise
+            self.assertIsNotNone(client.provider)
+
+        with patch.object(OllamaProvider, "warmup") as mock_warmup:
+            LLMClient(config={**self.test_config, "warmup": False})
+            mock_warmup.assert_not_called()
+
+    def test_warmup_only_when_enabled(self):
+        """Test that warmup sends prompts to the provider only when configured."""
+        client = LLMClient(config=self.test_config)
+        client.provider = Mock()
+        client.warmup(["prefix one", "prefix two"])
+        client.provider.generate.assert_not_called()
+
+        client.config = {**self.test_config, "warmup_prefixes": True}
+        client.warmup(["prefix one", "prefix two"])
+        self.assertEqual(client.provider.generate.call_count, 2)
+        client.provider.generate.assert_called_with("prefix two", num_predict=1)
+
+    def test_shared_client_reused_per_config(self):
+        """Test that get_shared_client returns one instance per config path."""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+            json.dump(self.test_config, f)
+            config_path = f.name
+
+        try:
+            first = get_shared_client(config_path)
+            self.assertIs(get_shared_client(config_path), first)
+            self.assertEqual(first.config["model"], "llama3.2:latest")
+        finally:
+            os.unlink(config_path)
+
 
 def test_manual():
     """Manual test function for interactive testing."""
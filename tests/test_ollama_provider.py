@@ -0,0 +1,178 @@
+"""Tests for the Ollama HTTP provider."""
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+import httpx
+
+from src.llm.providers.ollama import OllamaProvider
+
+
+class TestOllamaProvider(unittest.TestCase):
+    """Test cases for OllamaProvider against a mocked Ollama server."""
+
+    def setUp(self):
+        """Set up a mock transport recording every request."""
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.url.path == "/api/tags":
+                return httpx.Response(
+                    200, json={"models": [{"name": "llama3.2:latest"}, {"name": "gemma3:latest"}]}
+                )
+            if request.url.path == "/api/generate":
+                return httpx.Response(200, json={"response": "  Event Type: Other, Relevant: false\n"})
+            return httpx.Response(404)
+
+        self.transport = httpx.MockTransport(handler)
+        self.provider = OllamaProvider(
+            model="llama3.2", transport=self.transport, temperature=0, timeout=30
+        )
+
+    def _paths(self):
+        return [request.url.path for request in self.requests]
+
+    def test_generate_posts_to_api(self):
+        """Test that generate posts the prompt, options and keep_alive."""
+        response = self.provider.generate("Classify this filing")
+
+        self.assertEqual(response, "Event Type: Other, Relevant: false")
+        body = json.loads(self.requests[-1].content)
+        self.assertEqual(body["model"], "llama3.2")
+        self.assertEqual(body["prompt"], "Classify this filing")
+        self.assertFalse(body["stream"])
+        self.assertEqual(body["keep_alive"], "30m")
+        self.assertEqual(body["options"], {"temperature": 0})
+
+    def test_generate_stops_streaming_at_pattern(self):
+        """Test that a stop_pattern streams the response and stops once it matches."""
+        chunks = ["REASONING:\nA deal.\n", "CLASSIFICATION:\n", "Event Type: Acquisition, ",
+                  "Relevant: true", "\nTrailing text", ""]
+        stream = "\n".join(
+            json.dumps({"response": chunk, "done": i == len(chunks) - 1})
+            for i, chunk in enumerate(chunks)
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            if request.url.path == "/api/tags":
+                return httpx.Response(200, json={"models": [{"name": "llama3.2:latest"}]})
+            return httpx.Response(200, content=stream.encode())
+
+        provider = OllamaProvider(model="llama3.2", transport=httpx.MockTransport(handler))
+        response = provider.generate(
+            "Classify this filing", stop_pattern=r"Relevant:\s*(?:true|false)"
+        )
+
+        self.assertEqual(
+            response, "REASONING:\nA deal.\nCLASSIFICATION:\nEvent Type: Acquisition, Relevant: true"
+        )
+        body = json.loads(self.requests[-1].content)
+        self.assertTrue(body["stream"])
+        self.assertNotIn("stop_pattern", body["options"])
+
+    def test_generate_many_async(self):
+        """Test that concurrent async generation returns results in order."""
+        results = asyncio.run(self.provider.generate_many(["one", "two", "three"], max_concurrency=2))
+
+        self.assertEqual(results, ["Event Type: Other, Relevant: false"] * 3)
+        prompts = [json.loads(r.content)["prompt"] for r in self.requests if r.url.path == "/api/generate"]
+        self.assertEqual(sorted(prompts), ["one", "three", "two"])
+
+    def test_generate_many_closes_its_client(self):
+        """Test that each batch closes its own async client instead of caching one per loop."""
+        clients = []
+        original = httpx.AsyncClient.__aenter__
+
+        async def record(client):
+            clients.append(client)
+            return await original(client)
+
+        with mock.patch.object(httpx.AsyncClient, "__aenter__", record):
+            for _ in range(2):
+                results = asyncio.run(self.provider.generate_many(["one", "two"]))
+                self.assertEqual(results, ["Event Type: Other, Relevant: false"] * 2)
+
+        self.assertEqual(len(clients), 2)
+        self.assertTrue(all(client.is_closed for client in clients))
+        self.assertIsNone(self.provider._aclient)
+
+    def test_availability_cached(self):
+        """Test that the model list is fetched once within the TTL."""
+        self.provider.generate("first")
+        self.provider.generate("second")
+
+        self.assertEqual(self._paths().count("/api/tags"), 1)
+        self.assertEqual(self._paths().count("/api/generate"), 2)
+
+    def test_availability_not_rechecked_on_hot_path(self):
+        """Test that generate skips the model list once availability is confirmed."""
+        self.provider.availability_ttl = 0
+        self.provider.generate("first")
+        self.provider.generate("second")
+
+        self.assertEqual(self._paths().count("/api/tags"), 1)
+
+    def test_failed_generate_rechecks_availability(self):
+        """Test that a failed request forces a fresh availability check."""
+        self.provider.generate("first")
+        self.provider._session = httpx.Client(
+            base_url=self.provider.host,
+            transport=httpx.MockTransport(lambda request: httpx.Response(500)),
+        )
+
+        with self.assertRaises(RuntimeError):
+            self.provider.generate("second")
+        self.assertIsNone(self.provider._available)
+
+    def test_model_name_matched_exactly(self):
+        """Test that a model name prefix of an installed tag is not treated as available."""
+        self.assertTrue(OllamaProvider(model="gemma3:latest", transport=self.transport).is_available())
+        self.assertFalse(OllamaProvider(model="llama3", transport=self.transport).is_available())
+        self.assertFalse(OllamaProvider(model="gemma3:27b", transport=self.transport).is_available())
+
+    def test_pull_model_streams_progress(self):
+        """Test that pull_model reads the streamed /api/pull status lines."""
+        statuses = ["pulling manifest", "downloading", "verifying sha256 digest", "success"]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            lines = "\n".join(json.dumps({"status": status}) for status in statuses)
+            return httpx.Response(200, content=lines.encode())
+
+        provider = OllamaProvider(model="llama3.2", transport=httpx.MockTransport(handler))
+
+        self.assertTrue(provider.pull_model())
+        self.assertEqual(self.requests[-1].url.path, "/api/pull")
+        self.assertEqual(json.loads(self.requests[-1].content), {"model": "llama3.2"})
+
+    def test_pull_model_error(self):
+        """Test that pull_model reports a streamed error as failure."""
+        transport = httpx.MockTransport(
+            lambda request: httpx.Response(200, content=b'{"error": "pull model manifest: file does not exist"}')
+        )
+        provider = OllamaProvider(model="missing-model", transport=transport)
+
+        with self.assertLogs("src.llm.providers.ollama", level="ERROR"):
+            self.assertFalse(provider.pull_model())
+
+    def test_list_models(self):
+        """Test that models are read from the /api/tags JSON."""
+        self.assertEqual(self.provider.list_models(), ["llama3.2:latest", "gemma3:latest"])
+
+    def test_unavailable_model(self):
+        """Test that generate fails when the model is not installed."""
+        provider = OllamaProvider(
+            model="mistral", transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"models": []}))
+        )
+
+        self.assertFalse(provider.is_available())
+        with self.assertRaises(RuntimeError):
+            provider.generate("Classify this filing")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
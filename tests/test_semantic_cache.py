@@ -0,0 +1,163 @@
+"""Tests for the semantic LLM response cache."""
+
+import atexit
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+
+from src.llm.client import LLMClient
+from src.llm.semantic_cache import SemanticCache
+
+
+def _bag_of_words_encoder(prompts):
+    """Deterministic toy encoder: hashed bag-of-words counts."""
+    vectors = np.zeros((len(prompts), 64), dtype=np.float32)
+    for row, prompt in enumerate(prompts):
+        for word in prompt.lower().split():
+            vectors[row, sum(map(ord, word)) % 64] += 1.0
+    return vectors
+
+
+class TestSemanticCache(unittest.TestCase):
+    """Test cases for SemanticCache."""
+
+    def setUp(self):
+        """Set up a temporary cache directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Clean up the temporary cache directory."""
+        self.temp_dir.cleanup()
+
+    def _make_cache(self, **kwargs):
+        kwargs.setdefault("cache_dir", None)
+        cache = SemanticCache(model_name="test-model", encoder=_bag_of_words_encoder, **kwargs)
+        atexit.unregister(cache.save)
+        return cache
+
+    def test_exact_prompt_hits(self):
+        """Test that an identical prompt returns the cached response."""
+        cache = self._make_cache()
+        cache.put("Apple announced quarterly earnings results", "Financial Event")
+
+        self.assertEqual(cache.get("Apple announced quarterly earnings results"), "Financial Event")
+
+    def test_embeddings_stored_as_float16(self):
+        """Test that cached embeddings are kept in half precision."""
+        cache = self._make_cache()
+        cache.put("Apple announced quarterly earnings results", "Financial Event")
+
+        self.assertEqual(cache._embeddings.dtype, np.float16)
+
+    def test_dissimilar_prompt_misses(self):
+        """Test that an unrelated prompt does not hit the cache."""
+        cache = self._make_cache()
+        cache.put("Apple announced quarterly earnings results", "Financial Event")
+
+        self.assertIsNone(cache.get("Board appoints new chief executive officer"))
+
+    def test_max_size_evicts_oldest(self):
+        """Test that the oldest entries are evicted beyond max_size."""
+        cache = self._make_cache(max_size=2)
+        cache.put("first prompt alpha", "one")
+        cache.put("second prompt beta", "two")
+        cache.put("third prompt gamma", "three")
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("first prompt alpha"))
+        self.assertEqual(cache.get("third prompt gamma"), "three")
+
+    def test_full_cache_evicts_in_chunks(self):
+        """Test that a full cache drops its oldest tenth at once instead of rebuilding per insert."""
+        cache = self._make_cache(max_size=20)
+        prompts = [f"filing {i} word{i} token{i * 7}" for i in range(40)]
+        with patch.object(cache, "_rebuild_index", wraps=cache._rebuild_index) as rebuild:
+            for i, prompt in enumerate(prompts):
+                cache.put(prompt, str(i))
+
+        # One build on the first insert, then one per two-entry eviction
+        self.assertEqual(rebuild.call_count, 11)
+        self.assertEqual(len(cache), 20)
+        self.assertEqual(cache._embeddings.shape[0], 20)
+        self.assertEqual(cache.get(prompts[-1]), "39")
+        self.assertEqual(cache.get(prompts[20]), "20")
+
+    def test_persistence_across_instances(self):
+        """Test that saved entries are reloaded by a new cache instance."""
+        cache = self._make_cache(cache_dir=self.temp_dir.name)
+        cache.put("Apple announced quarterly earnings results", "Financial Event")
+        cache.save()
+
+        self.assertTrue(os.path.exists(cache.path))
+
+        reloaded = self._make_cache(cache_dir=self.temp_dir.name)
+        self.assertEqual(len(reloaded), 1)
+        self.assertEqual(
+            reloaded.get("Apple announced quarterly earnings results"), "Financial Event"
+        )
+
+    def test_get_many_matches_get(self):
+        """Test that batched lookups agree with single-prompt lookups."""
+        cache = self._make_cache()
+        cache.put("Apple announced quarterly earnings results", "Financial Event")
+        cache.put("Board appoints new chief executive officer", "Officer Change")
+
+        prompts = [
+            "Board appoints new chief executive officer",
+            "Company files for bankruptcy protection",
+            "Apple announced quarterly earnings results",
+        ]
+        self.assertEqual(cache.get_many(prompts), [cache.get(prompt) for prompt in prompts])
+        self.assertEqual(cache.get_many(prompts), ["Officer Change", None, "Financial Event"])
+
+    def test_hnsw_threshold_keeps_hits(self):
+        """Test that crossing the HNSW size threshold keeps existing entries searchable."""
+        cache = self._make_cache(hnsw_min_size=3)
+        cache.put("first prompt alpha", "one")
+        cache.put("second prompt beta", "two")
+        cache.put("third prompt gamma", "three")
+        cache.put("fourth prompt delta", "four")
+
+        self.assertEqual(cache.get("first prompt alpha"), "one")
+        self.assertEqual(cache.get("fourth prompt delta"), "four")
+
+    def test_client_generate_many_only_sends_misses(self):
+        """Test that generate_many only calls the provider for uncached prompts."""
+        client = LLMClient(config={"provider": "ollama", "model": "test-model"})
+        client.semantic_cache = self._make_cache()
+        client.semantic_cache.put("Apple acquires XYZ Corp", "Event Type: Acquisition")
+        client.provider = Mock()
+        client.provider.generate_many = AsyncMock(return_value=["Event Type: Bankruptcy"])
+
+        responses = client.generate_many(["Apple acquires XYZ Corp", "Company files for bankruptcy"])
+
+        self.assertEqual(responses, ["Event Type: Acquisition", "Event Type: Bankruptcy"])
+        client.provider.generate_many.assert_awaited_once_with(
+            ["Company files for bankruptcy"], max_concurrency=4
+        )
+
+    def test_client_skips_provider_on_hit(self):
+        """Test that LLMClient only calls the provider on a cache miss."""
+        client = LLMClient(config={"provider": "ollama", "model": "test-model"})
+        client.semantic_cache = self._make_cache()
+        client.provider = Mock()
+        client.provider.generate.return_value = "Event Type: Acquisition, Relevant: true"
+
+        first = client.generate("Apple acquires XYZ Corp for $1.2 billion")
+        second = client.generate("Apple acquires XYZ Corp for $1.2 billion")
+
+        self.assertEqual(first, second)
+        client.provider.generate.assert_called_once()
+
+    def test_client_cache_disabled_by_default(self):
+        """Test that the semantic cache is off unless configured."""
+        client = LLMClient(config={"provider": "ollama", "model": "test-model"})
+
+        self.assertIsNone(client.semantic_cache)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
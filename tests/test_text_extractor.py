@@ -1,14 +1,12 @@
 #!/usr/bin/env python3
 """Test suite for 8-K text extractor."""
 
-import sys
 import os
 import unittest
+from unittest import mock
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
-from parser.text_extractor import Filing8KTextExtractor
+from src.parser import text_extractor
+from src.parser.text_extractor import Filing8KTextExtractor
 
 
 class TestFiling8KTextExtractor(unittest.TestCase):
@@ -147,6 +145,247 @@ class TestFiling8KTextExtractor(unittest.TestCase):
         print(f"✓ Complex structure handled: {len(clean_text)} characters")
         print(f"Preview: {clean_text[:200]}...")
 
+    def test_nested_edgar_wrappers(self):
+        """Test that EDGAR wrappers nested in removed elements are handled."""
+        html_content = """
+        <html><body>
+        <div id="header"><div class="formDiv"><table><tr><td>Filing Detail</td></tr></table></div></div>
+        <div class="body"><p>Apple announced a new share repurchase program.</p>
+        <table><tr><td>Navigation</td></tr></table><span> </span></div>
+        </body></html>
+        """
+
+        clean_text = self.extractor.extract_from_html(html_content)
+
+        self.assertEqual(clean_text, "Apple announced a new share repurchase program.")
+
+    def test_lexbor_backend_matches_bs4(self):
+        """Test that the lexbor backend extracts the same text as BeautifulSoup."""
+        print("\n--- Testing lexbor backend ---")
+
+        lexbor_extractor = Filing8KTextExtractor(backend="lexbor")
+        if lexbor_extractor.backend != "lexbor":
+            self.skipTest("selectolax not installed")
+
+        fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_8k.html")
+        with open(fixture_path, "r", encoding="utf-8") as f:
+            html_content = f.read()
+
+        self.assertEqual(
+            lexbor_extractor.extract_from_html(html_content),
+            self.extractor.extract_from_html(html_content),
+        )
+
+        print("✓ lexbor and bs4 backends agree on sample filing")
+
+    def test_lxml_backend_matches_bs4(self):
+        """Test that the streaming lxml backend extracts the same text as BeautifulSoup."""
+        lxml_extractor = Filing8KTextExtractor(backend="lxml")
+
+        fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_8k.html")
+        with open(fixture_path, "rb") as f:
+            html_bytes = f.read()
+
+        expected = self.extractor.extract_from_html(html_bytes)
+        self.assertEqual(lxml_extractor.extract_from_html(html_bytes), expected)
+        self.assertEqual(lxml_extractor.extract_from_html(html_bytes.decode("utf-8")), expected)
+
+        # EDGAR tables are dropped once their text is known, wrapper divs and
+        # removed tags as soon as they open
+        html_content = """
+        <html><body>
+        <div class="formDiv"><p>Filing Detail page for this filing</p></div>
+        <table><tr><td>Document Format Files</td><td>Seq Description</td></tr></table>
+        <p>The company appointed a new Chief Financial Officer.<button>Print this page</button></p>
+        <table><tr><td>Revenue grew 10% over the prior year.</td></tr></table>
+        </body></html>
+        """
+        self.assertEqual(
+            lxml_extractor.extract_from_html(html_content),
+            self.extractor.extract_from_html(html_content),
+        )
+
+    def test_lxml_backend_script_across_feed_chunks(self):
+        """Test that a script end tag straddling a parser feed chunk is not lost."""
+        lxml_extractor = Filing8KTextExtractor(backend="lxml")
+
+        prefix = "<html><body><p>Board of directors appointed a new Chief Executive.</p><script>"
+        padding = "x" * (text_extractor._FEED_CHUNK_SIZE - len(prefix) - 3)
+        html_content = (
+            f"{prefix}{padding}</script><p>The appointment is effective January 1, 2025.</p>"
+            "</body></html>"
+        )
+
+        self.assertEqual(
+            lxml_extractor.extract_from_html(html_content),
+            self.extractor.extract_from_html(html_content),
+        )
+
+    def test_lxml_backend_decodes_non_utf8_bytes(self):
+        """Test that cp1252 and declared non-Latin charsets decode as with BeautifulSoup."""
+        lxml_extractor = Filing8KTextExtractor(backend="lxml")
+        documents = {
+            "cp1252": (
+                "<html><body><p>The company’s café revenue rose sharply.</p></body></html>"
+            ).encode("cp1252"),
+            "shift_jis": (
+                '<html><head><meta charset="shift_jis"></head>'
+                "<body><p>売上高が大幅に増加しました。</p></body></html>"
+            ).encode("shift_jis"),
+        }
+
+        for name, html_content in documents.items():
+            with self.subTest(encoding=name):
+                self.assertEqual(
+                    lxml_extractor.extract_from_html(html_content),
+                    self.extractor.extract_from_html(html_content),
+                )
+
+    def test_lxml_extract_from_stream_parses_chunks_incrementally(self):
+        """Test that the lxml backend parses streamed chunks without joining them."""
+        lxml_extractor = Filing8KTextExtractor(backend="lxml")
+        html_content = (
+            "<html><body><p>Apple announced quarterly earnings results for Q4 2024.</p>"
+            "<script>var x = 1;</script><p>Revenue increased by 10% over last quarter.</p>"
+            "</body></html>"
+        ).encode("utf-8")
+        chunks = [html_content[i : i + 16] for i in range(0, len(html_content), 16)]
+        consumed = []
+
+        def stream():
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        iter_html_events = text_extractor._iter_html_events
+        consumed_at_event = []
+
+        def recording_events(utf8_chunks):
+            for event in iter_html_events(utf8_chunks):
+                consumed_at_event.append(len(consumed))
+                yield event
+
+        with mock.patch.object(text_extractor, "_iter_html_events", recording_events):
+            text = lxml_extractor.extract_from_stream(stream())
+
+        self.assertEqual(text, self.extractor.extract_from_html(html_content))
+        self.assertEqual(consumed, chunks)
+        # Parsing started before the last chunk was read
+        self.assertLess(consumed_at_event[0], len(chunks))
+
+    def test_extract_from_stream(self):
+        """Test that streamed byte chunks extract the same text as a full string."""
+        html_content = (
+            "<html><body><p>Apple announced quarterly earnings results for Q4 2024.</p>"
+            "<p>Revenue increased by 10% compared to last quarter.</p></body></html>"
+        )
+        encoded = html_content.encode("utf-8")
+        chunks = [encoded[i : i + 16] for i in range(0, len(encoded), 16)]
+
+        self.assertEqual(
+            self.extractor.extract_from_stream(chunks),
+            self.extractor.extract_from_html(html_content),
+        )
+
+    def test_extract_many(self):
+        """Test bulk extraction matches extract_from_html, in and out of process."""
+        docs = [
+            f"<html><body><p>Filing {i}: the company announced a dividend increase.</p></body></html>"
+            for i in range(6)
+        ]
+        expected = [self.extractor.extract_from_html(doc) for doc in docs]
+
+        self.assertEqual(self.extractor.extract_many(docs, workers=1), expected)
+        self.assertEqual(self.extractor.extract_many(docs, workers=2), expected)
+        with mock.patch.object(text_extractor, "_MIN_BYTES_PER_WORKER", 1):
+            self.assertEqual(self.extractor.extract_many(docs, workers=2), expected)
+        self.assertEqual(self.extractor.extract_many([]), [])
+
+        texts = self.extractor.extract_many([docs[0], None], workers=1)
+        self.assertEqual(texts[0], expected[0])
+        self.assertIsInstance(texts[1], Exception)
+
+    def test_normalize_whitespace(self):
+        """Test whitespace normalization (numba kernel or regex fallback)."""
+        text = "Revenue\t\t grew  10%\n\n\n\nNet   income — rose\n\nItem 2.02"
+
+        self.assertEqual(
+            self.extractor._normalize_whitespace(text),
+            "Revenue grew 10%\n\nNet income — rose\n\nItem 2.02",
+        )
+
+    def test_normalize_whitespace_without_numba(self):
+        """Test the str-based fallback and the already-normalized fast path."""
+        text = "Revenue\t\t grew  10%\n\n\n\nNet   income — rose\n\nItem 2.02"
+
+        with mock.patch.object(text_extractor, "_collapse_whitespace", None):
+            self.assertEqual(
+                self.extractor._normalize_whitespace(text),
+                "Revenue grew 10%\n\nNet income — rose\n\nItem 2.02",
+            )
+            self.assertEqual(
+                self.extractor._normalize_whitespace(" a \t\t" + " " * 37 + "b "),
+                " a b ",
+            )
+
+        clean = "Revenue grew 10%\n\nNet income rose"
+        self.assertIs(self.extractor._normalize_whitespace(clean), clean)
+
+    def test_marker_matcher(self):
+        """Test the EDGAR marker predicate with and without pyahocorasick."""
+        for ahocorasick in (text_extractor.ahocorasick, None):
+            with mock.patch.object(text_extractor, "ahocorasick", ahocorasick):
+                matches = text_extractor._marker_matcher(("tableFile", "Navigation"))
+                self.assertTrue(matches("Open the Navigation menu"))
+                self.assertTrue(matches("class tableFile"))
+                self.assertFalse(matches("Revenue table"))
+                self.assertFalse(matches(""))
+
+    def test_clean_text_filters_lines(self):
+        """Test that short, junk and boilerplate lines are dropped and kept lines stripped."""
+        text = (
+            "  Apple announced record revenue.\xa0\n"
+            "Short line\n"
+            "tiny\n"
+            "----------------\n"
+            "   12345678901   \n"
+            "Securities and Exchange Commission filing\n"
+            "The board met on Form\n"
+            "8-K deadlines were discussed.\n"
+        )
+
+        self.assertEqual(
+            self.extractor._clean_text(text),
+            "Apple announced record revenue.\nShort line\n"
+            "The board met on Form\n8-K deadlines were discussed.",
+        )
+
+    def test_summarize_for_classification(self):
+        """Test that long text is reduced to its Item sections."""
+        filler = "Boilerplate forward-looking statement text. " * 200
+        text = (
+            filler
+            + "Item 2.02 Results of Operations and Financial Condition. Revenue grew 10%. "
+            + filler
+            + "Item 9.01 Financial Statements and Exhibits. "
+            + filler
+        )
+
+        summary = self.extractor.summarize_for_classification(text, max_chars=1500)
+
+        self.assertLessEqual(len(summary), 1500)
+        self.assertTrue(summary.startswith("Item 2.02 Results of Operations"))
+        self.assertIn("Item 9.01", summary)
+
+        # Short text is returned unchanged; text without Items is truncated
+        self.assertEqual(self.extractor.summarize_for_classification("Short text."), "Short text.")
+        self.assertEqual(self.extractor.summarize_for_classification(filler, max_chars=100), filler[:100])
+
+    def test_invalid_backend(self):
+        """Test that an unknown backend is rejected."""
+        with self.assertRaises(ValueError):
+            Filing8KTextExtractor(backend="unknown")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)